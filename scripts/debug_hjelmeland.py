@@ -6,8 +6,6 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
-import requests
-
 
 def _bootstrap_package() -> None:
     root = Path(__file__).resolve().parents[1]
@@ -17,7 +15,10 @@ def _bootstrap_package() -> None:
 
 
 def fetch_html(url: str) -> str:
-    response = requests.get(url, timeout=20)
+    _bootstrap_package()
+    from politikk_moter.http_session import get_session
+
+    response = get_session().get(url, timeout=20)
     response.raise_for_status()
     return response.text
 
@@ -3,75 +3,142 @@
 Debug-skript for å teste en enkelt kommune-side.
 """
 
-import requests
-from bs4 import BeautifulSoup
-import re
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import lxml.html
+from lxml import etree
+
+
+def _bootstrap_package() -> None:
+    root = Path(__file__).resolve().parents[1]
+    src_dir = root / "src"
+    if str(src_dir) not in sys.path:
+        sys.path.insert(0, str(src_dir))
+
+
+_bootstrap_package()
+from politikk_moter.http_session import DEFAULT_USER_AGENT, make_session  # noqa: E402
+
+
+SITES = [
+    ("https://www.sauda.kommune.no/innsyn/politiske-moter/", "Sauda kommune"),
+    ("https://prod01.elementscloud.no/publikum/971045698/Dmb", "Elements Cloud"),
+]
+
+MAX_WORKERS = 8
+
+# XPath med EXSLT-regex kjører tekstsøket i C i stedet for over hver NavigableString
+_XPATH_NS = {'re': 'http://exslt.org/regular-expressions'}
+DATE_TEXT_XPATH = etree.XPath(r"//text()[re:test(., '\d{1,2}\.\d{1,2}\.\d{4}')]", namespaces=_XPATH_NS)
+LOADING_TEXT_XPATH = etree.XPath("//text()[re:test(., 'loading|laster', 'i')]", namespaces=_XPATH_NS)
+HEADERS_XPATH = etree.XPath('//h1|//h2|//h3|//h4|//h5|//h6')
+SCRIPTS_XPATH = etree.XPath('//script')
+
+# Delt session slik at keep-alive-tilkoblinger gjenbrukes mellom tråder
+SESSION = make_session(pool_size=MAX_WORKERS)
+
+# Med httpx[http2] installert multiplekses forespørsler til samme vert over én
+# TLS-tilkobling. Uten httpx brukes requests-sessionen over.
+try:
+    import httpx
+    CLIENT = httpx.Client(
+        http2=True,
+        timeout=10,
+        headers={'User-Agent': DEFAULT_USER_AGENT},
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=MAX_WORKERS),
+    )
+except ImportError:
+    CLIENT = None
+
+
+def _fetch(url: str):
+    if CLIENT is not None:
+        response = CLIENT.get(url)
+    else:
+        response = SESSION.get(url, timeout=10)
+    response.raise_for_status()
+    return response
+
 
 def debug_single_site(url: str, name: str):
     """Debug en enkelt side for å se strukturen."""
+    try:
+        response = _fetch(url)
+    except Exception as e:
+        print(f"\n🔍 Debugger {name}")
+        print(f"URL: {url}")
+        print(f"Feil: {e}")
+        return
+    report_site(url, name, response)
+
+
+def report_site(url: str, name: str, response):
+    """Skriv ut strukturen til en allerede hentet side."""
     print(f"\n🔍 Debugger {name}")
     print(f"URL: {url}")
-    
+
     try:
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
-        
-        response = session.get(url, timeout=10)
-        response.raise_for_status()
-        
         print(f"Status: {response.status_code}")
         print(f"Content-Length: {len(response.content)}")
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
+
+        tree = lxml.html.fromstring(response.content)
+
         # Finn alle elementer med tekst som inneholder dato
-        date_pattern = re.compile(r'\d{1,2}\.\d{1,2}\.\d{4}')
-        elements_with_dates = soup.find_all(text=date_pattern)
-        
+        elements_with_dates = DATE_TEXT_XPATH(tree)
+
         print(f"\nElementer med datoer funnet: {len(elements_with_dates)}")
-        
+
         for i, text in enumerate(elements_with_dates[:5]):  # Vis bare første 5
             print(f"  {i+1}. {text.strip()[:100]}")
-            parent = text.parent
-            if parent:
-                print(f"     Parent: {parent.name} - {parent.get('class', 'no-class')}")
-        
+            parent = text.getparent()
+            if parent is not None:
+                print(f"     Parent: {parent.tag} - {parent.get('class', 'no-class')}")
+
         # Finn alle h-tags
-        headers = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+        headers = HEADERS_XPATH(tree)
         print(f"\nHeaders funnet: {len(headers)}")
-        
+
         for i, header in enumerate(headers[:10]):  # Vis bare første 10
-            text = header.get_text(strip=True)
+            text = ''.join(part.strip() for part in header.itertext())
             if text and len(text) > 3:
-                print(f"  {i+1}. {header.name}: {text[:80]}")
-        
+                print(f"  {i+1}. {header.tag}: {text[:80]}")
+
         # Sjekk etter JavaScript-innhold
-        scripts = soup.find_all('script')
+        scripts = SCRIPTS_XPATH(tree)
         print(f"\nScript-tags funnet: {len(scripts)}")
-        
+
         # Sjekk om siden har loading-indikatorer
-        loading_elements = soup.find_all(text=re.compile(r'[Ll]oading|[Ll]aster', re.I))
+        loading_elements = LOADING_TEXT_XPATH(tree)
         if loading_elements:
             print(f"Loading-indikatorer funnet: {len(loading_elements)}")
             for element in loading_elements[:3]:
                 print(f"  - {element.strip()}")
-        
+
     except Exception as e:
         print(f"Feil: {e}")
 
+
+def debug_sites(sites=SITES):
+    """Hent alle sider parallelt og rapporter hver side etter hvert som de blir ferdige."""
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {executor.submit(_fetch, url): (url, name) for url, name in sites}
+        for idx, future in enumerate(as_completed(futures)):
+            url, name = futures[future]
+            if idx:
+                print("\n" + "="*60)
+            try:
+                response = future.result()
+            except Exception as e:
+                print(f"\n🔍 Debugger {name}")
+                print(f"URL: {url}")
+                print(f"Feil: {e}")
+                continue
+            # Parsing skjer i hovedtråden slik at utskriften ikke blandes
+            report_site(url, name, response)
+
+
 if __name__ == '__main__':
-    # Test en enkelt side først
-    debug_single_site(
-        "https://www.sauda.kommune.no/innsyn/politiske-moter/",
-        "Sauda kommune"
-    )
-    
-    print("\n" + "="*60)
-    
-    # Test Elements Cloud
-    debug_single_site(
-        "https://prod01.elementscloud.no/publikum/971045698/Dmb",
-        "Elements Cloud"
-    )
+    debug_sites()
@@ -3,8 +3,11 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import sys
+from datetime import datetime
+from itertools import groupby, islice
 from pathlib import Path
 
 
@@ -19,30 +22,54 @@ def _bootstrap_package() -> None:
         sys.path.insert(0, str(src_dir))
 
 
+CACHE_DIR = Path(__file__).resolve().parents[1] / ".cache"
 
-def print_real_meetings():
+
+def _cached_scrape(refresh: bool = False):
+    """Returner scrape_all_meetings(), gjenbrukt fra fil innenfor samme time."""
+    from politikk_moter.scraper import scrape_all_meetings
+
+    # Ett cache-filnavn per time gir en enkel TTL på opptil 1 time
+    cache_file = CACHE_DIR / f"scrape-{datetime.now():%Y%m%d%H}.json"
+    if not refresh and cache_file.exists():
+        try:
+            meetings = json.loads(cache_file.read_text(encoding="utf-8"))
+            logger.info("♻️  Bruker cachet scraping fra %s (--refresh for ny kjøring)", cache_file.name)
+            return meetings
+        except (OSError, ValueError) as exc:
+            logger.warning("⚠️  Kunne ikke lese %s: %s", cache_file, exc)
+
+    meetings = scrape_all_meetings()
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        cache_file.write_text(json.dumps(meetings, ensure_ascii=False), encoding="utf-8")
+    except (OSError, TypeError) as exc:
+        logger.warning("⚠️  Kunne ikke skrive %s: %s", cache_file, exc)
+    return meetings
+
+
+def print_real_meetings(refresh: bool = False):
     """Vis alle møter som faktisk blir funnet fra scraping"""
     _bootstrap_package()
     from politikk_moter.models import ensure_meeting
-    from politikk_moter.scraper import scrape_all_meetings
     logger.info("🔍 Finner alle møter fra scraping...")
     
-    meetings = [ensure_meeting(m) for m in scrape_all_meetings()]
+    meetings = [ensure_meeting(m) for m in _cached_scrape(refresh)]
     
     logger.info("\n📊 Totalt funnet: %s møter", len(meetings))
     logger.info("\n🏛️ Møter fra de forskjellige kildene:")
     
-    # Grupper etter kommune
-    by_kommune = {}
-    for meeting in meetings:
-        kommune = meeting.kommune or 'Ukjent'
-        by_kommune.setdefault(kommune, []).append(meeting)
-    
-    for kommune, kommune_meetings in by_kommune.items():
+    # Grupper etter kommune; sortering gir stabil rekkefølge å diffe mot
+    def kommune_key(meeting):
+        return meeting.kommune or 'Ukjent'
+
+    meetings.sort(key=kommune_key)
+    for kommune, group in groupby(meetings, key=kommune_key):
+        kommune_meetings = list(group)
         logger.info("\n📍 %s: %s møter", kommune, len(kommune_meetings))
         
         # Vis første 5 møter fra hver kommune
-        for i, meeting in enumerate(kommune_meetings[:5]):
+        for i, meeting in enumerate(islice(kommune_meetings, 5)):
             logger.info(
                 "  %s. %s %s - %s",
                 i + 1,
@@ -55,4 +82,4 @@ def print_real_meetings():
             logger.info("  ... og %s til", len(kommune_meetings) - 5)
 
 if __name__ == "__main__":
-    print_real_meetings()
+    print_real_meetings(refresh="--refresh" in sys.argv)
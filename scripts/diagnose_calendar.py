@@ -25,9 +25,11 @@ def check_env_vars():
         _resolve_calendar_id,
     )
     logger.info("=== Checking Environment Variables ===")
+    # Les miljøet én gang; alle kildene slås opp i samme øyeblikksbilde
+    env = dict(os.environ)
     
     # Check Service Account
-    sa_json = os.getenv('GOOGLE_SERVICE_ACCOUNT_JSON')
+    sa_json = env.get('GOOGLE_SERVICE_ACCOUNT_JSON')
     if sa_json:
         logger.info("✅ GOOGLE_SERVICE_ACCOUNT_JSON is set (length: %s)", len(sa_json))
     else:
@@ -41,7 +43,7 @@ def check_env_vars():
         
         if 'env' in config:
             env_var = config['env']
-            val = os.getenv(env_var)
+            val = env.get(env_var)
             if val:
                 logger.info("  - Env var %s is set: %s", env_var, val)
             else:
@@ -3,38 +3,51 @@
 Liste unike "Utvalg" (committee names) fra Eigersund møteplan-tabellen.
 Viser også hvor mange ganger hvert utvalg har dager oppført og hvilke måneder (kort) de har møter i.
 """
-import requests
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 from collections import defaultdict
 import sys
+from pathlib import Path
+
+
+
+def _bootstrap_package() -> None:
+    root = Path(__file__).resolve().parents[1]
+    src_dir = root / "src"
+    if str(src_dir) not in sys.path:
+        sys.path.insert(0, str(src_dir))
+
+
+_bootstrap_package()
+from politikk_moter.cli_utils import is_force_rescrape  # noqa: E402
+from politikk_moter.eigersund_parser import (  # noqa: E402
+    CELLS_XPATH,
+    LINKS_XPATH,
+    ROWS_XPATH,
+    element_text,
+    fetch_moteplan_table,
+)
+from politikk_moter.http_session import get_session  # noqa: E402
+
 
 URL = "https://innsyn.onacos.no/eigersund/mote/wfinnsyn.ashx?response=moteplan&"
 MONTHS = ['Jan','Feb','Mar','Apr','Mai','Jun','Jul','Aug','Sep','Okt','Nov','Des']
+MONTH_INDEX = {m: i for i, m in enumerate(MONTHS)}
 
 
 def fetch_table(url=URL):
-    resp = requests.get(url, timeout=15)
-    resp.raise_for_status()
-    soup = BeautifulSoup(resp.content, 'html.parser')
-    table = None
-    for t in soup.find_all('table'):
-        caption = t.find('caption')
-        if caption and 'Møteplan' in caption.get_text():
-            table = t
-            break
-    if not table:
-        table = soup.find('table')
+    # Med MOTEPLAN_HTTP_CACHE satt gjenbrukes møteplanen mellom kjøringer; ellers
+    # strømmes siden og nedlastingen stopper ved møteplan-tabellen
+    table, _tree = fetch_moteplan_table(url, session=get_session(), force=is_force_rescrape())
     return table
 
 
 def parse_utvalg(table):
     utvalg_info = defaultdict(lambda: {'count':0, 'months':set(), 'link':''})
-    for tr in table.find_all('tr'):
-        cols = tr.find_all(['td','th'])
+    for tr in ROWS_XPATH(table):
+        cols = CELLS_XPATH(tr)
         if not cols:
             continue
-        raw_name = cols[0].get_text(separator=' ', strip=True)
+        raw_name = element_text(cols[0], ' ')
         if not raw_name:
             continue
         name = raw_name.strip()
@@ -43,16 +56,17 @@ def parse_utvalg(table):
         if low.startswith('utvalg') or 'vis forrige' in low or 'vis neste' in low:
             continue
         # collect link if present
-        a = cols[0].find('a')
-        link = urljoin(URL, a.get('href')) if a and a.get('href') else ''
+        a = cols[0].find('.//a')
+        href = a.get('href') if a is not None else None
+        link = urljoin(URL, href) if href else ''
         # months cells
         month_cells = cols[1:13]
         month_count = 0
         for idx, cell in enumerate(month_cells, start=1):
             # look for day links or numbers
-            days = [a.get_text(strip=True) for a in cell.find_all('a')]
+            days = [element_text(a) for a in LINKS_XPATH(cell)]
             if not days:
-                txt = cell.get_text(separator=' ', strip=True)
+                txt = element_text(cell, ' ')
                 if txt:
                     parts = [p.strip() for p in txt.split(',') if p.strip()]
                     days = parts
@@ -70,7 +84,7 @@ def print_utvalg(utvalg_info):
     items = sorted(utvalg_info.items(), key=lambda x: (-x[1]['count'], x[0]))
     print(f"Funnet {len(items)} unike utvalg:\n")
     for name, info in items:
-        months = ','.join(sorted(info['months'], key=lambda m: MONTHS.index(m))) if info['months'] else '-'
+        months = ','.join(sorted(info['months'], key=MONTH_INDEX.__getitem__)) if info['months'] else '-'
         link = info['link'] or '-'
         print(f"- {name}\n    Antall dager oppført: {info['count']}; Måneder: {months}; Link: {link}")
 
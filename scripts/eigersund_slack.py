@@ -4,14 +4,15 @@ Hent Eigersund møteplan, konverter til "meeting"-objekter, og send Slack-meldin
 Bruker samme format som `scraper.py`.
 Kjør med --debug for å ikke sende (viser melding).
 """
+import calendar
 import logging
 import os
+import re
 import sys
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
 
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
@@ -24,74 +25,78 @@ def _bootstrap_package() -> None:
     if src_dir not in sys.path:
         sys.path.insert(0, src_dir)
 
+
+_bootstrap_package()
+from politikk_moter.cli_utils import is_force_rescrape  # noqa: E402
+from politikk_moter.eigersund_parser import CELLS_XPATH, ROWS_XPATH, element_text, fetch_moteplan_table  # noqa: E402
+from politikk_moter.http_session import get_session  # noqa: E402
+
+
 URL = "https://innsyn.onacos.no/eigersund/mote/wfinnsyn.ashx?response=moteplan&"
+# Dagnumrene i en månedscelle (lenker eller kommaseparert tekst)
+_DAY_RE = re.compile(r'\b(\d{1,2})\b')
 
 
 def fetch_table(url=URL):
-    resp = requests.get(url, timeout=15)
-    resp.raise_for_status()
-    page_soup = BeautifulSoup(resp.content, 'html.parser')
-    # Finn tabellen som inneholder 'Møteplan'
-    target_table = None
-    for candidate in page_soup.find_all('table'):
-        caption = candidate.find('caption')
-        if caption and 'Møteplan' in caption.get_text():
-            target_table = candidate
-            break
-    if not target_table:
-        target_table = page_soup.find('table')
-    return target_table, page_soup
-
-
-def parse_table_to_meetings(meeting_table, base_url=URL, year=None):
+    # Med MOTEPLAN_HTTP_CACHE satt gjenbrukes møteplanen mellom kjøringer; ellers
+    # strømmes siden og nedlastingen stopper ved møteplan-tabellen
+    return fetch_moteplan_table(url, session=get_session(), force=is_force_rescrape())
+
+
+def parse_table_to_meetings(meeting_table, base_url=URL, year=None, days_ahead=None):
     current_month = None
     if year is None:
         now = datetime.now()
         year = now.year
         current_month = now.month
+    # Med days_ahead hoppes måneder og dager utenfor [i dag, i dag + days_ahead] over
+    # allerede her, i stedet for å bygge hele årets møter og filtrere etterpå
+    start = end = None
+    if days_ahead is not None:
+        today = date.today()
+        horizon = today + timedelta(days=days_ahead)
+        start = (today.year, today.month, today.day)
+        end = (horizon.year, horizon.month, horizon.day)
     parsed_meetings = []
-    for tr in meeting_table.find_all('tr'):
-        cols = tr.find_all(['td','th'])
+    for tr in ROWS_XPATH(meeting_table):
+        cols = CELLS_XPATH(tr)
         if not cols:
             continue
-        committee = cols[0].get_text(strip=True)
-        if not committee or committee.lower().startswith('utvalg') or 'vis forrige' in committee.lower():
+        committee = element_text(cols[0])
+        low = committee.lower()
+        if not committee or low.startswith('utvalg') or 'vis forrige' in low:
             continue
-        a = cols[0].find('a')
-        link = urljoin(base_url, a.get('href')) if a and a.get('href') else base_url
+        a = cols[0].find('.//a')
+        href = a.get('href') if a is not None else None
+        link = urljoin(base_url, href) if href else base_url
+        raw_text_prefix = f'Eigersund: {committee} '
         # months are next columns; some tables include exactly 12 months
         month_cells = cols[1:13]
         for idx, cell in enumerate(month_cells, start=1):
             month = idx  # 1..12
-            # collect day numbers
-            days = [a.get_text(strip=True) for a in cell.find_all('a')]
-            if not days:
-                txt = cell.get_text(separator=' ', strip=True)
-                if txt:
-                    # sometimes numbers separated by comma
-                    parts = [p.strip() for p in txt.split(',') if p.strip()]
-                    days = parts
-            for d in days:
-                # skip non-numeric
-                try:
-                    day = int(''.join([c for c in d if c.isdigit()]))
-                except ValueError:
+            target_year = year
+            if current_month is not None and month < current_month and current_month >= 11:
+                target_year += 1
+            if start is not None and not start[:2] <= (target_year, month) <= end[:2]:
+                continue
+            days_in_month = calendar.monthrange(target_year, month)[1]
+            # Ett regex-søk over celleteksten gir dagene, enten de står som lenker
+            # eller som kommaseparerte tall
+            for day_match in _DAY_RE.finditer(element_text(cell, ' ')):
+                day = int(day_match.group(1))
+                # Ugyldige dager (0, 31. april, 29. feb i ikke-skuddår) hoppes over
+                if not 1 <= day <= days_in_month:
                     continue
-                try:
-                    target_year = year
-                    if current_month is not None and month < current_month and current_month >= 11:
-                        target_year += 1
-                    dt = datetime(target_year, month, day)
-                except ValueError:
+                if start is not None and not start <= (target_year, month, day) <= end:
                     continue
                 parsed_meetings.append({
                     'title': committee,
-                    'date': dt.strftime('%Y-%m-%d'),
+                    'date': f'{target_year:04d}-{month:02d}-{day:02d}',
                     'time': None,
                     'location': 'Ikke oppgitt',
                     'kommune': 'Eigersund kommune',
                     'url': link,
-                    'raw_text': f'Eigersund: {committee} {day}.{month}.{target_year}'
+                    'raw_text': f'{raw_text_prefix}{day}.{month}.{target_year}'
                 })
     return parsed_meetings
 
@@ -108,9 +113,10 @@ def send_to_slack(message: str, webhook_env: str = 'SLACK_WEBHOOK_URL', force_se
         logger.error('Feil: %s ikke satt', webhook_env)
         return False
     payload = {'text': message}
+    from politikk_moter.scraper import post_slack_payload
+
     try:
-        resp = requests.post(webhook_url, json=payload, timeout=10)
-        resp.raise_for_status()
+        post_slack_payload(webhook_url, payload)
         logger.info('✅ Sendt til Slack')
         return True
     except requests.RequestException as exc:
@@ -122,7 +128,6 @@ send_to_slack.test_mode = False
 
 
 if __name__ == '__main__':
-    _bootstrap_package()
     from politikk_moter.cli_utils import is_debug_mode, is_force_send, is_test_mode
     from politikk_moter.scraper import (
         filter_meetings_by_date_range,
@@ -132,7 +137,7 @@ if __name__ == '__main__':
     send_to_slack.test_mode = is_test_mode()
     try:
         table, soup = fetch_table()
-        meetings = parse_table_to_meetings(table)
+        meetings = parse_table_to_meetings(table, days_ahead=9)
         # bruk filter fra scraper for neste 10 dager
         filtered = filter_meetings_by_date_range(meetings, days_ahead=9)
         slack_message = format_slack_message(filtered)
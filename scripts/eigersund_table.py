@@ -2,65 +2,64 @@
 """\nHent og vis møteplan-tabellen fra Eigersund (Onacos) med kolonner for måneder.
 Output: CSV til stdout og enkel tabellvisning.
 """
-import requests
-from bs4 import BeautifulSoup
 import csv
 import sys
+from pathlib import Path
 from urllib.parse import urljoin
 
+
+
+def _bootstrap_package() -> None:
+    root = Path(__file__).resolve().parents[1]
+    src_dir = root / "src"
+    if str(src_dir) not in sys.path:
+        sys.path.insert(0, str(src_dir))
+
+
+_bootstrap_package()
+from politikk_moter.cli_utils import is_force_rescrape  # noqa: E402
+from politikk_moter.eigersund_parser import (  # noqa: E402
+    CELLS_XPATH,
+    LINKS_XPATH,
+    ROWS_XPATH,
+    element_text,
+    fetch_moteplan_table,
+)
+from politikk_moter.http_session import get_session  # noqa: E402
+
+
 URL = "https://innsyn.onacos.no/eigersund/mote/wfinnsyn.ashx?response=moteplan&"
 MONTHS = ['Jan','Feb','Mar','Apr','Mai','Jun','Jul','Aug','Sep','Okt','Nov','Des']
 
 
 def fetch_table(url=URL):
-    resp = requests.get(url, timeout=15)
-    resp.raise_for_status()
-    soup = BeautifulSoup(resp.content, 'html.parser')
-    # Finn tabellen som sannsynligvis inneholder 'Møteplan' i en caption eller heading
-    # Fall tilbake til første table
-    table = None
-    for t in soup.find_all('table'):
-        caption = t.find('caption')
-        if caption and 'Møteplan' in caption.get_text():
-            table = t
-            break
-    if not table:
-        # fallback: første table
-        table = soup.find('table')
-    return table, soup
+    # Med MOTEPLAN_HTTP_CACHE satt gjenbrukes møteplanen mellom kjøringer; ellers
+    # strømmes siden og nedlastingen stopper ved møteplan-tabellen
+    return fetch_moteplan_table(url, session=get_session(), force=is_force_rescrape())
 
 
 def parse_table(table, base_url=URL):
     rows = []
-    # Hent header-rad hvis tilstede
-    thead = table.find('thead')
-    if thead:
-        header_cells = thead.find_all('th')
-        [th.get_text(strip=True) for th in header_cells]
-    else:
-        # prøv første tr
-        first_tr = table.find('tr')
-        if first_tr:
-            [th.get_text(strip=True) for th in first_tr.find_all(['th','td'])]
     # Nå parse rader
-    for tr in table.find_all('tr'):
-        cols = tr.find_all(['td','th'])
+    for tr in ROWS_XPATH(table):
+        cols = CELLS_XPATH(tr)
         if not cols:
             continue
         # første kolonne er utvalg/committee
         first = cols[0]
-        committee = first.get_text(strip=True)
+        committee = element_text(first)
         # link i første kolonne
-        a = first.find('a')
-        link = urljoin(base_url, a.get('href')) if a and a.get('href') else ''
+        a = first.find('.//a')
+        href = a.get('href') if a is not None else None
+        link = urljoin(base_url, href) if href else ''
         month_cells = []
         # remaining cells correspond to months - sometimes there may be an extra leading column
         for c in cols[1:13]:
             # finn alle linker (dager) i cellen
-            days = [a.get_text(strip=True) for a in c.find_all('a')]
+            days = [element_text(a) for a in LINKS_XPATH(c)]
             # også inkluderer ren tekst hvis ingen lenker
             if not days:
-                txt = c.get_text(separator=' ', strip=True)
+                txt = element_text(c, ' ')
                 days = [txt] if txt else []
             month_cells.append(', '.join(days))
         # hvis fewer cells, pad
@@ -78,16 +77,13 @@ def print_csv(rows):
 
 
 def print_table(rows):
-    # Print a compact text table
-    col_widths = [30] + [6]*12
-    # header
-    hdr = ['Committee'] + MONTHS
-    fmt = ''.join([f"{{:<{w}}}" for w in col_widths])
-    print(fmt.format(*hdr))
-    print('-'*sum(col_widths))
-    for r in rows:
-        row = [r['committee'][:30]] + [ (m[:5] if m else '') for m in r['months'] ]
-        print(fmt.format(*row))
+    # Print a compact text table: 30 tegn for utvalg, 6 per måned (maks 5 synlige)
+    lines = [f"{'Committee':<30}" + ''.join(f'{m:<6}' for m in MONTHS), '-' * (30 + 6 * 12)]
+    lines.extend(
+        f"{r['committee'][:30]:<30}" + ''.join(f'{m[:5]:<6}' for m in r['months'])
+        for r in rows
+    )
+    print('\n'.join(lines))
 
 
 if __name__ == '__main__':
@@ -3,73 +3,143 @@
 Søk etter alternative API-endepunkter og RSS-feeds.
 """
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import requests
 from bs4 import BeautifulSoup
 import re
 
+KOMMUNE_DOMAINS = [
+    "https://www.sauda.kommune.no",
+    "https://www.strand.kommune.no",
+    "https://www.suldal.kommune.no",
+    "https://www.hjelmeland.kommune.no",
+    "https://www.sokndal.kommune.no",
+    "https://www.bjerkreim.kommune.no"
+]
+
+# Vanlige RSS/API-paths
+TEST_PATHS = [
+    '/rss',
+    '/api/meetings',
+    '/api/moter',
+    '/innsyn/rss',
+    '/feed',
+    '/politikk/rss',
+    '/calendar.ics',
+    '/moter.ics'
+]
+
+MAX_WORKERS = 16
+
+RSS_LINK_TYPE_RE = re.compile(r'rss|xml', re.I)
+FEED_HREF_RE = re.compile(r'rss|feed|\.xml|\.ics', re.I)
+
+
+def _bootstrap_package():
+    root = Path(__file__).resolve().parents[1]
+    src_dir = root / "src"
+    if str(src_dir) not in sys.path:
+        sys.path.insert(0, str(src_dir))
+
+
+def _make_session():
+    # Delt session med en pool per vert slik at keep-alive-tilkoblinger gjenbrukes.
+    # Ingen retry: en død path skal bare rapporteres som bom.
+    _bootstrap_package()
+    from politikk_moter.http_session import make_session
+
+    return make_session(pool_size=MAX_WORKERS, retries=0)
+
+
+def _is_feed_tag(tag):
+    """<link type=rss/xml> eller <a href> som ser ut som en feed."""
+    if tag.name == 'link':
+        return bool(RSS_LINK_TYPE_RE.search(tag.get('type') or ''))
+    if tag.name == 'a':
+        return bool(FEED_HREF_RE.search(tag.get('href') or ''))
+    return False
+
+
+def _describe_hit(url, content_type, size):
+    if 'xml' in content_type or 'rss' in content_type or 'ical' in content_type:
+        return f"  ✅ Funnet: {url} ({content_type})"
+    if size > 100:  # Ikke bare en feilside
+        return f"  🔍 Mulig: {url} ({size} bytes)"
+    return None
+
+
+def probe_path(session, url):
+    """Returner en linje for treff på en RSS/API-path, ellers None."""
+    # HEAD først: de fleste paths gir 404, og da trengs ingen body
+    try:
+        head = session.head(url, allow_redirects=True, timeout=5)
+    except requests.RequestException:
+        head = None
+    if head is not None and head.status_code not in (405, 501):
+        if head.status_code != 200:
+            return None
+        content_type = head.headers.get('content-type', '').lower()
+        length = head.headers.get('content-length', '')
+        if length.isdigit() or 'xml' in content_type or 'rss' in content_type or 'ical' in content_type:
+            return _describe_hit(url, content_type, int(length) if length.isdigit() else 0)
+
+    # Serveren støtter ikke HEAD eller oppgir ikke lengde; hent hele svaret
+    try:
+        response = session.get(url, timeout=5)
+    except requests.RequestException:
+        return None
+    if response.status_code != 200:
+        return None
+    content_type = response.headers.get('content-type', '').lower()
+    return _describe_hit(url, content_type, len(response.content))
+
+
+def scan_homepage(session, domain):
+    """Sjekk hovedsiden for RSS-lenker."""
+    lines = []
+    try:
+        response = session.get(domain, timeout=10)
+    except requests.RequestException:
+        return lines
+    if response.status_code == 200:
+        soup = BeautifulSoup(response.content, 'html.parser')
+
+        # Søk etter RSS-lenker i ett gjennomløp av treet
+        for link in soup.find_all(_is_feed_tag):
+            href = link.get('href') or link.get('src', '')
+            if href:
+                if not href.startswith('http'):
+                    href = domain + href
+                lines.append(f"  📡 RSS/Feed funnet: {href}")
+    return lines
+
+
 def find_alternative_endpoints():
     """Søk etter RSS/API-endepunkter fra kommune-hovedsider."""
-    
-    kommune_domains = [
-        "https://www.sauda.kommune.no",
-        "https://www.strand.kommune.no", 
-        "https://www.suldal.kommune.no",
-        "https://www.hjelmeland.kommune.no",
-        "https://www.sokndal.kommune.no",
-        "https://www.bjerkreim.kommune.no"
-    ]
-    
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-    })
-    
-    for domain in kommune_domains:
-        print(f"\n🔍 Sjekker {domain}")
-        
-        # Test vanlige RSS/API-paths
-        test_paths = [
-            '/rss',
-            '/api/meetings',
-            '/api/moter',
-            '/innsyn/rss',
-            '/feed',
-            '/politikk/rss',
-            '/calendar.ics',
-            '/moter.ics'
-        ]
-        
-        for path in test_paths:
-            try:
-                url = domain + path
-                response = session.get(url, timeout=5)
-                if response.status_code == 200:
-                    content_type = response.headers.get('content-type', '').lower()
-                    if 'xml' in content_type or 'rss' in content_type or 'ical' in content_type:
-                        print(f"  ✅ Funnet: {url} ({content_type})")
-                    elif len(response.content) > 100:  # Ikke bare en feilside
-                        print(f"  🔍 Mulig: {url} ({len(response.content)} bytes)")
-            except requests.RequestException:
-                pass
-        
-        # Sjekk hovedsiden for RSS-lenker
-        try:
-            response = session.get(domain, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Søk etter RSS-lenker
-                rss_links = soup.find_all('link', {'type': re.compile(r'rss|xml', re.I)})
-                rss_links += soup.find_all('a', href=re.compile(r'rss|feed|\.xml|\.ics', re.I))
-                
-                for link in rss_links:
-                    href = link.get('href') or link.get('src', '')
-                    if href:
-                        if not href.startswith('http'):
-                            href = domain + href
-                        print(f"  📡 RSS/Feed funnet: {href}")
-        except requests.RequestException:
-            pass
+    session = _make_session()
+
+    # Alle forespørsler er nettverksbundne; kjør dem samtidig og skriv ut
+    # resultatene per domene i fast rekkefølge.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        path_futures = {
+            domain: [executor.submit(probe_path, session, domain + path) for path in TEST_PATHS]
+            for domain in KOMMUNE_DOMAINS
+        }
+        homepage_futures = {
+            domain: executor.submit(scan_homepage, session, domain) for domain in KOMMUNE_DOMAINS
+        }
+
+        for domain in KOMMUNE_DOMAINS:
+            print(f"\n🔍 Sjekker {domain}")
+            for future in path_futures[domain]:
+                line = future.result()
+                if line:
+                    print(line)
+            for line in homepage_futures[domain].result():
+                print(line)
 
 if __name__ == '__main__':
     find_alternative_endpoints()
@@ -5,12 +5,20 @@ from __future__ import annotations
 
 import json
 import re
+import sys
+from pathlib import Path
 from typing import Iterable
 
-import requests
 from bs4 import BeautifulSoup
 
 
+def _bootstrap_package() -> None:
+    root = Path(__file__).resolve().parents[1]
+    src_dir = root / "src"
+    if str(src_dir) not in sys.path:
+        sys.path.insert(0, str(src_dir))
+
+
 DEFAULT_ENDPOINTS = (
     "https://www.sauda.kommune.no/api/meetings",
     "https://www.sauda.kommune.no/api/moter",
@@ -23,15 +31,15 @@ def inspect_endpoint(url: str) -> None:
     """Fetch and print a small diagnostic summary for a single endpoint."""
     print(f"\n🔍 Testing {url}")
 
-    session = requests.Session()
-    session.headers.update(
-        {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-            "Accept": "application/json, text/html, */*",
-        }
-    )
+    _bootstrap_package()
+    from politikk_moter.http_session import get_session
 
-    response = session.get(url, timeout=10)
+    # Samme session for alle endepunktene gjenbruker tilkoblingen per vert
+    response = get_session().get(
+        url,
+        timeout=10,
+        headers={"Accept": "application/json, text/html, */*"},
+    )
     print(f"Status: {response.status_code}")
     print(f"Content-Type: {response.headers.get('content-type', 'N/A')}")
     print(f"Content-Length: {len(response.content)}")
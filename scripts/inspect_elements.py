@@ -3,18 +3,27 @@
 Detaljert debug av Elements Cloud-siden.
 """
 
-import requests
 from bs4 import BeautifulSoup
+import sys
+from pathlib import Path
+
+
+def _bootstrap_package() -> None:
+    root = Path(__file__).resolve().parents[1]
+    src_dir = root / "src"
+    if str(src_dir) not in sys.path:
+        sys.path.insert(0, str(src_dir))
+
 
 def inspect_elements_cloud():
     """Detaljert inspeksjon av Elements Cloud-siden."""
     url = "https://prod01.elementscloud.no/publikum/971045698/Dmb"
     
     try:
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
+        _bootstrap_package()
+        from politikk_moter.http_session import get_session
+
+        session = get_session()
         
         response = session.get(url, timeout=10)
         response.raise_for_status()
@@ -27,7 +36,7 @@ def inspect_elements_cloud():
         print(response.text)
         print("=== END RAW HTML ===\n")
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
         
         # Finn alle script-tags og deres innhold
         scripts = soup.find_all('script')
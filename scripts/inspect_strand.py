@@ -3,54 +3,107 @@
 Se på raw HTML fra Strand kommune for å forstå strukturen.
 """
 
-import requests
-from bs4 import BeautifulSoup
+from itertools import chain
+from lxml import etree
 import re
+import sys
+from pathlib import Path
+
+from bs4.dammit import UnicodeDammit
+
+
+def _bootstrap_package() -> None:
+    root = Path(__file__).resolve().parents[1]
+    src_dir = root / "src"
+    if str(src_dir) not in sys.path:
+        sys.path.insert(0, str(src_dir))
+
+
+MEETING_CLS_RE = re.compile(r'.*m[øo]te.*|.*meeting.*', re.I)
+AJAX_MARKERS = ('ajax', 'fetch', 'xhr')
+
+PREVIEW_CHARS = 2000
+CHUNK_SIZE = 4096
+
+
+def _attr_matches(value):
+    return bool(value) and MEETING_CLS_RE.match(value) is not None
+
 
 def inspect_strand_html():
     """Inspiser raw HTML fra Strand kommune."""
     url = "https://www.strand.kommune.no/tjenester/politikk-innsyn-og-medvirkning/politiske-moter-og-sakspapirer/politisk-motekalender/"
     
     try:
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
+        _bootstrap_package()
+        from politikk_moter.http_session import get_session, header_charset
+
+        session = get_session()
         
-        response = session.get(url, timeout=15)
+        # Strøm svaret slik at siden parses bit for bit i stedet for å lese hele kroppen først
+        response = session.get(url, timeout=15, stream=True)
         response.raise_for_status()
         
-        # Les de første 2000 tegnene av HTML for å se strukturen
-        html_preview = response.text[:2000]
+        chunks = response.iter_content(CHUNK_SIZE)
+        first_chunk = next(chunks, b'')
+        # Bruk charset fra headeren bare når serveren faktisk oppgir det; ellers
+        # gjettes det fra første bit (meta charset/innhold) slik BeautifulSoup gjør.
+        # response.encoding er ISO-8859-1 for text/html uten charset.
+        encoding = header_charset(response)
+        if not encoding:
+            encoding = UnicodeDammit(first_chunk, is_html=True).original_encoding
+            if encoding in (None, 'ascii'):
+                encoding = 'utf-8'  # ren ASCII i første bit sier ingenting om resten
+        try:
+            parser = etree.HTMLPullParser(events=('end',), encoding=encoding)
+        except LookupError:
+            encoding = 'utf-8'
+            parser = etree.HTMLPullParser(events=('end',), encoding=encoding)
+        preview = bytearray()
+        forms = []
+        ajax_scripts = 0
+        meeting_elements = []
+        
+        try:
+            for chunk in chain((first_chunk,), chunks):
+                if len(preview) < PREVIEW_CHARS * 4:
+                    preview.extend(chunk)
+                parser.feed(chunk)
+                for _event, element in parser.read_events():
+                    tag = element.tag
+                    if tag == 'form':
+                        forms.append((element.get('action', 'N/A'), element.get('method', 'N/A')))
+                    elif tag == 'script':
+                        script_text = (element.text or '').lower()
+                        if any(marker in script_text for marker in AJAX_MARKERS):
+                            ajax_scripts += 1
+                    if _attr_matches(element.get('class')) or _attr_matches(element.get('id')):
+                        meeting_elements.append((tag, element.get('class'), element.get('id')))
+                    # Behandlede elementer trengs ikke mer; frigjør dem fortløpende
+                    element.clear(keep_tail=True)
+            parser.close()
+        finally:
+            response.close()
+        
+        # De første 2000 tegnene av HTML for å se strukturen
+        html_preview = preview.decode(encoding, errors='replace')[:PREVIEW_CHARS]
         print("=== HTML PREVIEW (første 2000 tegn) ===")
         print(html_preview)
         print("=== END PREVIEW ===\n")
         
-        # Søk etter forms som kan indikere AJAX-loading
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        forms = soup.find_all('form')
+        # Forms kan indikere AJAX-loading
         print(f"Forms funnet: {len(forms)}")
-        for form in forms:
-            print(f"  Action: {form.get('action', 'N/A')}")
-            print(f"  Method: {form.get('method', 'N/A')}")
-        
-        # Søk etter script-tags som kan indikere AJAX
-        scripts = soup.find_all('script')
-        ajax_scripts = []
-        for script in scripts:
-            if script.string and ('ajax' in script.string.lower() or 'fetch' in script.string.lower() or 'xhr' in script.string.lower()):
-                ajax_scripts.append(script)
-        
-        print(f"\nPotensielle AJAX-scripts: {len(ajax_scripts)}")
+        for action, method in forms:
+            print(f"  Action: {action}")
+            print(f"  Method: {method}")
         
-        # Sjekk etter møte-relaterte CSS-klasser eller IDs
-        meeting_elements = soup.find_all(attrs={'class': re.compile(r'.*m[øo]te.*|.*meeting.*', re.I)})
-        meeting_elements += soup.find_all(attrs={'id': re.compile(r'.*m[øo]te.*|.*meeting.*', re.I)})
+        print(f"\nPotensielle AJAX-scripts: {ajax_scripts}")
         
+        # Møte-relaterte CSS-klasser eller IDs
         print(f"Møte-relaterte elementer: {len(meeting_elements)}")
-        for element in meeting_elements[:5]:
-            print(f"  {element.name}: class={element.get('class')}, id={element.get('id')}")
+        for tag, css_class, element_id in meeting_elements[:5]:
+            classes = css_class.split() if css_class else None
+            print(f"  {tag}: class={classes}, id={element_id}")
             
     except Exception as e:
         print(f"Feil: {e}")
@@ -53,9 +53,11 @@ def send_to_slack_with_webhook(
         'icon_emoji': ':classical_building:'
     }
 
+    _bootstrap_package()
+    from politikk_moter.scraper import post_slack_payload
+
     try:
-        resp = requests.post(webhook_url, json=payload, timeout=10)
-        resp.raise_for_status()
+        post_slack_payload(webhook_url, payload)
         logger.info("✅ Melding sendt til sekundær Slack-kanal")
         return True
     except requests.exceptions.RequestException as e:
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import logging
 import sys
+from collections import defaultdict
 from pathlib import Path
 
 
@@ -24,29 +25,31 @@ def show_real_meeting_details() -> None:
     _bootstrap_package()
     from politikk_moter.models import ensure_meeting
     from politikk_moter.scraper import scrape_all_meetings
-    meetings = [ensure_meeting(m) for m in scrape_all_meetings()]
+
+    # Normaliser og grupper i samme gjennomløp (ensure_meeting er en no-op for Meeting)
+    by_kommune = defaultdict(list)
+    for raw in scrape_all_meetings():
+        meeting = ensure_meeting(raw)
+        by_kommune[meeting.kommune or "Ukjent"].append(meeting)
 
     logger.info("🔍 REELLE MØTER FUNNET:")
     logger.info("%s", "=" * 50)
 
-    by_kommune = {}
-    for meeting in meetings:
-        kommune = meeting.kommune or "Ukjent"
-        by_kommune.setdefault(kommune, []).append(meeting)
-
     for kommune, kommune_meetings in by_kommune.items():
-        logger.info("\n📍 %s: %s møter", kommune, len(kommune_meetings))
-        logger.info("%s", "-" * 40)
+        # Bygg hele kommuneblokken og logg den med ett kall i stedet for ett per linje
+        lines = [f"\n📍 {kommune}: {len(kommune_meetings)} møter", "-" * 40]
 
         for i, meeting in enumerate(kommune_meetings[:10]):
-            logger.info("%s. Dato: %s", i + 1, meeting.date or "TBD")
-            logger.info("   Tid: %s", meeting.time or "TBD")
-            logger.info("   Tittel: %s", meeting.title or "Ingen tittel")
-            logger.info("   Sted: %s", meeting.location or "Ikke oppgitt")
-            logger.info("")
+            lines.append(f"{i + 1}. Dato: {meeting.date or 'TBD'}")
+            lines.append(f"   Tid: {meeting.time or 'TBD'}")
+            lines.append(f"   Tittel: {meeting.title or 'Ingen tittel'}")
+            lines.append(f"   Sted: {meeting.location or 'Ikke oppgitt'}")
+            lines.append("")
 
         if len(kommune_meetings) > 10:
-            logger.info("   ... og %s møter til", len(kommune_meetings) - 10)
+            lines.append(f"   ... og {len(kommune_meetings) - 10} møter til")
+
+        logger.info("%s", "\n".join(lines))
 
 
 if __name__ == "__main__":
@@ -74,14 +74,10 @@ def print_meetings(meetings):
 
 def main():
     _bootstrap_package()
-    from politikk_moter.scraper import KOMMUNE_URLS, MoteParser, PLAYWRIGHT_AVAILABLE
+    from politikk_moter.scraper import KOMMUNE_BY_NAME, MoteParser, PLAYWRIGHT_AVAILABLE
 
     # Finn Eigersund-konfig
-    eigersund_cfg = None
-    for c in KOMMUNE_URLS:
-        if 'eigersund' in c.get('name', '').lower() or 'eigersund' in c.get('url', '').lower():
-            eigersund_cfg = c
-            break
+    eigersund_cfg = KOMMUNE_BY_NAME.get('eigersund kommune')
 
     if not eigersund_cfg:
         logger.error('❌ Fant ikke Eigersund-konfigurasjon i KOMMUNE_URLS')
@@ -8,7 +8,6 @@ import json
 import logging
 import os
 import sys
-from datetime import datetime
 
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
@@ -53,14 +52,9 @@ def run_fallback_parse(cfg, parser_cls):
 
 
 def filter_month(meetings, year, month):
-    out = []
-    for m in meetings:
-        try:
-            dt = datetime.strptime(m['date'], '%Y-%m-%d')
-            if dt.year == year and dt.month == month:
-                out.append(m)
-        except Exception:
-            continue
+    # Datoene er ISO (YYYY-MM-DD); en prefikssammenligning erstatter strptime per møte
+    prefix = f'{year:04d}-{month:02d}-'
+    out = [m for m in meetings if isinstance(m.get('date'), str) and m['date'].startswith(prefix)]
     # sort
     out.sort(key=lambda x: (x['date'], x.get('time') or ''))
     return out
@@ -85,14 +79,10 @@ def print_meetings(meetings, year, month):
 
 def main():
     _bootstrap_package()
-    from politikk_moter.scraper import KOMMUNE_URLS, MoteParser, PLAYWRIGHT_AVAILABLE
+    from politikk_moter.scraper import KOMMUNE_BY_NAME, MoteParser, PLAYWRIGHT_AVAILABLE
 
     # Finn Eigersund-konfig
-    eigersund_cfg = None
-    for c in KOMMUNE_URLS:
-        if 'eigersund' in c.get('name', '').lower() or 'eigersund' in c.get('url', '').lower():
-            eigersund_cfg = c
-            break
+    eigersund_cfg = KOMMUNE_BY_NAME.get('eigersund kommune')
 
     if not eigersund_cfg:
         logger.error('❌ Fant ikke Eigersund-konfigurasjon i KOMMUNE_URLS')
@@ -3,23 +3,63 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import logging
 import os
+import random
 import re
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Sequence
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+try:  # orjson parser credentials-JSON raskere ved kaldstart, men er valgfri
+    import orjson as _credentials_json
+except ImportError:  # pragma: no cover - faller tilbake til standardbiblioteket
+    _credentials_json = json  # type: ignore[assignment]
+
 try:  # Local imports when running as module
     from .kommuner import KOMMUNE_CONFIGS
+    from .models import Meeting, MeetingLike, ensure_meeting
 except ImportError:  # pragma: no cover - fallback for direct script execution
     from kommuner import KOMMUNE_CONFIGS  # type: ignore
+    from models import Meeting, MeetingLike, ensure_meeting  # type: ignore
+
+logger = logging.getLogger(__name__)
 
 # Kalender-ID for politiske møter (tidligere standard)
 CALENDAR_ID = "c_635df6a653ea35ad30afe385c7271817d5e0b664b38d65aa08642226f7b5e355@group.calendar.google.com"
 
+EVENT_TIMEZONE = "Europe/Oslo"
+
+# Google Calendar godtar maks 50 del-forespørsler per batch-request.
+BATCH_MAX_REQUESTS = 50
+
+# Valgfri sti til JSON-fil med syncToken + kjente events. Når satt, brukes
+# inkrementell synk slik at kun endrede events hentes fra API-et.
+SYNC_STATE_ENV = "GOOGLE_CALENDAR_SYNC_STATE"
+
+# Valgfri sti til SQLite-fil med møter som allerede er lagt inn. Treff her
+# hoppes over uten list- eller insert-kall. Oppføringer eldre enn
+# EVENT_CACHE_MAX_AGE_DAYS slettes ved oppstart.
+EVENT_CACHE_ENV = "GOOGLE_CALENDAR_EVENT_CACHE"
+EVENT_CACHE_MAX_AGE_DAYS = 90
+
+# Midlertidige feil (kvote/ratebegrensning og serverfeil) prøves på nytt med
+# eksponentiell backoff i stedet for å avbryte hele kjøringen.
+RETRYABLE_STATUSES = frozenset({403, 429, 500, 503})
+RATE_LIMIT_REASONS = frozenset({"rateLimitExceeded", "userRateLimitExceeded"})
+MAX_BACKOFF_SECONDS = 64
+
+# "Kommune: X" i event-beskrivelsen; kompilert én gang i stedet for per event
+_KOMMUNE_RE = re.compile(r'Kommune:\s*([^,\n\r]+)', re.IGNORECASE)
+
 # Registrer tilgjengelige kalendrer. Flere kan legges til ved å oppdatere dette oppslaget.
 CALENDAR_SOURCES: Dict[str, Dict[str, Optional[str]]] = {
     "arrangementer_sa": {
@@ -87,15 +127,167 @@ def _canonicalize_kommune_name(candidate: Optional[str], *extra_texts: str) -> s
         return candidate
     return "Manuelt lagt til"
 
+
+def _event_key(event: Dict) -> Optional[Tuple[str, str]]:
+    """Returner (dato, summary) for et kalender-event, brukt til duplikatsjekk."""
+    start = event.get('start') or {}
+    event_date = start.get('date') or (start.get('dateTime') or '')[:10]
+    summary = event.get('summary')
+    if not event_date or not summary:
+        return None
+    return event_date, summary
+
+
+def _load_sync_state(path: str) -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(path, encoding="utf-8") as handle:
+            state = json.load(handle)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        print(f"⚠️  Kunne ikke lese kalender-synkstatus fra {path}: {exc}")
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _save_sync_state(path: str, state: Dict[str, Dict[str, Any]]) -> None:
+    try:
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(state, handle, ensure_ascii=False)
+    except OSError as exc:
+        print(f"⚠️  Kunne ikke lagre kalender-synkstatus til {path}: {exc}")
+
+
+def _meeting_summary(meeting: Meeting) -> str:
+    return f"{meeting.title} ({meeting.kommune})"
+
+
+def _event_cache_key(meeting: Meeting) -> str:
+    raw = f"{meeting.date}|{_meeting_summary(meeting)}".encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+class _EventCache:
+    """Persistent oversikt over events som allerede er opprettet."""
+
+    def __init__(self, path: str, max_age_days: int = EVENT_CACHE_MAX_AGE_DAYS):
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS events(key TEXT PRIMARY KEY, event_id TEXT, created REAL)'
+        )
+        self._conn.execute(
+            'DELETE FROM events WHERE created < ?',
+            (time.time() - max_age_days * 86400,),
+        )
+        self._conn.commit()
+
+    def __contains__(self, key: str) -> bool:
+        row = self._conn.execute('SELECT 1 FROM events WHERE key = ?', (key,)).fetchone()
+        return row is not None
+
+    def add(self, key: str, event_id: str) -> None:
+        self._conn.execute(
+            'INSERT OR REPLACE INTO events(key, event_id, created) VALUES (?, ?, ?)',
+            (key, event_id, time.time()),
+        )
+
+    def close(self) -> None:
+        self._conn.commit()
+        self._conn.close()
+
+
+def _open_event_cache() -> Optional[_EventCache]:
+    path = os.getenv(EVENT_CACHE_ENV, "").strip()
+    if not path:
+        return None
+    try:
+        return _EventCache(path)
+    except sqlite3.Error as exc:
+        print(f"⚠️  Kunne ikke åpne kalender-cache {path}: {exc}")
+        return None
+
+
+def _is_retryable(exc: HttpError) -> bool:
+    status = getattr(exc.resp, "status", None)
+    if status not in RETRYABLE_STATUSES:
+        return False
+    if status != 403:
+        return True
+    # 403 brukes også for manglende tilgang; prøv bare på nytt ved ratebegrensning.
+    details = exc.error_details if isinstance(exc.error_details, list) else []
+    return any(
+        isinstance(detail, dict) and detail.get("reason") in RATE_LIMIT_REASONS
+        for detail in details
+    )
+
+
+def _backoff_delay(attempt: int, exc: HttpError) -> float:
+    """Eksponentiell ventetid med jitter; Retry-After fra svaret respekteres."""
+    delay = min(2 ** attempt + random.random(), MAX_BACKOFF_SECONDS)
+    retry_after = exc.resp.get("retry-after") if hasattr(exc.resp, "get") else None
+    if retry_after and str(retry_after).isdigit():
+        delay = min(max(delay, float(retry_after)), MAX_BACKOFF_SECONDS)
+    return delay
+
+
+def _execute_with_backoff(request: Any, max_tries: int = 6) -> Any:
+    """Kjør request.execute() med eksponentiell backoff + jitter ved midlertidige feil."""
+    for attempt in range(max_tries):
+        try:
+            return request.execute()
+        except HttpError as exc:
+            if attempt + 1 >= max_tries or not _is_retryable(exc):
+                raise
+            delay = _backoff_delay(attempt, exc)
+            print(
+                f"⏳ Google Calendar svarte {exc.resp.status}, prøver igjen om {delay:.1f}s "
+                f"(forsøk {attempt + 2}/{max_tries})"
+            )
+            time.sleep(delay)
+    return None
+
+
+def _create_service(credentials_json: str) -> Any:
+    """Bygg et nytt Calendar-service-objekt for gitte credentials."""
+    credentials_info = _credentials_json.loads(credentials_json)
+    credentials = service_account.Credentials.from_service_account_info(
+        credentials_info,
+        scopes=['https://www.googleapis.com/auth/calendar']
+    )
+    # Bruk discovery-dokumentet som følger med biblioteket i stedet for å hente det over nett
+    return build(
+        'calendar',
+        'v3',
+        credentials=credentials,
+        static_discovery=True,
+        cache_discovery=False,
+    )
+
+
+@lru_cache(maxsize=1)
+def _build_service(credentials_json: str) -> Any:
+    """Bygg Calendar-service én gang per sett med credentials."""
+    return _create_service(credentials_json)
+
+
 class GoogleCalendarIntegration:
     """Håndterer Google Calendar API-integrasjon."""
     
     def __init__(self, calendar_id: str):
         self.service: Any = None
         self.calendar_id = calendar_id or CALENDAR_ID
+        # (dato, summary) for events i kalenderen; fylles av _load_existing_events
+        self._existing: Optional[Set[Tuple[str, str]]] = None
         
-    def authenticate(self) -> bool:
-        """Autentiser med Google Calendar API via service account."""
+    def authenticate(self, *, shared: bool = True) -> bool:
+        """Autentiser med Google Calendar API via service account.
+
+        ``shared=False`` gir instansen et eget service-objekt; httplib2 under
+        API-klienten er ikke trådsikker, så parallelle hentinger kan ikke dele ett.
+        """
+        if self.service is not None:
+            # Allerede autentisert (f.eks. av et tidligere get_calendar_meetings-kall)
+            return True
         try:
             # Hent service account credentials fra miljøvariabel
             credentials_json = os.getenv('GOOGLE_SERVICE_ACCOUNT_JSON')
@@ -103,22 +295,13 @@ class GoogleCalendarIntegration:
                 print("❌ GOOGLE_SERVICE_ACCOUNT_JSON environment variable ikke satt")
                 return False
             
-            # Parse JSON credentials
-            credentials_info = json.loads(credentials_json)
-            
-            # Opprett credentials objekt
-            credentials = service_account.Credentials.from_service_account_info(
-                credentials_info,
-                scopes=['https://www.googleapis.com/auth/calendar']
-            )
-            
-            # Bygg Calendar service
-            self.service = build('calendar', 'v3', credentials=credentials)
+            # Gjenbruk service-objektet på tvers av instanser og kall
+            self.service = _build_service(credentials_json) if shared else _create_service(credentials_json)
             
             print("✅ Google Calendar API autentisering vellykket")
             return True
             
-        except json.JSONDecodeError as exc:
+        except ValueError as exc:  # json.JSONDecodeError og orjson.JSONDecodeError
             print(f"❌ Ugyldig JSON i GOOGLE_SERVICE_ACCOUNT_JSON: {exc}")
             return False
         except Exception as exc:  # pylint: disable=broad-except
@@ -141,14 +324,14 @@ class GoogleCalendarIntegration:
             time_max = end_date.isoformat() + 'Z'
             
             # Hent events fra kalenderen
-            events_result = self.service.events().list(  # pylint: disable=no-member
+            events_result = _execute_with_backoff(self.service.events().list(  # pylint: disable=no-member
                 calendarId=self.calendar_id,
                 timeMin=time_min,
                 timeMax=time_max,
                 singleEvents=True,
                 orderBy='startTime',
                 maxResults=250
-            ).execute()
+            ))
             
             events = events_result.get('items', [])
             
@@ -192,7 +375,7 @@ class GoogleCalendarIntegration:
             kommune = "Manuelt lagt til"
 
             # Prøv å parse kommune fra beskrivelse eller tittel
-            kommune_match = re.search(r'Kommune:\s*([^,\n\r]+)', description, re.IGNORECASE)
+            kommune_match = _KOMMUNE_RE.search(description)
             if kommune_match:
                 kommune = kommune_match.group(1).strip()
             elif 'kommune' in title.lower():
@@ -223,127 +406,278 @@ class GoogleCalendarIntegration:
             print(f"⚠️  Kunne ikke konvertere kalenderevent: {exc}")
             return None
     
-    def _build_event_data(self, meeting: Dict) -> Dict:
+    def _build_event_data(self, meeting: MeetingLike) -> Dict:
         """Bygg event-data for Google Calendar."""
-        # Parse meeting date
-        meeting_date = datetime.strptime(meeting['date'], '%Y-%m-%d')
-        
-        # Håndter tid
-        if meeting.get('time'):
-            # Parse tid (format: HH:MM)
-            time_parts = meeting['time'].split(':')
-            hour = int(time_parts[0])
-            minute = int(time_parts[1])
-            
-            start_time = meeting_date.replace(hour=hour, minute=minute)
-            # Anta 2 timer varighet hvis ikke spesifisert
-            end_time = start_time + timedelta(hours=2)
+        meeting = ensure_meeting(meeting)
+        meeting_date = date.fromisoformat(meeting.date)
+        meeting_time = meeting.time
+        location = meeting.location
+        has_location = bool(location) and location != "Ikke oppgitt"
+        url = meeting.url
+
+        if meeting_time:
+            # Parse tid (format: HH:MM); anta 2 timer varighet
+            hour, minute = (int(part) for part in meeting_time.split(':')[:2])
+            start_time = datetime(meeting_date.year, meeting_date.month, meeting_date.day, hour, minute)
+            start = {'dateTime': start_time.isoformat(), 'timeZone': EVENT_TIMEZONE}
+            end = {'dateTime': (start_time + timedelta(hours=2)).isoformat(), 'timeZone': EVENT_TIMEZONE}
         else:
             # Hele dagen event hvis ingen tid oppgitt
-            start_time = meeting_date
-            end_time = meeting_date + timedelta(days=1)
-        
-        # Bygg beskrivelse
-        description = f"Møte: {meeting['title']}\n"
-        description += f"Kommune: {meeting['kommune']}\n"
-        if meeting.get('location') and meeting['location'] != "Ikke oppgitt":
-            description += f"Sted: {meeting['location']}\n"
-        if meeting.get('url'):
-            description += f"Mer info: {meeting['url']}\n"
-        description += "\nAutomatisk lagt til av Dagsorden-bot"
-        
-        # Event-data
+            start = {'date': meeting_date.isoformat()}
+            end = {'date': (meeting_date + timedelta(days=1)).isoformat()}
+
+        description_lines = [f"Møte: {meeting.title}", f"Kommune: {meeting.kommune}"]
+        if has_location:
+            description_lines.append(f"Sted: {location}")
+        if url:
+            description_lines.append(f"Mer info: {url}")
+        description_lines.extend(("", "Automatisk lagt til av Dagsorden-bot"))
+
         event_data = {
-            'summary': f"{meeting['title']} ({meeting['kommune']})",
-            'description': description,
-            'start': {
-                'dateTime': start_time.isoformat(),
-                'timeZone': 'Europe/Oslo',
-            } if meeting.get('time') else {
-                'date': start_time.strftime('%Y-%m-%d'),
-            },
-            'end': {
-                'dateTime': end_time.isoformat(),
-                'timeZone': 'Europe/Oslo',
-            } if meeting.get('time') else {
-                'date': end_time.strftime('%Y-%m-%d'),
-            },
+            'summary': _meeting_summary(meeting),
+            'description': "\n".join(description_lines),
+            'start': start,
+            'end': end,
             'source': {
                 'title': 'Politiske møter scraper',
-                'url': meeting.get('url', '')
+                'url': url
             }
         }
-        
-        # Legg til lokasjon hvis tilgjengelig
-        if meeting.get('location') and meeting['location'] != "Ikke oppgitt":
-            event_data['location'] = meeting['location']
-        
+        if has_location:
+            event_data['location'] = location
+
         return event_data
     
-    def add_meetings_to_calendar(self, meetings: List[Dict]) -> int:
+    def add_meetings_to_calendar(self, meetings: Sequence[MeetingLike]) -> int:
         """Legg til møter i Google Calendar."""
         if not self.authenticate():
             return 0
         
-        added_count = 0
-        
-        for meeting in meetings:
-            # Sjekk om event allerede eksisterer for å unngå duplikater
-            if self._event_exists(meeting):
-                print(f"⏭️  Event eksisterer allerede: {meeting['title']} ({meeting['date']})")
-                continue
-            
-            event_id = self.create_meeting_event(meeting)
-            if event_id:
-                added_count += 1
-        
+        normalized = [ensure_meeting(meeting) for meeting in meetings]
+        skipped_count = 0
+        cache = _open_event_cache()
+        try:
+            if cache is not None:
+                uncached: List[Meeting] = []
+                for meeting in normalized:
+                    if _event_cache_key(meeting) in cache:
+                        logger.debug("Event eksisterer allerede (cache): %s (%s)", meeting.title, meeting.date)
+                        skipped_count += 1
+                        continue
+                    uncached.append(meeting)
+                normalized = uncached
+
+            self._load_existing_events(normalized)
+
+            pending: List[Meeting] = []
+            for meeting in normalized:
+                # Sjekk om event allerede eksisterer for å unngå duplikater
+                if self._event_exists(meeting):
+                    logger.debug("Event eksisterer allerede: %s (%s)", meeting.title, meeting.date)
+                    skipped_count += 1
+                    if cache is not None:
+                        cache.add(_event_cache_key(meeting), "")
+                    continue
+                pending.append(meeting)
+
+            on_created = None
+            if cache is not None:
+                def on_created(meeting: Meeting, event_id: str) -> None:
+                    cache.add(_event_cache_key(meeting), event_id)
+
+            added_count = self._insert_events_batched(pending, on_created=on_created)
+        finally:
+            if cache is not None:
+                cache.close()
+
+        # Én oppsummering i stedet for en linje per møte
+        if skipped_count:
+            print(f"⏭️  {skipped_count} møter fantes allerede i Google Calendar")
         print(f"📅 Totalt lagt til {added_count} nye møter i Google Calendar")
         return added_count
+
+    def _insert_events_batched(
+        self,
+        meetings: Sequence[Meeting],
+        on_created: Optional[Callable[[Meeting, str], None]] = None,
+        max_tries: int = 6,
+    ) -> int:
+        """Opprett events via batch-endepunktet (maks 50 per multipart-request).
+
+        En batch svarer som regel 200 selv om enkelte inserts ble ratebegrenset;
+        slike del-feil sendes på nytt i en ny batch med samme eksponentielle
+        backoff, og rapporteres først som feilet etter siste forsøk.
+        """
+        if not self.service or not meetings:
+            return 0
+
+        added_count = 0
+        failed: List[str] = []
+        pending = list(range(len(meetings)))
+
+        for attempt in range(max_tries):
+            retry: List[int] = []
+            retry_error: Optional[HttpError] = None
+            last_attempt = attempt + 1 >= max_tries
+
+            def _on_insert(request_id: str, response: Any, exception: Optional[HttpError]) -> None:
+                nonlocal added_count, retry_error
+                idx = int(request_id)
+                if exception is not None:
+                    if not last_attempt and _is_retryable(exception):
+                        retry.append(idx)
+                        retry_error = exception
+                        return
+                    logger.error("Feil ved oppretting av kalender-event '%s': %s", meetings[idx].title, exception)
+                    failed.append(meetings[idx].title)
+                    return
+                if response and response.get("id"):
+                    added_count += 1
+                    if on_created is not None:
+                        on_created(meetings[idx], response["id"])
+
+            for start in range(0, len(pending), BATCH_MAX_REQUESTS):
+                batch = self.service.new_batch_http_request(callback=_on_insert)  # pylint: disable=no-member
+                for idx in pending[start:start + BATCH_MAX_REQUESTS]:
+                    request = self.service.events().insert(  # pylint: disable=no-member
+                        calendarId=self.calendar_id,
+                        body=self._build_event_data(meetings[idx]),
+                    )
+                    batch.add(request, request_id=str(idx))
+                try:
+                    _execute_with_backoff(batch)
+                except HttpError as exc:
+                    print(f"❌ Feil ved batch-oppretting av kalender-events: {exc}")
+
+            if not retry:
+                break
+            pending = sorted(retry)
+            delay = _backoff_delay(attempt, retry_error)
+            print(
+                f"⏳ {len(pending)} kalender-events ble ratebegrenset, prøver igjen om {delay:.1f}s "
+                f"(forsøk {attempt + 2}/{max_tries})"
+            )
+            time.sleep(delay)
+
+        if failed:
+            print(f"❌ {len(failed)} kalender-events kunne ikke opprettes: {', '.join(failed)}")
+        return added_count
     
-    def _event_exists(self, meeting: Dict) -> bool:
+    def _load_existing_events(self, meetings: Sequence[Meeting]) -> None:
+        """Hent alle events i møtenes datointervall én gang og indekser dem."""
+        self._existing = None
+        if not self.service or not meetings:
+            return
+
+        try:
+            state_path = os.getenv(SYNC_STATE_ENV, "").strip()
+            if state_path:
+                self._existing = self._sync_existing_events(state_path)
+                return
+
+            dates = [date.fromisoformat(meeting.date) for meeting in meetings]
+            events, _ = self._list_events_paged(
+                timeMin=f"{min(dates).isoformat()}T00:00:00Z",
+                timeMax=f"{(max(dates) + timedelta(days=1)).isoformat()}T00:00:00Z",
+                singleEvents=True,
+                maxResults=2500,
+            )
+            self._existing = {
+                key for key in (_event_key(event) for event in events) if key is not None
+            }
+        except Exception as exc:  # pylint: disable=broad-except
+            print(f"⚠️  Kunne ikke hente eksisterende events: {exc}")
+
+    def _sync_existing_events(self, state_path: str) -> Set[Tuple[str, str]]:
+        """Oppdater lokal event-indeks via syncToken (kun endringer siden forrige kjøring)."""
+        all_states = _load_sync_state(state_path)
+        state = all_states.get(self.calendar_id) or {}
+        token = state.get("token")
+        known: Dict[str, List[str]] = dict(state.get("events") or {}) if token else {}
+
+        try:
+            changes, next_token = self._list_events_paged(syncToken=token, maxResults=2500)
+        except HttpError as exc:
+            if not token or getattr(exc.resp, "status", None) != 410:
+                raise
+            # Token utløpt – Google krever full synkronisering på nytt.
+            print("ℹ️  Kalender-syncToken er utløpt, gjør full synkronisering")
+            known = {}
+            changes, next_token = self._list_events_paged(maxResults=2500)
+
+        for event in changes:
+            event_id = event.get('id')
+            if not event_id:
+                continue
+            key = _event_key(event)
+            if event.get('status') == 'cancelled' or key is None:
+                known.pop(event_id, None)
+            else:
+                known[event_id] = list(key)
+
+        if next_token:
+            all_states[self.calendar_id] = {"token": next_token, "events": known}
+            _save_sync_state(state_path, all_states)
+
+        return {(event_date, summary) for event_date, summary in known.values()}
+
+    def _list_events_paged(self, **params: Any) -> Tuple[List[Dict], Optional[str]]:
+        """Hent alle sider fra events.list; returnerer events og ev. nextSyncToken."""
+        events: List[Dict] = []
+        page_token: Optional[str] = None
+        while True:
+            events_result = _execute_with_backoff(self.service.events().list(  # pylint: disable=no-member
+                calendarId=self.calendar_id,
+                pageToken=page_token,
+                **params,
+            ))
+            events.extend(events_result.get('items', []))
+            page_token = events_result.get('nextPageToken')
+            if not page_token:
+                return events, events_result.get('nextSyncToken')
+
+    def _event_exists(self, meeting: MeetingLike) -> bool:
         """Sjekk om et event allerede eksisterer i kalenderen."""
+        meeting = ensure_meeting(meeting)
+        meeting_summary = _meeting_summary(meeting)
+        if self._existing is not None:
+            return (meeting.date, meeting_summary) in self._existing
+
         if not self.service:
             return False
         
         try:
             # Søk etter events på samme dato med samme tittel
-            meeting_date = datetime.strptime(meeting['date'], '%Y-%m-%d')
-            time_min = meeting_date.isoformat() + 'T00:00:00Z'
-            time_max = (meeting_date + timedelta(days=1)).isoformat() + 'T00:00:00Z'
+            meeting_date = date.fromisoformat(meeting.date)
+            time_min = f"{meeting_date.isoformat()}T00:00:00Z"
+            time_max = f"{(meeting_date + timedelta(days=1)).isoformat()}T00:00:00Z"
             
-            events_result = self.service.events().list(  # pylint: disable=no-member
+            events_result = _execute_with_backoff(self.service.events().list(  # pylint: disable=no-member
                 calendarId=self.calendar_id,
                 timeMin=time_min,
                 timeMax=time_max,
                 singleEvents=True,
                 orderBy='startTime'
-            ).execute()
-            
-            events = events_result.get('items', [])
+            ))
             
-            # Sjekk om noen event har samme tittel og kommune
-            meeting_summary = f"{meeting['title']} ({meeting['kommune']})"
-            for event in events:
-                if event.get('summary') == meeting_summary:
-                    return True
-            
-            return False
+            # Sjekk om noen event har samme tittel og kommune (O(1)-oppslag)
+            summaries = {event.get('summary') for event in events_result.get('items', [])}
+            return meeting_summary in summaries
             
         except Exception as exc:  # pylint: disable=broad-except
             print(f"⚠️  Kunne ikke sjekke om event eksisterer: {exc}")
             return False
 
-    def create_meeting_event(self, meeting: Dict) -> Optional[str]:
+    def create_meeting_event(self, meeting: MeetingLike) -> Optional[str]:
         """Opprett et event i kalenderen og returner event-ID."""
         if not self.service:
             return None
 
         event_data = self._build_event_data(meeting)
         try:
-            created_event = (
+            created_event = _execute_with_backoff(
                 self.service.events()  # pylint: disable=no-member
                 .insert(calendarId=self.calendar_id, body=event_data)
-                .execute()
             )
             return created_event.get("id")
         except HttpError as exc:
@@ -407,6 +741,29 @@ def _resolve_calendar_id(source_id: str) -> Optional[str]:
     return None
 
 
+def _tag_source_meeting(meeting: Dict, source_id: str) -> Dict:
+    """Marker et kalendermøte med kilde og kildens standardverdier."""
+    meeting.setdefault("source", f"calendar:{source_id}")
+    # Apply defaults based on declared source
+    _apply_calendar_source_defaults(meeting, source_id)
+
+    # Heuristic: if the calendar event text contains turnus-related keywords,
+    # treat it as a turnus calendar entry regardless of source_id.
+    text_blob = " ".join(
+        filter(None, [
+            str(meeting.get("title", "")),
+            str(meeting.get("description", "")),
+            str(meeting.get("raw_text", "")),
+        ])
+    ).lower()
+    turnus_keywords = ("turnus", "turnusfri", "hans christian")
+    if any(k in text_blob for k in turnus_keywords):
+        meeting["source"] = "calendar:turnus"
+        meeting.setdefault("kommune", "Turnus")
+
+    return meeting
+
+
 def get_calendar_meetings_for_sources(
     source_ids: Sequence[str],
     *,
@@ -434,37 +791,33 @@ def get_calendar_meetings_for_sources(
             _apply_calendar_source_defaults(meetings[-1], source_id)
         return meetings
 
-    meetings: List[Dict] = []
+    targets: List[Tuple[str, str]] = []
     for source_id in source_ids:
         calendar_id = _resolve_calendar_id(source_id)
-        if not calendar_id:
-            continue
+        if calendar_id:
+            targets.append((source_id, calendar_id))
+
+    # Med flere kilder hentes de samtidig (API-klienten blokkerer på nettverk), hver
+    # med sitt eget service-objekt; resultatene samles i kilderekkefølge
+    concurrent = len(targets) > 1
 
+    def _fetch_source(target: Tuple[str, str]) -> List[Dict]:
+        source_id, calendar_id = target
         calendar_integration = GoogleCalendarIntegration(calendar_id)
-        if not calendar_integration.authenticate():
-            continue
-
-        for meeting in calendar_integration.get_calendar_meetings(days_ahead):
-            meeting.setdefault("source", f"calendar:{source_id}")
-            # Apply defaults based on declared source
-            _apply_calendar_source_defaults(meeting, source_id)
-
-            # Heuristic: if the calendar event text contains turnus-related keywords,
-            # treat it as a turnus calendar entry regardless of source_id.
-            text_blob = " ".join(
-                filter(None, [
-                    str(meeting.get("title", "")),
-                    str(meeting.get("description", "")),
-                    str(meeting.get("raw_text", "")),
-                ])
-            ).lower()
-            turnus_keywords = ("turnus", "turnusfri", "hans christian")
-            if any(k in text_blob for k in turnus_keywords):
-                meeting["source"] = "calendar:turnus"
-                meeting.setdefault("kommune", "Turnus")
-
-            meetings.append(meeting)
-    return meetings
+        if not calendar_integration.authenticate(shared=not concurrent):
+            return []
+        return [
+            _tag_source_meeting(meeting, source_id)
+            for meeting in calendar_integration.get_calendar_meetings(days_ahead)
+        ]
+
+    if not concurrent:
+        return [meeting for target in targets for meeting in _fetch_source(target)]
+
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        results = list(executor.map(_fetch_source, targets))
+    return [meeting for source_meetings in results for meeting in source_meetings]
+
 
 def main():
     """Test Google Calendar-integrasjon."""
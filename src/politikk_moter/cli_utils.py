@@ -25,3 +25,13 @@ def is_test_mode(args: Optional[Sequence[str]] = None, env: Optional[dict[str, s
     env_map = env if env is not None else os.environ
     testing = env_map.get("TESTING", "").lower()
     return ("--debug" in argv or "--test" in argv) or testing in {"true", "1", "yes"}
+
+
+def is_truthy_env(env_name: str) -> bool:
+    """Return True when env var exists with a truthy value."""
+    value = os.getenv(env_name, "").strip().lower()
+    return value in {"1", "true", "yes", "on"}
+
+
+def is_force_rescrape(args: Optional[Sequence[str]] = None) -> bool:
+    return "--force-rescrape" in _argv(args)
@@ -3,15 +3,62 @@
 Eigersund-specific parser: hent møteplan-tabellen og konverter til møte-objekter.
 Returnerer liste av møter i samme format som resten av scrapers.
 """
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from urllib.parse import urljoin
+import lxml.html
 import requests
 from bs4 import BeautifulSoup
+from bs4.dammit import UnicodeDammit
+from lxml import etree
 import re
 
+from .http_cache import cached_get_content, is_http_cache_enabled
+from .http_session import header_charset
+
 # Simple in-memory cache for fetched meeting detail pages during one run
 _DETAILS_CACHE = {}
 
+_MOTEPLAN_TABLE_XPATH = '//caption[contains(., "Møteplan")]/ancestor::table[1]'
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Delte XPath-uttrykk for møteplan-tabellen (brukes også av Eigersund-skriptene);
+# kompilert én gang i stedet for per rad/celle
+ROWS_XPATH = etree.XPath('.//tr')
+CELLS_XPATH = etree.XPath('.//td|.//th')
+LINKS_XPATH = etree.XPath('.//a')
+
+# Månedsnavn (forkortet og fullt) i tabellhodet -> månedsnummer
+_MONTH_NAMES = {
+    'jan':1, 'januar':1,
+    'feb':2, 'februar':2,
+    'mar':3, 'mars':3,
+    'apr':4, 'april':4,
+    'may':5, 'mai':5,
+    'jun':6, 'juni':6,
+    'jul':7, 'juli':7,
+    'aug':8, 'august':8,
+    'sep':9, 'sept':9, 'september':9,
+    'oct':10, 'okt':10, 'oktober':10,
+    'nov':11, 'november':11,
+    'dec':12, 'des':12, 'desember':12
+}
+
+def _element_strings(element):
+    """Tekstnodene under ``element`` slik BeautifulSoup ser dem (uten kommentarer og script)."""
+    if isinstance(element.tag, str) and element.tag not in ('script', 'style') and element.text:
+        yield element.text
+    for child in element:
+        if isinstance(child.tag, str):
+            yield from _element_strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def element_text(element, separator=''):
+    """Tilsvarer BeautifulSoups ``get_text(separator, strip=True)`` for et lxml-element."""
+    return separator.join(s.strip() for s in _element_strings(element) if s.strip())
+
+
 def parse_eigersund_meetings(url: str, kommune_name: str='Eigersund kommune', year: int=None, days_ahead: int = 10):
     if year is None:
         year = datetime.now().year
@@ -36,23 +83,13 @@ def parse_eigersund_meetings(url: str, kommune_name: str='Eigersund kommune', ye
         return []
     meetings = []
     session = requests.Session()
+    # Vinduet (i dag til og med days_ahead) sjekkes under parsing, slik at
+    # måneder og dager utenfor aldri gir møter eller detaljside-oppslag
+    today = date.today()
+    end_date = today + timedelta(days=days_ahead)
 
     # Attempt to detect header row with month names to map column indices -> month numbers
     month_map = {}  # col_index -> month_number (1-12)
-    month_names = {
-        'jan':1, 'januar':1,
-        'feb':2, 'februar':2,
-        'mar':3, 'mars':3,
-        'apr':4, 'april':4,
-        'may':5, 'mai':5,
-        'jun':6, 'juni':6,
-        'jul':7, 'juli':7,
-        'aug':8, 'august':8,
-        'sep':9, 'sept':9, 'september':9,
-        'oct':10, 'okt':10, 'oktober':10,
-        'nov':11, 'november':11,
-        'dec':12, 'des':12, 'desember':12
-    }
 
     # Look for a header row (th) that contains month names
     header_found = False
@@ -63,7 +100,7 @@ def parse_eigersund_meetings(url: str, kommune_name: str='Eigersund kommune', ye
         for idx, th in enumerate(ths):
             txt = th.get_text(strip=True).lower()
             # check if any known month appears
-            for k, mnum in month_names.items():
+            for k, mnum in _MONTH_NAMES.items():
                 if k in txt:
                     # Map actual table column index to month number
                     # Note: we will use absolute column index when reading rows
@@ -98,15 +135,17 @@ def parse_eigersund_meetings(url: str, kommune_name: str='Eigersund kommune', ye
             for offset in range(1, min(13, len(cols))):
                 month = offset
                 cell = cols[offset] if offset < len(cols) else None
-                if not cell:
+                if not cell or not _month_in_window(year, month, today, end_date):
                     continue
                 days = _extract_days_from_cell(cell)
-                _append_meetings_from_days(days, month, year, committee, link, kommune_name, meetings, session)
+                _append_meetings_from_days(days, month, year, committee, link, kommune_name, meetings, session, today, end_date)
         else:
             # use detected month_map which maps header th indices to month numbers
             # Need to translate header index to data column index: if header used <th> across table,
             # assume data rows align in number of columns; we'll match by position.
             for header_idx, month in month_map.items():
+                if not _month_in_window(year, month, today, end_date):
+                    continue
                 # find the corresponding data cell index in this row
                 if header_idx < len(cols):
                     cell = cols[header_idx]
@@ -118,20 +157,14 @@ def parse_eigersund_meetings(url: str, kommune_name: str='Eigersund kommune', ye
                     else:
                         continue
                 days = _extract_days_from_cell(cell)
-                _append_meetings_from_days(days, month, year, committee, link, kommune_name, meetings, session)
+                _append_meetings_from_days(days, month, year, committee, link, kommune_name, meetings, session, today, end_date)
+
+    return meetings
 
-    # Filter to only return meetings from today up to days_ahead (inclusive)
-    today = datetime.now().date()
-    end_date = today + timedelta(days=days_ahead)
-    filtered = []
-    for m in meetings:
-        try:
-            mdate = datetime.strptime(m['date'], '%Y-%m-%d').date()
-        except ValueError:
-            continue
-        if today <= mdate <= end_date:
-            filtered.append(m)
-    return filtered
+
+def _month_in_window(year, month, start, end):
+    """True hvis måneden overlapper [start, end]."""
+    return (start.year, start.month) <= (year, month) <= (end.year, end.month)
 
 
 def _extract_days_from_cell(cell):
@@ -152,7 +185,7 @@ def _extract_days_from_cell(cell):
     return found_nums
 
 
-def _append_meetings_from_days(days, month, year, committee, link, kommune_name, meetings, session):
+def _append_meetings_from_days(days, month, year, committee, link, kommune_name, meetings, session, start, end):
     for d in days:
         digits = ''.join([c for c in d if c.isdigit()])
         if not digits:
@@ -162,6 +195,8 @@ def _append_meetings_from_days(days, month, year, committee, link, kommune_name,
             dt = datetime(year, month, day)
         except ValueError:
             continue
+        if not start <= dt.date() <= end:
+            continue
         time_str = None
         location = 'Ikke oppgitt'
         try:
@@ -197,3 +232,62 @@ def _append_meetings_from_days(days, month, year, committee, link, kommune_name,
             'url': link,
             'raw_text': f'Eigersund: {committee} {day}.{month}.{year}'
         })
+
+
+def _is_moteplan_table(table):
+    """True hvis tabellens egen caption inneholder 'Møteplan'."""
+    for caption in table.iter('caption'):
+        if 'Møteplan' in caption.text_content() and next(caption.iterancestors('table'), None) is table:
+            return True
+    return False
+
+
+def _moteplan_table_from_bytes(content):
+    # Tegnsettet gjettes som i BeautifulSoup (meta-charset, ellers innholdet)
+    encoding = UnicodeDammit(content, is_html=True).original_encoding
+    tree = lxml.html.document_fromstring(content, parser=lxml.html.HTMLParser(encoding=encoding))
+    tables = tree.xpath(_MOTEPLAN_TABLE_XPATH) or tree.xpath('//table')
+    return (tables[0] if tables else None), tree
+
+
+def fetch_moteplan_table(url, *, session=None, force=False, timeout=15):
+    """Hent Onacos-møteplanen og returner ``(tabell, tre)`` som lxml-elementer.
+
+    Tabellen er den med 'Møteplan' i caption, ellers første tabell på siden.
+    Med HTTP-cachen (MOTEPLAN_HTTP_CACHE) brukes hele svaret fra cachen. Ellers
+    strømmes siden inn i parseren og nedlastingen avbrytes når møteplan-tabellen
+    er ferdig parset.
+    """
+    if is_http_cache_enabled():
+        return _moteplan_table_from_bytes(cached_get_content(url, timeout=timeout, session=session, force=force))
+
+    http = session if session is not None else requests
+    response = http.get(url, timeout=timeout, stream=True)
+    try:
+        response.raise_for_status()
+        charset = header_charset(response)
+        try:
+            parser = etree.HTMLPullParser(events=('start', 'end'), tag='table', encoding=charset) if charset else None
+        except LookupError:
+            parser = None
+        if parser is None:
+            # Uten (gyldig) charset i headeren trengs hele svaret for å gjette tegnsettet
+            return _moteplan_table_from_bytes(response.content)
+        parser.set_element_class_lookup(lxml.html.HtmlElementClassLookup())
+
+        first_table = target = None
+        for chunk in response.iter_content(_STREAM_CHUNK_SIZE):
+            parser.feed(chunk)
+            for event, element in parser.read_events():
+                if event == 'start':
+                    if first_table is None:
+                        first_table = element
+                elif _is_moteplan_table(element):
+                    target = element
+                    break
+            if target is not None:
+                break
+        tree = parser.close()
+    finally:
+        response.close()
+    return (target if target is not None else first_table), tree
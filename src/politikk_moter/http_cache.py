@@ -0,0 +1,176 @@
+"""Optional on-disk HTTP cache for slow-changing pages (Onacos møteplan, kommunesider)."""
+
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Mapping, Optional
+
+import requests
+
+# Cachen er opt-in: sett miljøvariabelen til en sqlite-fil for å gjenbruke svar
+# mellom kjøringer. Ferske svar brukes uten nettverkskall; eldre svar revalideres
+# med ETag/Last-Modified (304 = gjenbruk). Hvor lenge et svar er ferskt styres av
+# Cache-Control/Expires fra serveren, ellers HTTP_CACHE_MAX_AGE_SECONDS.
+HTTP_CACHE_ENV = "MOTEPLAN_HTTP_CACHE"
+HTTP_CACHE_MAX_AGE_SECONDS = 3600
+
+_MAX_AGE_RE = re.compile(r'(?:^|,)\s*(?:s-)?max-age\s*=\s*"?(\d+)', re.IGNORECASE)
+
+
+class _ResponseCache:
+    """Persistent URL -> (etag, last_modified, body, fresh_until) lager."""
+
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS responses('
+            'url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB, fetched REAL, fresh_until REAL)'
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[tuple]:
+        return self._conn.execute(
+            'SELECT etag, last_modified, body, fresh_until FROM responses WHERE url = ?', (url,)
+        ).fetchone()
+
+    def put(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        body: bytes,
+        fresh_until: float,
+    ) -> None:
+        self._conn.execute(
+            'INSERT OR REPLACE INTO responses(url, etag, last_modified, body, fetched, fresh_until) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (url, etag, last_modified, body, time.time(), fresh_until),
+        )
+        self._conn.commit()
+
+    def touch(self, url: str, fresh_until: float) -> None:
+        self._conn.execute(
+            'UPDATE responses SET fetched = ?, fresh_until = ? WHERE url = ?',
+            (time.time(), fresh_until, url),
+        )
+        self._conn.commit()
+
+    def delete(self, url: str) -> None:
+        self._conn.execute('DELETE FROM responses WHERE url = ?', (url,))
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def is_http_cache_enabled() -> bool:
+    return bool(os.getenv(HTTP_CACHE_ENV, "").strip())
+
+
+def _freshness_lifetime(headers: Mapping[str, str], default: float) -> Optional[float]:
+    """Sekunder svaret kan brukes uten revalidering; ``None`` betyr ikke lagre (no-store)."""
+    cache_control = (headers.get('Cache-Control') or '').lower()
+    if 'no-store' in cache_control:
+        return None
+    if 'no-cache' in cache_control:
+        return 0.0
+    match = _MAX_AGE_RE.search(cache_control)
+    if match:
+        return float(match.group(1))
+    expires = headers.get('Expires')
+    if expires:
+        try:
+            expires_at = parsedate_to_datetime(expires).timestamp()
+        except (TypeError, ValueError, OverflowError):
+            return 0.0  # ugyldig Expires (f.eks. "0") betyr allerede utløpt
+        return max(0.0, expires_at - time.time())
+    return default
+
+
+def _open_response_cache() -> Optional[_ResponseCache]:
+    path = os.getenv(HTTP_CACHE_ENV, "").strip()
+    if not path:
+        return None
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return _ResponseCache(path)
+    except (OSError, sqlite3.Error) as exc:
+        print(f"⚠️  Kunne ikke åpne HTTP-cache {path}: {exc}")
+        return None
+
+
+def _write_cache(write: Callable[..., None], url: str, *args: Any) -> None:
+    """Oppdater cachen uten å felle kallet; svaret er allerede hentet.
+
+    Parallelle hentinger kan f.eks. gi "database is locked" – da hoppes
+    lagringen over og siden hentes på nytt neste gang.
+    """
+    try:
+        write(url, *args)
+    except sqlite3.Error as exc:
+        print(f"⚠️  HTTP-cache kunne ikke oppdateres for {url}: {exc}")
+
+
+def cached_get_content(
+    url: str,
+    *,
+    timeout: float = 15,
+    session: Optional[requests.Session] = None,
+    force: bool = False,
+    max_age: float = HTTP_CACHE_MAX_AGE_SECONDS,
+) -> bytes:
+    """Hent ``url`` og returner body; bruker cachen når HTTP_CACHE_ENV er satt.
+
+    ``force`` hopper over ferske treff (men sender fortsatt betinget forespørsel).
+    ``max_age`` gjelder bare når serveren ikke sender Cache-Control/Expires.
+    Feil fra serveren løftes som ``requests.HTTPError`` akkurat som uten cache.
+    """
+    http = session if session is not None else requests
+    cache = _open_response_cache()
+    if cache is None:
+        response = http.get(url, timeout=timeout)
+        response.raise_for_status()
+        return response.content
+
+    try:
+        try:
+            row = cache.get(url)
+        except sqlite3.Error as exc:
+            print(f"⚠️  HTTP-cache kunne ikke leses for {url}: {exc}")
+            row = None
+        headers = {}
+        if row is not None:
+            etag, last_modified, body, fresh_until = row
+            if not force and fresh_until is not None and time.time() < fresh_until:
+                return body
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        response = http.get(url, timeout=timeout, headers=headers)
+        lifetime = _freshness_lifetime(response.headers, max_age)
+        if response.status_code == 304 and row is not None:
+            _write_cache(cache.touch, url, time.time() + (lifetime or 0.0))
+            return row[2]
+        response.raise_for_status()
+        if lifetime is None:
+            _write_cache(cache.delete, url)
+        else:
+            _write_cache(
+                cache.put,
+                url,
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified'),
+                response.content,
+                time.time() + lifetime,
+            )
+        return response.content
+    finally:
+        cache.close()
@@ -0,0 +1,52 @@
+"""Shared requests.Session with connection pooling and retries for the helper scripts."""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+DEFAULT_POOL_SIZE = 20
+
+_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+
+def make_session(pool_size: int = DEFAULT_POOL_SIZE, retries: int = 3) -> requests.Session:
+    """Lag en session med keep-alive-pool per vert og retry på 502/503/504.
+
+    Etter siste forsøk returneres svaret som vanlig (``raise_on_status=False``),
+    slik at kallere som sjekker ``status_code`` oppfører seg som før.
+    """
+    session = requests.Session()
+    session.headers.update({'User-Agent': DEFAULT_USER_AGENT})
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+@lru_cache(maxsize=None)
+def get_session() -> requests.Session:
+    """Prosessens delte session; opprettes ved første kall."""
+    return make_session()
+
+
+def header_charset(response: requests.Response) -> Optional[str]:
+    """Tegnsettet fra Content-Type-headeren, eller ``None`` hvis serveren ikke oppgir det.
+
+    Til forskjell fra ``response.encoding`` faller dette ikke tilbake til
+    ISO-8859-1 for ``text/html`` uten charset.
+    """
+    match = _CHARSET_RE.search(response.headers.get('content-type', ''))
+    return match.group(1) if match else None
@@ -5,15 +5,14 @@ Denne kan erstattes med ekte scraping når sidene blir mer tilgjengelige.
 """
 
 from datetime import datetime, timedelta
-from typing import List, Dict
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
-def get_mock_meetings() -> List[Dict]:
-    """Returnerer mock møtedata for testing og demo."""
-    
-    # Basert på ekte data fra fetch_webpage
-    today = datetime.now().date()
-    
-    mock_meetings = [
+# Statiske møter bygges én gang ved import. Oppslagene er skrivebeskyttede;
+# kall dict(meeting) dersom du trenger å endre et møte.
+_STATIC_MEETINGS: Tuple[Mapping[str, str], ...] = tuple(
+    MappingProxyType(meeting) for meeting in (
+        # Basert på ekte data fra fetch_webpage
         {
             'title': 'Ungdomsrådet',
             'date': '2025-08-20',
@@ -150,24 +149,31 @@ def get_mock_meetings() -> List[Dict]:
             'kommune': 'Rogaland fylkeskommune',
             'raw_text': 'Utvalg for transport og infrastruktur, 23.08.2025, kl. 13:00'
         }
-    ]
+    )
+)
+
+
+def get_mock_meetings() -> Tuple[Mapping[str, str], ...]:
+    """Returnerer mock møtedata for testing og demo.
+
+    Møtene er skrivebeskyttede mappinger; bruk ``dict(meeting)`` før endring.
+    """
     
     # Legg til noen fremtidige møter basert på dagens dato
-    future_meetings = []
-    base_date = today + timedelta(days=1)
-    
-    for i in range(3):
-        meeting_date = base_date + timedelta(days=i*7)  # Ukentlige møter
-        future_meetings.append({
+    base_date = datetime.now().date() + timedelta(days=1)
+    future_meetings = tuple(
+        MappingProxyType({
             'title': 'Formannskapet',
-            'date': meeting_date.strftime('%Y-%m-%d'),
+            'date': (base_date + timedelta(days=i*7)).isoformat(),  # Ukentlige møter
             'time': '14:00',
             'location': 'Kommunestyresalen',
             'kommune': 'Demo kommune',
             'raw_text': 'Automatisk generert møte for demo'
         })
+        for i in range(3)
+    )
     
-    return mock_meetings + future_meetings
+    return _STATIC_MEETINGS + future_meetings
 
 if __name__ == '__main__':
     meetings = get_mock_meetings()
@@ -11,8 +11,236 @@ from bs4 import BeautifulSoup
 import re
 from urllib.parse import urljoin
 from datetime import date, datetime, timedelta
+from types import MappingProxyType
 from zoneinfo import ZoneInfo
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Union
+
+try:  # Local imports when running as module
+    from .cli_utils import is_truthy_env
+    from .models import Meeting
+except ImportError:  # pragma: no cover - fallback for direct script execution
+    from cli_utils import is_truthy_env  # type: ignore
+    from models import Meeting  # type: ignore
+
+try:  # lxml er langt raskere enn html.parser på store, JS-genererte sider
+    import lxml.html as lxml_html
+    from lxml import etree
+    HTML_PARSER = 'lxml'
+except ImportError:  # pragma: no cover - faller tilbake til innebygd parser
+    lxml_html = None
+    etree = None
+    HTML_PARSER = 'html.parser'
+
+# Ressurstyper møtesidene ikke trenger; avbrytes slik at networkidle nås tidligere
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+
+if etree is not None:
+    # Detaljsider: kun feltene vi trenger, uten å bygge BeautifulSoup-tre
+    _DETAIL_TIME_XPATH = etree.XPath('(//time)[1]/@datetime')
+    _DETAIL_META_XPATH = etree.XPath(
+        "(//meta[@property='event:start']/@content | //meta[@name='event:start']/@content)[1]"
+    )
+    _DETAIL_TEXT_XPATH = etree.XPath('//text()[not(ancestor::script) and not(ancestor::style)]')
+    # Generisk fallback: kandidat-elementene og feltene per element hentes med XPath i C
+    _GENERIC_CANDIDATES_XPATH = etree.XPath(
+        '//tr | //div | //article | //section | //li | //h1 | //h2 | //h3 | //h4 | //h5 | //h6'
+    )
+    _NODE_TEXT_XPATH = etree.XPath('.//text()[not(ancestor::script) and not(ancestor::style)]')
+    _NODE_ATTR_XPATH = etree.XPath('(.//*[@aria-label or @title])[position() <= $limit]')
+    _NODE_HEADING_XPATH = etree.XPath(
+        '(.//h1 | .//h2 | .//h3 | .//h4 | .//h5 | .//h6 | .//strong | .//b)[1]'
+    )
+
+# Sett til 1 for å kjøre den generiske fallbacken over BeautifulSoup i stedet for lxml
+BS4_FALLBACK_ENV = "PLAYWRIGHT_SCRAPER_BS4"
+# Sett til 1 bare i containere/CI der Chromium-sandkassen ikke kan startes
+NO_SANDBOX_ENV = "PLAYWRIGHT_NO_SANDBOX"
+
+# Headless-scraping trenger verken GPU, utvidelser eller bakgrunnstrafikk. --single-process
+# og --no-zygote er utelatt: de er ustabile med flere samtidige kontekster.
+CHROMIUM_ARGS = (
+    '--disable-gpu',
+    '--disable-dev-shm-usage',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-features=Translate,BackForwardCache',
+)
+
+# Maks antall kommuner som scrapes samtidig (hver med egen nettleserkontekst)
+KOMMUNE_CONCURRENCY = 4
+# Maks antall detaljsider (Elements Cloud) som åpnes samtidig
+DETAIL_CONCURRENCY = 5
+# Maks antall etterkommere med aria-label/title som leses; dato/tid trenger bare ett treff
+ATTRIBUTE_CANDIDATE_LIMIT = 10
+# Elementer som viser at møtelisten er rendret; ventes på i stedet for faste pauser
+CONTENT_SELECTOR = 'table, .bc-content-list-item, .meeting, .møte'
+ELEMENTS_CONTENT_SELECTOR = 'table, .meeting, .møte, .calendar'
+CONTENT_WAIT_MS = 8000
+
+# Forhåndskompilerte mønstre; brukes for hvert kandidat-element på siden
+_WORD_DATE_PATTERN = r'(?P<word>(?P<word_d>\d{1,2})\.?\s+(?P<word_mon>[A-Za-zæøåÆØÅ\.]{3,})\s+(?P<word_y>\d{4}))'
+# Én søk-runde per tekst: alternativene er navngitte grupper, og match.lastgroup
+# forteller hvilket format som traff. Rekkefølgen i *_PRIORITY bestemmer hvilket
+# format som foretrekkes når flere finnes i samme tekst.
+_DATE_DMY_OR_WORD_RE = re.compile(
+    r'(?P<dmy>(?P<dmy_d>\d{1,2})[\./-](?P<dmy_m>\d{1,2})[\./-](?P<dmy_y>\d{2,4}))|' + _WORD_DATE_PATTERN
+)
+_DATE_DMY_OR_WORD_PRIORITY = ('dmy', 'word')
+_DATE_ANY_RE = re.compile(
+    r'(?P<slash>(?P<slash_m>\d{1,2})/(?P<slash_d>\d{1,2})/(?P<slash_y>\d{4}))'
+    r'|(?P<dotdash>(?P<dotdash_d>\d{1,2})[\.\-](?P<dotdash_m>\d{1,2})[\.\-](?P<dotdash_y>\d{4}))'
+    r'|' + _WORD_DATE_PATTERN +
+    r'|(?P<iso>\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2})'
+    r'|(?P<epoch>\b\d{10,13}\b)'
+)
+_DATE_ANY_PRIORITY = ('slash', 'dotdash', 'word', 'iso', 'epoch')
+_DATE_DOTTED_RE = re.compile(r'\d{1,2}\.\d{1,2}\.\d{4}')
+_ROW_DATE_RE = re.compile(r'\d{1,2}[\./-]\d{1,2}[\./-]202[4-6]')
+_ISO_SECONDS_RE = re.compile(r'(\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}(:\d{2})?)')
+_EPOCH_RE = re.compile(r'\b(\d{10,13})\b')
+# Grov sjekk på rå HTML: uten noen av disse finnes det ingen dato noen av parserne kan lese,
+# og vi slipper å bygge soup. Dekker tall-datoer, ISO, epoch (data-start) og månedsnavn
+# både i ord-datoer og som egne tekstnoder (månedskolonner, oppsplittede dato-diver).
+_MONTH_NAME_PATTERN = r'(?:jan|feb|mar|apr|mai|jun|jul|aug|sep|okt|nov|des)'
+_DATE_HINT_RE = re.compile(
+    r'\d{1,2}[\./-]\d{1,2}[\./-]\d{2,4}'
+    r'|\d{4}-\d{2}-\d{2}'
+    r'|\d{10,13}'
+    rf'|\d{{1,2}}\.?\s+{_MONTH_NAME_PATTERN}'
+    rf'|>\s*{_MONTH_NAME_PATTERN}',
+    re.IGNORECASE,
+)
+_DAY_NUMBER_RE = re.compile(r'\d{1,2}')
+
+# Klokkeslett: HH:MM foretrekkes, ellers "kl HH.MM" (eller "kl HH" i løs variant)
+_TIME_ANY_RE = re.compile(
+    r'(?P<colon>(?P<colon_h>\d{1,2}):(?P<colon_m>\d{2}))'
+    r'|(?P<kl>(?:kl\.?\s*)(?P<kl_h>\d{1,2})[.](?P<kl_m>\d{2}))'
+)
+_TIME_LOOSE_RE = re.compile(
+    r'(?P<colon>(?P<colon_h>\d{1,2}):(?P<colon_m>\d{2}))'
+    r'|(?P<kl>(?i:kl)\.?\s*(?P<kl_h>\d{1,2})(?:[\.:](?P<kl_m>\d{2}))?)'
+)
+_TIME_PRIORITY = ('colon', 'kl')
+
+# Epoch-tidsstempler tolkes i norsk tid uten å slå opp systemets lokale sone per kall
+_OSLO_TZ = ZoneInfo("Europe/Oslo")
+
+# Månedsnavn (norsk) -> nummer. Alle oppslag skjer på de tre første bokstavene,
+# som er unike for hver måned, slik at ett .get() holder.
+_MONTHS = MappingProxyType({
+    'jan': 1, 'januar': 1, 'feb': 2, 'februar': 2,
+    'mar': 3, 'mars': 3, 'apr': 4, 'april': 4,
+    'mai': 5, 'jun': 6, 'juni': 6, 'jul': 7, 'juli': 7,
+    'aug': 8, 'august': 8, 'sep': 9, 'sept': 9, 'september': 9,
+    'okt': 10, 'oktober': 10, 'nov': 11, 'november': 11,
+    'des': 12, 'desember': 12,
+})
+
+# Taggene den generiske fallbacken vurderer, og hvilken bøtte (rekkefølge) de hører til
+_GENERIC_TAG_BUCKETS = {
+    'tr': 0,
+    'div': 1,
+    'article': 2, 'section': 2,
+    'li': 3,
+    'h1': 4, 'h2': 4, 'h3': 4, 'h4': 4, 'h5': 4, 'h6': 4,
+}
+
+_CLASS_MOTE_RE = re.compile(r'.*møte.*|.*meeting.*|.*event.*', re.I)
+_CLASS_CONTAINER_RE = re.compile(r'.*møte.*|.*meeting.*|.*calendar.*|.*event.*', re.I)
+_CLASS_LIST_ITEM_RE = re.compile(r'.*møte.*|.*meeting.*|.*item.*', re.I)
+_MEETING_HREF_RE = re.compile(r'utvalg|dmb|meeting', re.I)
+_MEETING_LINK_TEXT_RE = re.compile(r'utvalg|møte|meeting|utvalgsmøte', re.I)
+_MEETING_WORD_RE = re.compile(r'(møte|meeting|utvalg|styre|råd|nemnd|formannskap|kommunestyre)', re.I)
+_NUMERIC_TITLE_RE = re.compile(r'^[0-9\s\+\-]+$')
+
+# Kutter tittelen fra første dato eller klokkeslett ut linjen, i én sub-runde
+_TITLE_TAIL_RE = re.compile(r'(?:\d{1,2}\.\d{1,2}\.\d{4}|kl\.?\s*\d{1,2}:\d{2}).*')
+# Vanlig UI-tekst som ikke er møter
+_BLACKLIST_RE = re.compile(
+    r'søk etter møte|resultatside med møter|søk etter møter|resultatside|møtekalender|vis flere'
+)
+_LOC_RE = re.compile(
+    r'\b(?:kommunestyresalen|formannskapssalen|rådhuset|møterom|kommunehuset|fylkeshuset)\b',
+    re.I,
+)
+
+
+def _first_match_per_kind(pattern: 're.Pattern[str]', text: str, priority: Tuple[str, ...]) -> Dict[str, 're.Match[str]']:
+    """Første treff per navngitt alternativ, i én gjennomgang av teksten."""
+    found: Dict[str, 're.Match[str]'] = {}
+    for match in pattern.finditer(text):
+        found.setdefault(match.lastgroup, match)
+        if match.lastgroup == priority[0]:
+            break
+    return found
+
+
+def _datetime_from_match(match: 're.Match[str]') -> Optional[datetime]:
+    kind = match.lastgroup
+    try:
+        if kind == 'dmy':
+            year = int(match['dmy_y'])
+            if year < 100:
+                year += 2000
+            return datetime(year, int(match['dmy_m']), int(match['dmy_d']))
+        if kind == 'slash':  # mm/dd/yyyy
+            return datetime(int(match['slash_y']), int(match['slash_m']), int(match['slash_d']))
+        if kind == 'dotdash':
+            return datetime(int(match['dotdash_y']), int(match['dotdash_m']), int(match['dotdash_d']))
+        if kind == 'word':
+            mon_str = match['word_mon'].lower().rstrip('.')
+            month = _MONTHS.get(mon_str[:3])
+            if not month:
+                return None
+            return datetime(int(match['word_y']), month, int(match['word_d']))
+        if kind == 'iso':
+            return datetime.fromisoformat(match['iso'].replace(' ', 'T'))
+        if kind == 'epoch':
+            digits = match['epoch']
+            value = int(digits)
+            ts = value / 1000.0 if len(digits) >= 13 else value
+            return datetime.fromtimestamp(ts, _OSLO_TZ).replace(tzinfo=None)
+    except (ValueError, OverflowError, OSError):
+        return None
+    return None
+
+
+def _find_date(pattern: 're.Pattern[str]', text: str, priority: Tuple[str, ...]) -> Optional[datetime]:
+    found = _first_match_per_kind(pattern, text, priority)
+    for kind in priority:
+        match = found.get(kind)
+        if match:
+            parsed = _datetime_from_match(match)
+            if parsed:
+                return parsed
+    return None
+
+
+def _absolute_url(base_url: str, href: str) -> str:
+    """urljoin bare når href faktisk er relativ; absolutte lenker brukes som de er."""
+    if href.startswith(('http://', 'https://')):
+        return href
+    return urljoin(base_url, href)
+
+
+def _meeting_key(meeting: Union[Meeting, Dict], kommune_name: Optional[str]) -> Tuple[str, str, str]:
+    """Duplikatnøkkel: dato, tittel med normalisert mellomrom/store bokstaver og kommune."""
+    if isinstance(meeting, Meeting):
+        title, meeting_date, kommune = meeting.title, meeting.date, meeting.kommune
+    else:
+        title, meeting_date, kommune = meeting['title'], meeting['date'], meeting.get('kommune')
+    return meeting_date, ' '.join(title.split()).casefold(), kommune or kommune_name or ''
+
+
+def _find_time_parts(text: str, pattern: 're.Pattern[str]' = _TIME_ANY_RE) -> Optional[Tuple[str, Optional[str]]]:
+    """Returner (time, minutt) fra foretrukket klokkeslett-format, eller None."""
+    found = _first_match_per_kind(pattern, text, _TIME_PRIORITY)
+    for kind in _TIME_PRIORITY:
+        match = found.get(kind)
+        if match:
+            return match[f'{kind}_h'], match[f'{kind}_m']
+    return None
 
 
 class PlaywrightMoteParser:
@@ -20,36 +248,97 @@ class PlaywrightMoteParser:
         self.browser = None
         self.context = None
         self.playwright = None
+        self._page = None
         self._current_base_url: str = ""
-        self._oslo_tz = ZoneInfo("Europe/Oslo")
+        self._oslo_tz = _OSLO_TZ
 
     async def __aenter__(self):
         self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=True)
-        self.context = await self.browser.new_context(
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+        self.browser = await self.playwright.chromium.launch(
+            headless=True,
+            args=list(CHROMIUM_ARGS),
+            chromium_sandbox=not is_truthy_env(NO_SANDBOX_ENV),
         )
+        await self._open_context()
         return self
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
+    async def warm(self) -> 'PlaywrightMoteParser':
+        """Start nettleseren uten context manager og last about:blank, slik at første
+        ekte goto ikke betaler for oppstart av renderer. Avsluttes med close()."""
+        if self.browser is None:
+            await self.__aenter__()
+        await self._page.goto('about:blank')
+        return self
+
+    async def close(self) -> None:
+        await self.__aexit__(None, None, None)
+
+    async def _open_context(self) -> None:
+        self.context = await self.browser.new_context(
+            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+            # Norsk locale unngår språk-omdirigeringer på enkelte kommunesider
+            locale='nb-NO',
+        )
+        await self.context.route('**/*', self._route_request)
+        self._page = await self.context.new_page()
+
+    async def spawn_worker(self) -> 'PlaywrightMoteParser':
+        """Ny parser som deler nettleseren, men har egen kontekst og side (egne cookies)."""
+        worker = PlaywrightMoteParser()
+        worker.browser = self.browser
+        await worker._open_context()  # pylint: disable=protected-access
+        return worker
+
+    async def close_context(self) -> None:
+        if self._page and not self._page.is_closed():
+            await self._page.close()
         if self.context:
             await self.context.close()
+
+    @staticmethod
+    async def _route_request(route) -> None:
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close_context()
         if self.browser:
             await self.browser.close()
         if self.playwright:
             await self.playwright.stop()
+        # Nullstill slik at en lukket parser kan varmes opp igjen med warm()
+        self._page = self.context = self.browser = self.playwright = None
+
+    async def _acquire_page(self):
+        """Gjenbruk én side mellom kommuner; tøm cookies for isolasjon mellom nettsteder."""
+        if self._page is None or self._page.is_closed():
+            self._page = await self.context.new_page()
+        else:
+            await self.context.clear_cookies()
+        return self._page
+
+    async def _load_page(self, page, url: str, selector: str) -> None:
+        """Last siden og vent på innholdet vi faktisk trenger, ikke på nettverksro."""
+        await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+        try:
+            await page.wait_for_selector(selector, timeout=CONTENT_WAIT_MS, state='attached')
+        except Exception:
+            # Ingen treff innen fristen: parse det som er lastet så langt
+            pass
 
     async def scrape_javascript_site(self, url: str, kommune_name: str) -> List[Dict]:
         try:
             print(f"🎭 Playwright: Scraper {kommune_name}...")
-            page = await self.context.new_page()
+            page = await self._acquire_page()
             self._current_base_url = url
-            await page.goto(url, wait_until='networkidle', timeout=30000)
-            await page.wait_for_timeout(2500)
+            await self._load_page(page, url, CONTENT_SELECTOR)
             content = await page.content()
-            soup = BeautifulSoup(content, 'html.parser')
-            meetings = self._extract_meetings_from_soup(soup, kommune_name)
-            await page.close()
+            if not _DATE_HINT_RE.search(content):
+                return []
+            soup = BeautifulSoup(content, HTML_PARSER)
+            meetings = self._extract_meetings_from_soup(soup, kommune_name, content)
             return meetings
         except Exception as e:
             print(f"Playwright feil for {kommune_name}: {e}")
@@ -71,68 +360,21 @@ class PlaywrightMoteParser:
         try:
             kommune_label = kommune_name or url
             print(f"🎭 Playwright Elements Cloud: {kommune_label}")
-            page = await self.context.new_page()
+            page = await self._acquire_page()
             self._current_base_url = url
-            await page.goto(url, wait_until='networkidle', timeout=30000)
-            await page.wait_for_timeout(4000)
-            try:
-                await page.wait_for_selector('table, .meeting, .møte, .calendar', timeout=8000)
-            except Exception:
-                pass
+            await self._load_page(page, url, ELEMENTS_CONTENT_SELECTOR)
             content = await page.content()
-            soup = BeautifulSoup(content, 'html.parser')
+            if not _DATE_HINT_RE.search(content):
+                return []
+            soup = BeautifulSoup(content, HTML_PARSER)
             meetings = self._extract_elements_meetings(soup, kommune_label)
             self._attach_elements_urls(meetings, url)
 
             # For meetings without explicit time, try opening the meeting detail pages
-            for meeting in meetings:
-                try:
-                    if meeting.get('time') in (None, 'TBD') and meeting.get('href'):
-                        target = urljoin(url, meeting['href'])
-                        detail_page = await self.context.new_page()
-                        await detail_page.goto(target, wait_until='networkidle', timeout=20000)
-                        await detail_page.wait_for_timeout(1000)
-                        detail_html = await detail_page.content()
-                        dsoup = BeautifulSoup(detail_html, 'html.parser')
-
-                        # 1) <time datetime="..."> preferert
-                        time_tag = dsoup.find('time')
-                        found_time = None
-                        if time_tag and time_tag.get('datetime'):
-                            try:
-                                dt = datetime.fromisoformat(time_tag.get('datetime').split('+')[0])
-                                found_time = dt.strftime('%H:%M')
-                            except Exception:
-                                pass
-
-                        # 2) meta tags eller data-attributter
-                        if not found_time:
-                            meta = dsoup.find('meta', {'property': 'event:start'}) or dsoup.find('meta', {'name': 'event:start'})
-                            if meta and meta.get('content'):
-                                try:
-                                    dt = datetime.fromisoformat(meta.get('content').split('+')[0])
-                                    found_time = dt.strftime('%H:%M')
-                                except Exception:
-                                    pass
-
-                        # 3) Regex i detaljsiden: prefer colon-format, fallback 'kl X.YY'
-                        if not found_time:
-                            text_blob = dsoup.get_text(' ', strip=True)
-                            tm = re.search(r'(\d{1,2}):(\d{2})', text_blob)
-                            if not tm:
-                                tm = re.search(r'(?:kl\.?\s*)(\d{1,2})[.](\d{2})', text_blob)
-                            if tm:
-                                hh, mm = tm.groups()
-                                found_time = self._normalize_time_str(hh, mm)
-
-                        if found_time:
-                            meeting['time'] = found_time
-
-                        await detail_page.close()
-                except Exception:
-                    # ikke fatal, beholder eksisterende meeting
-                    continue
-            await page.close()
+            todo = [m for m in meetings if m.get('time') in (None, 'TBD') and m.get('href')]
+            if todo:
+                semaphore = asyncio.Semaphore(DETAIL_CONCURRENCY)
+                await asyncio.gather(*(self._fill_time_from_detail(m, url, semaphore) for m in todo))
             return meetings
         except Exception as e:
             print(f"Elements Cloud Playwright feil: {e}")
@@ -140,17 +382,85 @@ class PlaywrightMoteParser:
         finally:
             self._current_base_url = ""
 
+    async def _fill_time_from_detail(self, meeting: Dict, base_url: str, semaphore: asyncio.Semaphore) -> None:
+        """Åpne møtets detaljside og sett klokkeslett dersom det finnes der."""
+        async with semaphore:
+            detail_page = None
+            try:
+                detail_page = await self.context.new_page()
+                # _attach_elements_urls har allerede løst href mot base-URL
+                target = meeting.get('url') or _absolute_url(base_url, meeting['href'])
+                await detail_page.goto(target, wait_until='domcontentloaded', timeout=20000)
+                # Gi siden litt tid til å rendre, men bare når tidspunktet ikke alt er i DOM-en
+                if await detail_page.query_selector('time[datetime]') is None:
+                    await detail_page.wait_for_timeout(1000)
+                found_time = self._time_from_detail_html(await detail_page.content())
+                if found_time:
+                    meeting['time'] = found_time
+            except Exception:
+                # ikke fatal, beholder eksisterende meeting
+                pass
+            finally:
+                if detail_page is not None:
+                    try:
+                        await detail_page.close()
+                    except Exception:
+                        pass
+
+    def _time_from_detail_html(self, detail_html: str) -> Optional[str]:
+        # Uten klokkeslett-mønster, <time> eller event:start i rå HTML finnes det
+        # heller ikke noe i teksten – hopp over parsing helt.
+        if (
+            not _TIME_ANY_RE.search(detail_html)
+            and '<time' not in detail_html
+            and 'event:start' not in detail_html
+        ):
+            return None
+
+        if lxml_html is not None:
+            tree = lxml_html.fromstring(detail_html)
+            time_attr = next(iter(_DETAIL_TIME_XPATH(tree)), None)
+            meta_content = next(iter(_DETAIL_META_XPATH(tree)), None)
+
+            def text_blob() -> str:
+                return ' '.join(part.strip() for part in _DETAIL_TEXT_XPATH(tree) if part.strip())
+        else:  # pragma: no cover - kun uten lxml
+            dsoup = BeautifulSoup(detail_html, HTML_PARSER)
+            time_tag = dsoup.find('time')
+            time_attr = time_tag.get('datetime') if time_tag else None
+            meta = dsoup.find('meta', {'property': 'event:start'}) or dsoup.find('meta', {'name': 'event:start'})
+            meta_content = meta.get('content') if meta else None
+
+            def text_blob() -> str:
+                return dsoup.get_text(' ', strip=True)
+
+        # 1) <time datetime="..."> preferert, 2) meta tags
+        for candidate in (time_attr, meta_content):
+            if candidate:
+                try:
+                    dt = datetime.fromisoformat(candidate.split('+')[0])
+                    return dt.strftime('%H:%M')
+                except Exception:
+                    pass
+
+        # 3) Regex i detaljsiden: prefer colon-format, fallback 'kl X.YY'
+        tm = _find_time_parts(text_blob())
+        if tm:
+            hh, mm = tm
+            return self._normalize_time_str(hh, mm)
+        return None
+
     async def scrape_onacos_site(self, url: str, kommune_name: str) -> List[Dict]:
         try:
             print(f"🎭 Playwright Onacos: {kommune_name}")
-            page = await self.context.new_page()
+            page = await self._acquire_page()
             self._current_base_url = url
-            await page.goto(url, wait_until='networkidle', timeout=30000)
-            await page.wait_for_timeout(4000)
+            await self._load_page(page, url, CONTENT_SELECTOR)
             content = await page.content()
-            soup = BeautifulSoup(content, 'html.parser')
-            meetings = self._extract_meetings_from_soup(soup, kommune_name)
-            await page.close()
+            if not _DATE_HINT_RE.search(content):
+                return []
+            soup = BeautifulSoup(content, HTML_PARSER)
+            meetings = self._extract_meetings_from_soup(soup, kommune_name, content)
             return meetings
         except Exception as e:
             print(f"Onacos Playwright feil for {kommune_name}: {e}")
@@ -159,10 +469,9 @@ class PlaywrightMoteParser:
             self._current_base_url = ""
 
     async def scrape_digdem_site(self, url: str, kommune_name: str) -> List[Dict]:
-        page = None
         try:
             print(f"🎭 Playwright Digdem: {kommune_name}")
-            page = await self.context.new_page()
+            page = await self._acquire_page()
             self._current_base_url = url
             await page.goto(url, wait_until='networkidle', timeout=45000)
             await page.wait_for_function("() => window.__APOLLO_CLIENT__ && window.__APOLLO_CLIENT__.cache", timeout=20000)
@@ -190,15 +499,9 @@ class PlaywrightMoteParser:
             """)
 
             meetings = self._extract_digdem_meetings(apollo_cache, kommune_name, url)
-            await page.close()
             return meetings
         except Exception as exc:
             print(f"Digdem Playwright feil for {kommune_name}: {exc}")
-            if page:
-                try:
-                    await page.close()
-                except Exception:
-                    pass
             return []
         finally:
             self._current_base_url = ""
@@ -278,12 +581,26 @@ class PlaywrightMoteParser:
         for meeting in meetings:
             href = meeting.get('href')
             if href:
-                meeting['url'] = urljoin(base_url, href)
+                meeting['url'] = _absolute_url(base_url, href)
             elif not meeting.get('url'):
                 meeting['url'] = base_url
 
-    def _extract_meetings_from_soup(self, soup: BeautifulSoup, kommune_name: str) -> List[Dict]:
-        meetings = []
+    def _extract_meetings_from_soup(
+        self,
+        soup: BeautifulSoup,
+        kommune_name: str,
+        content: Optional[str] = None,
+    ) -> List[Dict]:
+        meetings: List[Dict] = []
+        seen: set = set()
+
+        def add_unique(meeting: Union[Meeting, Dict]) -> None:
+            # Dedupe ved innsetting i stedet for en ekstra runde over listen; kandidater fra
+            # elementene er kompakte Meeting-objekter og blir dict først når de beholdes
+            key = _meeting_key(meeting, kommune_name)
+            if key not in seen:
+                seen.add(key)
+                meetings.append(meeting.to_dict() if isinstance(meeting, Meeting) else meeting)
 
         # Først: nye innsyn-komponenter med bc-content-list
         bc_meetings = self._extract_bc_content_list_meetings(
@@ -296,11 +613,6 @@ class PlaywrightMoteParser:
 
         # First: try to parse calendar-style tables where header cells are month names (Jan..Des)
         tables = soup.find_all('table')
-        months_map = {
-            'jan':1,'januar':1,'feb':2,'februar':2,'mar':3,'mars':3,'apr':4,'april':4,
-            'mai':5,'jun':6,'juni':6,'jul':7,'juli':7,'aug':8,'august':8,'sep':9,'sept':9,'september':9,
-            'okt':10,'oktober':10,'nov':11,'november':11,'des':12,'desember':12
-        }
 
         for table in tables:
             first_row = table.find('tr')
@@ -308,15 +620,15 @@ class PlaywrightMoteParser:
                 continue
             header_cells = first_row.find_all(['th', 'td'])
             header_texts = [hc.get_text(strip=True).lower() for hc in header_cells]
-            if not any((h and h[:3] in months_map) for h in header_texts):
+            if not any((h and h[:3] in _MONTHS) for h in header_texts):
                 continue
 
             # Map header column index -> month number
             month_indices = {}
             for idx, txt in enumerate(header_texts):
                 key = txt.rstrip('.')[:3]
-                if key in months_map:
-                    month_indices[idx] = months_map[key]
+                if key in _MONTHS:
+                    month_indices[idx] = _MONTHS[key]
 
             # DEBUG header
             # print(f"[DEBUG calendar headers] {header_texts}")
@@ -340,11 +652,11 @@ class PlaywrightMoteParser:
                     if a_tags:
                         for a in a_tags:
                             text = a.get_text(strip=True)
-                            parts = re.findall(r'\d{1,2}', text)
+                            parts = _DAY_NUMBER_RE.findall(text)
                             days.extend(parts)
                     else:
                         txt = cell.get_text(' ', strip=True)
-                        parts = re.findall(r'\d{1,2}', txt)
+                        parts = _DAY_NUMBER_RE.findall(txt)
                         days.extend(parts)
 
                     for part in days:
@@ -353,7 +665,7 @@ class PlaywrightMoteParser:
                             dt = datetime(datetime.now().year, month_num, day)
                         except Exception:
                             continue
-                        meetings.append({
+                        add_unique({
                             'title': committee,
                             'date': dt.strftime('%Y-%m-%d'),
                             'time': None,
@@ -362,23 +674,15 @@ class PlaywrightMoteParser:
                             'raw_text': cell.get_text(strip=True)
                         })
 
-        # If we found calendar meetings, dedupe, optionally filter for Eigersund, and return
+        # If we found calendar meetings, optionally filter for Eigersund, and return
         if meetings:
-            unique = []
-            seen = set()
-            for m in meetings:
-                key = (m['date'], m['title'], m.get('kommune') or kommune_name)
-                if key not in seen:
-                    seen.add(key)
-                    unique.append(m)
-
             # If this is Eigersund, filter to today..today+10 days
             try:
                 if 'eigersund' in (kommune_name or '').lower():
                     today = datetime.now().date()
                     end_date = today + timedelta(days=10)
                     filtered = []
-                    for m in unique:
+                    for m in meetings:
                         try:
                             md = datetime.strptime(m['date'], '%Y-%m-%d').date()
                             if today <= md <= end_date:
@@ -389,30 +693,47 @@ class PlaywrightMoteParser:
             except Exception:
                 pass
 
-            return unique
-
-        # Fallback: generic element scraping
-        potential_elements = []
-        potential_elements.extend(soup.find_all('tr'))
-        potential_elements.extend(soup.find_all('div', class_=re.compile(r'.*møte.*|.*meeting.*|.*event.*', re.I)))
-        potential_elements.extend(soup.find_all(['article', 'section']))
-        potential_elements.extend(soup.find_all('li'))
-        potential_elements.extend(soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']))
-
-        for element in potential_elements:
-            meeting = self._extract_meeting_from_element(element, kommune_name)
-            if meeting:
-                meetings.append(meeting)
-
-        # dedupe
-        unique = []
-        seen = set()
-        for m in meetings:
-            key = (m['date'], m['title'], m.get('kommune') or kommune_name)
-            if key not in seen:
-                seen.add(key)
-                unique.append(m)
-        return unique
+            return meetings
+
+        # Fallback: generic element scraping. Med rå HTML og lxml tilgjengelig går
+        # gjennomløpet over lxml-treet (XPath i C); ellers over soup-treet.
+        tree = None
+        if content is not None and lxml_html is not None and not is_truthy_env(BS4_FALLBACK_ENV):
+            try:
+                tree = lxml_html.fromstring(content)
+            except (etree.ParserError, ValueError):
+                tree = None
+
+        if tree is not None:
+            for node in self._generic_candidates(_GENERIC_CANDIDATES_XPATH(tree), lambda n: n.tag):
+                meeting = self._extract_meeting_from_node(node, kommune_name)
+                if meeting:
+                    add_unique(meeting)
+        else:
+            for element in self._generic_candidates(soup.find_all(True), lambda e: e.name):
+                meeting = self._extract_meeting_from_element(element, kommune_name)
+                if meeting:
+                    add_unique(meeting)
+
+        return meetings
+
+    @staticmethod
+    def _generic_candidates(elements, tag_of) -> List:
+        """Ett gjennomløp av treet i stedet for fem find_all-kall; bøttene beholder
+        rekkefølgen tr, div, article/section, li, h1-h6."""
+        buckets: List[List] = [[], [], [], [], []]
+        for element in elements:
+            bucket = _GENERIC_TAG_BUCKETS.get(tag_of(element))
+            if bucket is None:
+                continue
+            if bucket == 1:
+                classes = element.get('class') or ''
+                if not isinstance(classes, str):
+                    classes = ' '.join(classes)
+                if not _CLASS_MOTE_RE.search(classes):
+                    continue
+            buckets[bucket].append(element)
+        return [element for bucket in buckets for element in bucket]
 
     def _parse_date_string(self, text: Optional[str]) -> Optional[datetime]:
         if not text:
@@ -421,51 +742,16 @@ class PlaywrightMoteParser:
         if not text:
             return None
 
-        # dd.mm.yyyy or dd.mm.yy
-        m = re.search(r"(\d{1,2})[\./-](\d{1,2})[\./-](\d{2,4})", text)
-        if m:
-            day, month, year = m.groups()
-            year_int = int(year)
-            if year_int < 100:
-                year_int += 2000
-            try:
-                return datetime(year_int, int(month), int(day))
-            except Exception:
-                return None
-
-        # dd month yyyy (Norwegian)
-        m2 = re.search(r"(\d{1,2})\.?\s+([A-Za-zæøåÆØÅ\.]{3,})\s+(\d{4})", text)
-        if m2:
-            day = int(m2.group(1))
-            mon_str = m2.group(2).lower().rstrip('.')
-            year = int(m2.group(3))
-            months = {
-                'jan': 1, 'januar': 1, 'feb': 2, 'februar': 2,
-                'mar': 3, 'mars': 3, 'apr': 4, 'april': 4,
-                'mai': 5, 'jun': 6, 'juni': 6, 'jul': 7, 'juli': 7,
-                'aug': 8, 'august': 8, 'sep': 9, 'sept': 9, 'september': 9,
-                'okt': 10, 'oktober': 10, 'nov': 11, 'november': 11,
-                'des': 12, 'desember': 12,
-            }
-            month = months.get(mon_str[:3]) or months.get(mon_str)
-            if month:
-                try:
-                    return datetime(year, month, day)
-                except Exception:
-                    return None
-        return None
+        # dd.mm.yyyy / dd.mm.yy foretrekkes foran "dd month yyyy" (norsk)
+        return _find_date(_DATE_DMY_OR_WORD_RE, text, _DATE_DMY_OR_WORD_PRIORITY)
 
     def _extract_time_from_text(self, text: Optional[str]) -> Optional[str]:
         if not text:
             return None
-        match = re.search(r"(\d{1,2}):(\d{2})", text)
-        if match:
-            return self._normalize_time_str(*match.groups())
-        match = re.search(r"(?:kl\.?\s*)(\d{1,2})(?:[\.:](\d{2}))?", text, re.IGNORECASE)
-        if match:
-            hour = match.group(1)
-            minute = match.group(2) or "00"
-            return self._normalize_time_str(hour, minute)
+        parts = _find_time_parts(text, _TIME_LOOSE_RE)
+        if parts:
+            hour, minute = parts
+            return self._normalize_time_str(hour, minute or "00")
         return None
 
     def _extract_bc_content_list_meetings(
@@ -481,6 +767,7 @@ class PlaywrightMoteParser:
         resolved_base = (base_url or self._current_base_url or '').strip()
 
         meetings: List[Dict] = []
+        seen: set = set()
         for item in items:
             anchor_el = item.select_one('.bc-content-teaser-title a')
             title_container = item.select_one('.bc-content-teaser-title')
@@ -581,22 +868,28 @@ class PlaywrightMoteParser:
             else:
                 meeting['url'] = ''
 
-            meetings.append(meeting)  # type: ignore[list-item]
-
-        unique: List[Dict] = []
-        seen = set()
-        for meeting in meetings:
-            key = (meeting['date'], meeting['title'])
-            if key in seen:
+            dedupe_key = _meeting_key(meeting, kommune_name)
+            if dedupe_key in seen:
                 continue
-            seen.add(key)
-            unique.append(meeting)  # type: ignore[arg-type]
+            seen.add(dedupe_key)
+            meetings.append(meeting)  # type: ignore[list-item]
 
-        return unique
+        return meetings
 
     def _extract_elements_meetings(self, soup: BeautifulSoup, kommune_name: Optional[str] = None) -> List[Dict]:
         meetings: List[Dict] = []
         kommune_label = kommune_name or 'Rogaland fylkeskommune'
+        seen: set = set()
+
+        def add_unique(meeting: Union[Meeting, Dict]) -> None:
+            # Filtrer og dedupe ved innsetting i stedet for en ekstra runde over listen
+            title = meeting.title if isinstance(meeting, Meeting) else meeting['title']
+            if len(title) >= 200 or _NUMERIC_TITLE_RE.match(title):
+                return
+            key = _meeting_key(meeting, kommune_label)
+            if key not in seen:
+                seen.add(key)
+                meetings.append(meeting.to_dict() if isinstance(meeting, Meeting) else meeting)
 
         bc_meetings = self._extract_bc_content_list_meetings(
             soup,
@@ -610,74 +903,15 @@ class PlaywrightMoteParser:
             if not s:
                 return None
             s = s.strip()
-            # mm/dd/yyyy
-            m = re.search(r'(\d{1,2})/(\d{1,2})/(\d{4})', s)
-            if m:
-                mo, d, y = m.groups()
-                try:
-                    dt = datetime(int(y), int(mo), int(d))
-                    return dt.strftime('%Y-%m-%d')
-                except Exception:
-                    pass
-            # dd.mm.yyyy or dd-mm-yyyy
-            m2 = re.search(r'(\d{1,2})[\.\-](\d{1,2})[\.\-](\d{4})', s)
-            if m2:
-                d, mo, y = m2.groups()
-                try:
-                    dt = datetime(int(y), int(mo), int(d))
-                    return dt.strftime('%Y-%m-%d')
-                except Exception:
-                    pass
-            # dd month yyyy
-            m3 = re.search(r'(\d{1,2})\.?\s+([A-Za-zæøåÆØÅ\.]{3,})\s+(\d{4})', s)
-            if m3:
-                day = int(m3.group(1))
-                mon_str = m3.group(2).lower().rstrip('.')
-                year = int(m3.group(3))
-                months = {'jan':1,'januar':1,'feb':2,'februar':2,'mar':3,'mars':3,'apr':4,'april':4,'mai':5,'jun':6,'juni':6,'jul':7,'juli':7,'aug':8,'august':8,'sep':9,'sept':9,'september':9,'okt':10,'oktober':10,'nov':11,'november':11,'des':12,'desember':12}
-                mon = months.get(mon_str[:3]) or months.get(mon_str)
-                if mon:
-                    try:
-                        dt = datetime(year, mon, day)
-                        return dt.strftime('%Y-%m-%d')
-                    except Exception:
-                        pass
-            # ISO 8601 (e.g. 2025-08-21T10:00:00 or 2025-08-21 10:00)
-            try:
-                iso = re.search(r'\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}', s)
-                if iso:
-                    iso_s = iso.group(0).replace(' ', 'T')
-                    try:
-                        dt = datetime.fromisoformat(iso_s)
-                        return dt.strftime('%Y-%m-%d')
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-
-            # Epoch seconds or milliseconds
-            digits = re.search(r'\b(\d{10,13})\b', s)
-            if digits:
-                try:
-                    val = int(digits.group(1))
-                    if len(digits.group(1)) >= 13:
-                        ts = val / 1000.0
-                    else:
-                        ts = val
-                    dt = datetime.fromtimestamp(ts)
-                    return dt.strftime('%Y-%m-%d')
-                except Exception:
-                    pass
+            # mm/dd/yyyy, dd.mm.yyyy/dd-mm-yyyy, dd month yyyy, ISO 8601, epoch (s/ms)
+            dt = _find_date(_DATE_ANY_RE, s, _DATE_ANY_PRIORITY)
+            if dt:
+                return dt.strftime('%Y-%m-%d')
             return None
 
         # tables
         tables = soup.find_all('table')
         # First: detect calendar-style tables where header cells are month names (Jan..Des)
-        months_map = {
-            'jan':1,'januar':1,'feb':2,'februar':2,'mar':3,'mars':3,'apr':4,'april':4,
-            'mai':5,'jun':6,'juni':6,'jul':7,'juli':7,'aug':8,'august':8,'sep':9,'sept':9,'september':9,
-            'okt':10,'oktober':10,'nov':11,'november':11,'des':12,'desember':12
-        }
         for table in tables:
             # Use first row as header (handles th or td)
             first_row = table.find('tr')
@@ -685,15 +919,15 @@ class PlaywrightMoteParser:
                 continue
             header_cells = first_row.find_all(['th', 'td'])
             header_texts = [hc.get_text(strip=True).lower() for hc in header_cells]
-            if not any((h and h[:3] in months_map) for h in header_texts):
+            if not any((h and h[:3] in _MONTHS) for h in header_texts):
                 continue
 
             # Map header column index -> month number
             month_indices = {}
             for idx, txt in enumerate(header_texts):
                 key = txt.rstrip('.')[:3]
-                if key in months_map:
-                    month_indices[idx] = months_map[key]
+                if key in _MONTHS:
+                    month_indices[idx] = _MONTHS[key]
 
 
 
@@ -717,11 +951,11 @@ class PlaywrightMoteParser:
                     if a_tags:
                         for a in a_tags:
                             text = a.get_text(strip=True)
-                            parts = re.findall(r'\d{1,2}', text)
+                            parts = _DAY_NUMBER_RE.findall(text)
                             days.extend(parts)
                     else:
                         txt = cell.get_text(' ', strip=True)
-                        parts = re.findall(r'\d{1,2}', txt)
+                        parts = _DAY_NUMBER_RE.findall(txt)
                         days.extend(parts)
 
                     for part in days:
@@ -730,7 +964,7 @@ class PlaywrightMoteParser:
                             dt = datetime(datetime.now().year, month_num, day)
                         except Exception:
                             continue
-                        meetings.append({
+                        add_unique({
                             'title': committee,
                             'date': dt.strftime('%Y-%m-%d'),
                             'time': None,
@@ -745,17 +979,17 @@ class PlaywrightMoteParser:
             for row in rows:
                 cells = row.find_all(['td', 'th'])
                 row_text = ' '.join([c.get_text(strip=True) for c in cells])
-                if len(row_text) > 15 and re.search(r'\d{1,2}[\./-]\d{1,2}[\./-]202[4-6]', row_text):
+                if len(row_text) > 15 and _ROW_DATE_RE.search(row_text):
                     meeting = self._extract_meeting_from_element(row, kommune_label)
-                    if meeting and len(meeting['title']) > 3:
-                        meetings.append(meeting)
+                    if meeting and len(meeting.title) > 3:
+                        add_unique(meeting)
 
         # links
         links = soup.find_all('a', href=True)
         for link in links:
             href = link.get('href', '')
             text = link.get_text(strip=True)
-            if 'DmbMeeting' in href or re.search(r'utvalg|dmb|meeting', href, re.I) or re.search(r'utvalg|møte|meeting|utvalgsmøte', text, re.I):
+            if 'DmbMeeting' in href or _MEETING_HREF_RE.search(href) or _MEETING_LINK_TEXT_RE.search(text):
                 title_attr = link.get('title') or ''
                 aria_attr = link.get('aria-label') or ''
                 data_date = link.get('data-date') or ''
@@ -788,7 +1022,7 @@ class PlaywrightMoteParser:
                 if data_start:
                     ds = data_start.strip()
                     # ISO
-                    iso_match = re.search(r'(\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}(:\d{2})?)', ds)
+                    iso_match = _ISO_SECONDS_RE.search(ds)
                     if iso_match:
                         try:
                             iso_s = iso_match.group(1).replace(' ', 'T')
@@ -799,12 +1033,12 @@ class PlaywrightMoteParser:
                             pass
                     else:
                         # epoch
-                        dig = re.search(r'\b(\d{10,13})\b', ds)
+                        dig = _EPOCH_RE.search(ds)
                         if dig:
                             try:
                                 val = int(dig.group(1))
                                 ts = val / 1000.0 if len(dig.group(1)) >= 13 else val
-                                dt_ds = datetime.fromtimestamp(ts)
+                                dt_ds = datetime.fromtimestamp(ts, _OSLO_TZ)
                                 meeting_date_str = dt_ds.strftime('%Y-%m-%d')
                                 meeting_time = dt_ds.strftime('%H:%M')
                             except Exception:
@@ -812,11 +1046,9 @@ class PlaywrightMoteParser:
 
                 # Fallback: parse time from candidate blob (prefer colon, validate hour)
                 if not meeting_time:
-                    tm = re.search(r'(\d{1,2}):(\d{2})', candidate_blob)
-                    if not tm:
-                        tm = re.search(r'(?:kl\.?\s*)(\d{1,2})[.](\d{2})', candidate_blob)
+                    tm = _find_time_parts(candidate_blob)
                     if tm:
-                        hh, mm = tm.groups()
+                        hh, mm = tm
                         meeting_time = self._normalize_time_str(hh, mm)
 
                 meeting = {
@@ -827,208 +1059,234 @@ class PlaywrightMoteParser:
                     'kommune': kommune_label,
                     'href': href
                 }
-                meetings.append(meeting)
+                add_unique(meeting)
 
         # other containers
         containers = []
-        containers.extend(soup.find_all('div', class_=re.compile(r'.*møte.*|.*meeting.*|.*calendar.*|.*event.*', re.I)))
-        containers.extend(soup.find_all('li', class_=re.compile(r'.*møte.*|.*meeting.*|.*item.*', re.I)))
+        containers.extend(soup.find_all('div', class_=_CLASS_CONTAINER_RE))
+        containers.extend(soup.find_all('li', class_=_CLASS_LIST_ITEM_RE))
         containers.extend(soup.find_all('article'))
         for c in containers:
             text = c.get_text(strip=True)
             if (len(text) > 20 and
-                re.search(r'\d{1,2}[\./-]\d{1,2}[\./-]202[4-6]', text) and
-                re.search(r'(møte|meeting|utvalg|styre|råd|nemnd|formannskap|kommunestyre)', text, re.I)):
+                _ROW_DATE_RE.search(text) and
+                _MEETING_WORD_RE.search(text)):
                 meeting = self._extract_meeting_from_element(c, kommune_label)
-                if meeting and len(meeting['title']) > 3:
-                    meetings.append(meeting)
-
-        # dedupe and filter
-        good = []
-        seen = set()
-        for m in meetings:
-            title = m['title']
-            if (len(title) < 200 and not re.match(r'^[0-9\s\+\-]+$', title)):
-                key = (m['date'], title)
-                if key not in seen:
-                    seen.add(key)
-                    good.append(m)
-
-        return good
-
-    def _extract_meeting_from_element(self, element, kommune_name: str) -> Optional[Dict]:
-        try:
-            text = element.get_text(strip=True)
-            candidate_texts = [text]
-            try:
-                aria = element.get('aria-label')
-                title_attr = element.get('title')
-            except Exception:
-                aria = None
-                title_attr = None
-            if aria:
-                candidate_texts.insert(0, aria)
-            if title_attr:
-                candidate_texts.insert(0, title_attr)
-            for child in element.find_all(True):
-                try:
-                    a = child.get('aria-label')
-                    t = child.get('title')
-                except Exception:
-                    a = None
-                    t = None
-                if a:
-                    candidate_texts.append(a)
-                if t:
-                    candidate_texts.append(t)
-
-            combined = ' '.join([c for c in candidate_texts if c])
-            if len(combined) < 8:
-                return None
-
-            meeting_date = None
-            for cand in candidate_texts:
-                if not cand:
-                    continue
-                m = re.search(r'(\d{1,2})[\.\-/](\d{1,2})[\.\-/](\d{2,4})', cand)
-                if m:
-                    d, mo, y = m.groups()
-                    y = int(y)
-                    if y < 100:
-                        y += 2000
-                    try:
-                        meeting_date = datetime(y, int(mo), int(d))
-                        break
-                    except Exception:
-                        meeting_date = None
-                else:
-                    m2 = re.search(r'(\d{1,2})\.?\s+([A-Za-zæøåÆØÅ\.]{3,})\s+(\d{4})', cand)
-                    if m2:
-                        day = int(m2.group(1))
-                        mon_str = m2.group(2).lower().rstrip('.')
-                        year = int(m2.group(3))
-                        months = {'jan':1,'januar':1,'feb':2,'februar':2,'mar':3,'mars':3,'apr':4,'april':4,'mai':5,'jun':6,'juni':6,'jul':7,'juli':7,'aug':8,'august':8,'sep':9,'sept':9,'september':9,'okt':10,'oktober':10,'nov':11,'november':11,'des':12,'desember':12}
-                        mon = months.get(mon_str[:3]) or months.get(mon_str)
-                        if mon:
-                            try:
-                                meeting_date = datetime(year, mon, day)
-                                break
-                            except Exception:
-                                meeting_date = None
+                if meeting and len(meeting.title) > 3:
+                    add_unique(meeting)
 
-            if not meeting_date:
-                return None
-
-            meeting_time = None
-            for cand in candidate_texts:
-                if not cand:
-                    continue
-                tm = re.search(r'(\d{1,2}):(\d{2})', cand)
-                if not tm:
-                    tm = re.search(r'(?:kl\.?\s*)(\d{1,2})[.](\d{2})', cand)
-                if tm:
-                    hh, mm = tm.groups()
-                    meeting_time = self._normalize_time_str(hh, mm)
-                    if meeting_time:
-                        break
+        return meetings
 
-            title = ''
+    def _extract_meeting_from_element(self, element, kommune_name: str) -> Optional[Meeting]:
+        try:
+            text = element.get_text(strip=True)
+            # Bare etterkommere som faktisk har attributtene, i stedet for hele treet
+            children = element.select('[aria-label],[title]', limit=ATTRIBUTE_CANDIDATE_LIMIT)
             if element.name in ['h1','h2','h3','h4','h5','h6']:
-                title = element.get_text(strip=True)
+                heading = text
             else:
                 title_el = element.find(['h1','h2','h3','h4','h5','h6','strong','b'])
-                if title_el:
-                    title = title_el.get_text(strip=True)
-                else:
-                    lines = text.split('\n')
-                    for line in lines:
-                        line = line.strip()
-                        if len(line) > 3 and not re.search(r'\d{1,2}\.\d{1,2}\.\d{4}', line):
-                            title = line
-                            break
-
-            if title:
-                title = re.sub(r'\d{1,2}\.\d{1,2}\.\d{4}.*','', title).strip()
-                title = re.sub(r'kl\.?\s*\d{1,2}:\d{2}.*','', title).strip()
-                title = re.sub(r'\s+',' ', title).strip()
-
-            # blacklist common UI text
-            lowt = (title or '').lower()
-            for bp in [r'søk etter møte', r'resultatside med møter', r'søk etter møter', r'resultatside', r'møtekalender', r'vis flere']:
-                if re.search(bp, lowt):
-                    return None
-
-            location = 'Ikke oppgitt'
-            loc_words = re.findall(r'\b(?:kommunestyresalen|formannskapssalen|rådhuset|møterom|kommunehuset|fylkeshuset)\b', text, re.I)
-            if loc_words:
-                location = loc_words[0].title()
-
-            return {
-                'title': (title or 'Politisk møte')[:100],
-                'date': meeting_date.strftime('%Y-%m-%d'),
-                'time': meeting_time,
-                'location': location[:50],
-                'kommune': kommune_name,
-                'raw_text': text[:300]
-            }
+                heading = title_el.get_text(strip=True) if title_el else None
+            return self._meeting_from_parts(element, children, text, heading, kommune_name)
+        except Exception as e:
+            print(f"Feil ved ekstraksjon: {e}")
+            return None
+
+    def _extract_meeting_from_node(self, node, kommune_name: str) -> Optional[Meeting]:
+        """lxml-variant av _extract_meeting_from_element; samme regler, uten bs4-objekter."""
+        try:
+            text = ''.join(part.strip() for part in _NODE_TEXT_XPATH(node))
+            children = _NODE_ATTR_XPATH(node, limit=ATTRIBUTE_CANDIDATE_LIMIT)
+            if node.tag in ('h1', 'h2', 'h3', 'h4', 'h5', 'h6'):
+                heading = text
+            else:
+                title_nodes = _NODE_HEADING_XPATH(node)
+                heading = (
+                    ''.join(part.strip() for part in _NODE_TEXT_XPATH(title_nodes[0]))
+                    if title_nodes else None
+                )
+            return self._meeting_from_parts(node, children, text, heading, kommune_name)
         except Exception as e:
             print(f"Feil ved ekstraksjon: {e}")
             return None
 
+    def _meeting_from_parts(
+        self,
+        element,
+        children: List,
+        text: str,
+        heading: Optional[str],
+        kommune_name: str,
+    ) -> Optional[Meeting]:
+        """Felles logikk for bs4- og lxml-elementer; begge har .get() for attributter."""
+        # Korte attributtstrenger (aria-label/title) først; datoen ligger oftest der
+        candidate_texts = []
+        aria = element.get('aria-label')
+        title_attr = element.get('title')
+        if title_attr:
+            candidate_texts.append(title_attr)
+        if aria:
+            candidate_texts.append(aria)
+        for child in children:
+            a = child.get('aria-label')
+            t = child.get('title')
+            if a:
+                candidate_texts.append(a)
+            if t:
+                candidate_texts.append(t)
+        candidate_texts.append(text)
+
+        combined = ' '.join([c for c in candidate_texts if c])
+        if len(combined) < 8:
+            return None
+
+        # Én runde over kandidatene; stopp så snart både dato og tid er funnet
+        meeting_date = None
+        meeting_time = None
+        for cand in candidate_texts:
+            if not cand:
+                continue
+            if not meeting_date:
+                meeting_date = _find_date(_DATE_DMY_OR_WORD_RE, cand, _DATE_DMY_OR_WORD_PRIORITY)
+            if not meeting_time:
+                tm = _find_time_parts(cand)
+                if tm:
+                    meeting_time = self._normalize_time_str(*tm)
+            if meeting_date and meeting_time:
+                break
+
+        if not meeting_date:
+            return None
+
+        title = ''
+        if heading is not None:
+            title = heading
+        else:
+            lines = text.split('\n')
+            for line in lines:
+                line = line.strip()
+                if len(line) > 3 and not _DATE_DOTTED_RE.search(line):
+                    title = line
+                    break
+
+        if title:
+            title = ' '.join(_TITLE_TAIL_RE.sub('', title).split())
+
+        # blacklist common UI text
+        lowt = (title or '').lower()
+        if _BLACKLIST_RE.search(lowt):
+            return None
 
-async def scrape_with_playwright(kommune_urls: List[Dict]) -> List[Dict]:
-    all_meetings: List[Dict] = []
-    async with PlaywrightMoteParser() as parser:
-        for cfg in kommune_urls:
-            name = cfg.get('name')
-            url = cfg.get('url')
-            t = cfg.get('type')
+        location = 'Ikke oppgitt'
+        loc_words = _LOC_RE.findall(text)
+        if loc_words:
+            location = loc_words[0].title()
+
+        return Meeting(
+            title=(title or 'Politisk møte')[:100],
+            date=meeting_date.strftime('%Y-%m-%d'),
+            time=meeting_time,
+            location=location[:50],
+            kommune=kommune_name,
+            raw_text=text[:300],
+        )
+
+
+async def _scrape_kommune(parser: PlaywrightMoteParser, cfg: Dict) -> List[Dict]:
+    name = cfg.get('name')
+    url = cfg.get('url')
+    t = cfg.get('type')
+    try:
+        # Special-case: if this config is for Eigersund, prefer the dedicated parser
+        # which parses the meeting plan table reliably via requests/BeautifulSoup.
+        if name and 'eigersund' in name.lower():
             try:
-                # Special-case: if this config is for Eigersund, prefer the dedicated parser
-                # which parses the meeting plan table reliably via requests/BeautifulSoup.
-                if name and 'eigersund' in name.lower():
-                    try:
-                        from .eigersund_parser import parse_eigersund_meetings
-                        meetings = parse_eigersund_meetings(url, name, days_ahead=10)
-                        all_meetings.extend(meetings)
-                        print(f"\u2705 {name}: {len(meetings)} m\u00f8ter (via eigersund_parser)")
-                        continue
-                    except Exception:
-                        # fallback to Playwright parsing if dedicated parser fails
-                        pass
+                from .eigersund_parser import parse_eigersund_meetings
+                # Blokkerende requests-kall; kjør i tråd så de andre kommunene ikke stopper opp
+                meetings = await asyncio.to_thread(parse_eigersund_meetings, url, name, days_ahead=10)
+                print(f"\u2705 {name}: {len(meetings)} m\u00f8ter (via eigersund_parser)")
+                return meetings
+            except Exception:
+                # fallback to Playwright parsing if dedicated parser fails
+                pass
 
-                if url and 'digdem' in url:
-                    meetings = await parser.scrape_digdem_site(url, name or url)
-                elif t == 'elements':
-                    meetings = await parser.scrape_elements_cloud(url, name)
-                elif t == 'onacos':
-                    meetings = await parser.scrape_onacos_site(url, name)
-                else:
-                    meetings = await parser.scrape_javascript_site(url, name)
+        if url and 'digdem' in url:
+            meetings = await parser.scrape_digdem_site(url, name or url)
+        elif t == 'elements':
+            meetings = await parser.scrape_elements_cloud(url, name)
+        elif t == 'onacos':
+            meetings = await parser.scrape_onacos_site(url, name)
+        else:
+            meetings = await parser.scrape_javascript_site(url, name)
 
-                # If this config is for Eigersund, filter meetings to today..today+10 days
-                try:
-                    if name and 'eigersund' in name.lower():
-                        today = datetime.now().date()
-                        end_date = today + timedelta(days=10)
-                        filt = []
-                        for m in meetings:
-                            try:
-                                md = date.fromisoformat(m['date'])
-                                if today <= md <= end_date:
-                                    filt.append(m)
-                            except Exception:
-                                continue
-                        meetings = filt
-                except Exception:
-                    pass
+        # If this config is for Eigersund, filter meetings to today..today+10 days
+        try:
+            if name and 'eigersund' in name.lower():
+                today = datetime.now().date()
+                end_date = today + timedelta(days=10)
+                filt = []
+                for m in meetings:
+                    try:
+                        md = date.fromisoformat(m['date'])
+                        if today <= md <= end_date:
+                            filt.append(m)
+                    except Exception:
+                        continue
+                meetings = filt
+        except Exception:
+            pass
 
-                all_meetings.extend(meetings)
-                print(f"✅ {name}: {len(meetings)} møter")
-            except Exception as e:
-                print(f"❌ {name}: {e}")
-                continue
-    return all_meetings
+        print(f"✅ {name}: {len(meetings)} møter")
+        return meetings
+    except Exception as e:
+        print(f"❌ {name}: {e}")
+        return []
+
+
+async def _scrape_all(parser: PlaywrightMoteParser, kommune_urls: List[Dict]) -> List[Dict]:
+    # Et lite utvalg parsere, hver med egen kontekst og gjenbrukt side; en kommune
+    # låner en ledig parser, slik at cookies og base-URL ikke deles mellom samtidige kall.
+    spawned: List[PlaywrightMoteParser] = []
+    idle: asyncio.Queue = asyncio.Queue()
+    idle.put_nowait(parser)
+    try:
+        for _ in range(min(KOMMUNE_CONCURRENCY, len(kommune_urls)) - 1):
+            worker = await parser.spawn_worker()
+            spawned.append(worker)
+            idle.put_nowait(worker)
+
+        async def run(cfg: Dict) -> List[Dict]:
+            worker = await idle.get()
+            try:
+                return await _scrape_kommune(worker, cfg)
+            finally:
+                idle.put_nowait(worker)
+
+        results = await asyncio.gather(*(run(cfg) for cfg in kommune_urls))
+    finally:
+        for worker in spawned:
+            await worker.close_context()
+
+    # gather bevarer rekkefølgen i kommune_urls
+    return [meeting for meetings in results for meeting in meetings]
+
+
+async def scrape_with_playwright(
+    kommune_urls: List[Dict],
+    parser: Optional[PlaywrightMoteParser] = None,
+) -> List[Dict]:
+    """Scrape kommunene med Playwright.
+
+    CLI-kall bruker en ny nettleser per kall. Langlivede prosesser kan sende inn en
+    parser startet med ``warm()`` for å slippe Chromium-oppstart hver gang; den
+    lukkes ikke her, men med ``close()`` når prosessen er ferdig.
+    """
+    if not kommune_urls:
+        return []
+    if parser is not None:
+        return await _scrape_all(parser, kommune_urls)
+    async with PlaywrightMoteParser() as owned_parser:
+        return await _scrape_all(owned_parser, kommune_urls)
 
 
 def main():
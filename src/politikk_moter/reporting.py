@@ -11,6 +11,21 @@ from .models import Meeting, ensure_meeting
 
 MeetingInput = Union[Meeting, Mapping[str, object]]
 
+# Norske navn slått opp direkte i stedet for strftime + str.replace per overskrift
+_WEEKDAYS_NO = ('Mandag', 'Tirsdag', 'Onsdag', 'Torsdag', 'Fredag', 'Lørdag', 'Søndag')
+_MONTHS_NO = (
+    'januar', 'februar', 'mars', 'april', 'mai', 'juni',
+    'juli', 'august', 'september', 'oktober', 'november', 'desember',
+)
+
+
+def _format_date_heading(meeting_date: date) -> str:
+    """Return a Norwegian date heading, e.g. 'Fredag 3. oktober 2025'."""
+    return (
+        f"{_WEEKDAYS_NO[meeting_date.weekday()]} {meeting_date.day}. "
+        f"{_MONTHS_NO[meeting_date.month - 1]} {meeting_date.year}"
+    )
+
 
 def format_slack_message(
     meetings: Sequence[MeetingInput],
@@ -26,10 +41,10 @@ def format_slack_message(
     if heading_suffix:
         heading += f" – {heading_suffix}"
 
-    message = f"{heading}\n\n"
+    parts = [f"{heading}\n\n"]
 
     if not normalized:
-        message += "Ingen møter funnet i perioden.\n"
+        parts.append("Ingen møter funnet i perioden.\n")
         normalized_meetings: Sequence[Meeting] = []
     else:
         normalized_meetings = normalized
@@ -37,35 +52,23 @@ def format_slack_message(
     current_date = None
     kommune_counts = defaultdict(int)
     for meeting in normalized_meetings:
-        meeting_date = date.fromisoformat(meeting.date)
-
         # Ny dato-overskrift
         if current_date != meeting.date:
             current_date = meeting.date
-            date_str = meeting_date.strftime('%A %d. %B %Y')
-
-            # Norske dagnavn
-            date_str = date_str.replace('Monday', 'Mandag')
-            date_str = date_str.replace('Tuesday', 'Tirsdag')
-            date_str = date_str.replace('Wednesday', 'Onsdag')
-            date_str = date_str.replace('Thursday', 'Torsdag')
-            date_str = date_str.replace('Friday', 'Fredag')
-            date_str = date_str.replace('Saturday', 'Lørdag')
-            date_str = date_str.replace('Sunday', 'Søndag')
-
-            message += f"\n*{date_str}*\n"
+            date_str = _format_date_heading(date.fromisoformat(meeting.date))
+            parts.append(f"\n*{date_str}*\n")
 
         display_title = f"{meeting.title} ({meeting.kommune})"
         if meeting.url:
             display_title = f"<{meeting.url}|{display_title}>"
 
         if meeting.time:
-            message += f"• {display_title} - kl. {meeting.time}\n"
+            parts.append(f"• {display_title} - kl. {meeting.time}\n")
         else:
-            message += f"• {display_title}\n"
+            parts.append(f"• {display_title}\n")
 
         if meeting.location and meeting.location != "Ikke oppgitt":
-            message += f"  {meeting.location}\n"
+            parts.append(f"  {meeting.location}\n")
 
         kommune_counts[meeting.kommune or 'Ukjent kommune'] += 1
 
@@ -74,7 +77,7 @@ def format_slack_message(
             kommune_counts.setdefault(kommune, 0)
 
     if kommune_counts:
-        message += "\n*Oppsummering per kommune*\n"
+        parts.append("\n*Oppsummering per kommune*\n")
         for kommune in sorted(kommune_counts):
             count = kommune_counts[kommune]
             label = "møte" if count == 1 else "møter"
@@ -84,6 +87,6 @@ def format_slack_message(
                 if url:
                     display_kommune = f"<{url}|{kommune}>"
 
-            message += f"• {display_kommune}: {count} {label}\n"
+            parts.append(f"• {display_kommune}: {count} {label}\n")
 
-    return message
+    return "".join(parts)
@@ -4,18 +4,37 @@
 
 import asyncio
 import html
+import json
 import logging
 import os
+import random
 import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 
 import requests
-from bs4 import BeautifulSoup
-
-from .cli_utils import is_test_mode
+from bs4 import BeautifulSoup, Comment, NavigableString, Tag
+from requests.adapters import HTTPAdapter
+
+try:  # lxml (C) parser er mange ganger raskere enn html.parser på store sider
+    import lxml  # noqa: F401  # pylint: disable=unused-import
+    HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover - faller tilbake til innebygd parser
+    HTML_PARSER = "html.parser"
+
+try:  # orjson serialiserer Slack-payloads raskere; stdlib json brukes ellers
+    import orjson
+except ImportError:  # pragma: no cover - valgfri avhengighet
+    orjson = None
+
+from .cli_utils import is_force_rescrape, is_test_mode, is_truthy_env
+from .http_cache import cached_get_content
 from .kommuner import get_default_kommune_configs, get_kommune_configs
 from .pipeline_config import PipelineConfig, get_pipeline_configs
 from .models import Meeting, ensure_meeting
@@ -54,6 +73,8 @@ except ImportError:
 
 # Konfigurasjon av kilde-URLer (beholder globalt navn for bakoverkompatibilitet i tester)
 KOMMUNE_URLS = get_default_kommune_configs()
+# Oppslag på kommunenavn (små bokstaver), f.eks. KOMMUNE_BY_NAME['eigersund kommune']
+KOMMUNE_BY_NAME = {config['name'].lower(): config for config in KOMMUNE_URLS}
 
 # Import Eigersund parser
 try:
@@ -87,6 +108,27 @@ WEBHOOK_FALLBACK_ENVIRONMENTS = [
 
 SLACK_WEBHOOK_FALLBACK_FLAG_ENV = "SLACK_WEBHOOK_FALLBACK"
 
+# Slack-webhooks tåler omtrent én melding per sekund; raskere sending gir 429
+SLACK_MIN_INTERVAL_SECONDS = 1.0
+# 429/5xx prøves på nytt med "full jitter": tilfeldig ventetid i [0, min(tak, base * 2^forsøk)]
+SLACK_MAX_RETRIES = 3
+SLACK_BACKOFF_BASE_SECONDS = 1.0
+SLACK_BACKOFF_CAP_SECONDS = 30.0
+_last_slack_post = 0.0
+# Én session for alle Slack-poster i prosessen, slik at TLS-tilkoblingen gjenbrukes
+_SLACK_SESSION = requests.Session()
+_SLACK_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Maks antall standard-sider (requests) som hentes samtidig
+REQUEST_CONCURRENCY = 8
+# Maks samtidige hentinger mot samme vert. Mange kommuner deler leverandør
+# (onacos, elementscloud, 360online); de skal ikke få parallelle bølger fra oss.
+REQUEST_CONCURRENCY_PER_HOST = 1
+
+
+def _config_host(config: Mapping[str, object]) -> str:
+    return urlsplit(str(config.get('url') or '')).hostname or ''
+
 _MONTHS_NB = {
     "jan": 1,
     "januar": 1,
@@ -120,6 +162,175 @@ _TIME_HHMM_RE = re.compile(r"(?:kl\.?\s*)?(\d{1,2}):(\d{2})", re.IGNORECASE)
 _TIME_HH_DOT_MM_RE = re.compile(r"(?:kl\.?\s*)(\d{1,2})(?:[\.:](\d{2}))?", re.IGNORECASE)
 _TIME_KLOKKA_RE = re.compile(r"(?:klokka)\s*(\d{1,2})", re.IGNORECASE)
 
+# Klasse-/href-filtre som CSS-selektorer (soupsieve) i stedet for regex mot hver
+# klasseverdi; [attr*=x i] gir samme "inneholder, uten hensyn til store bokstaver".
+_MOTE_ROWS_CSS = ', '.join(
+    f'{tag}[class*="{word}" i]' for tag in ('tr', 'div') for word in ('møte', 'row')
+)
+_MEETING_ROWS_CSS = ', '.join(
+    f'{tag}[class*="{word}" i]' for tag in ('tr', 'div') for word in ('møte', 'meeting', 'row')
+)
+_MEETING_LINKS_CSS = 'a[href*="møte" i], a[href*="meeting" i]'
+# Elementtyper parse_acos_site plukker ut når teksten deres inneholder en dato
+_DATE_SECTION_TAGS = frozenset(('p', 'div', 'li', 'td'))
+# Møte-div-er i parse_acos_site: klasseverdien (samlet) inneholder et av ordene
+_MEETING_RESULT_CLASS_RE = re.compile(r'møte|meeting|resultat', re.IGNORECASE)
+
+# Forhåndskompilerte mønstre for MoteParser; brukes per element på store sider
+_DATE_IN_TEXT_RE = re.compile(r'\d{1,2}\.\d{1,2}\.202[4-6]')
+_DATE_DOTTED_RE = re.compile(r'\d{1,2}\.\d{1,2}\.\d{4}')
+_DATE_ANY_SEP_RE = re.compile(r"(\d{1,2}[\.\-/]\d{1,2}[\.\-/]\d{2,4})")
+_DAY_ONLY_RE = re.compile(r'^\d{1,2}$')
+_DAY_NUMBER_RE = re.compile(r'\d{1,2}')
+_KL_RE = re.compile(r'kl\.?', re.I)
+_WHITESPACE_RE = re.compile(r"\s+")
+_LETTER_RE = re.compile(r"[A-Za-zÆØÅæøå]")
+_CLOCK_RE = re.compile(r"\d{1,2}[:\.]\d{2}")
+_LONG_NUMBER_ONLY_RE = re.compile(r"\d{6,}")
+_NUMERIC_TITLE_RE = re.compile(r'^[0-9\s\+\-]+$')
+_TRAILING_PAREN_RE = re.compile(r"\s*\([^)]*\)\s*$")
+_STED_RE = re.compile(r'(?:Sted|Stad):\s*([^\n]+)', re.IGNORECASE)
+
+# Tittel-opprydding i _extract_meeting_from_element
+_TITLE_DATE_TAIL_RE = re.compile(r'\d{1,2}\.\d{1,2}\.\d{4}.*')
+_TITLE_TIME_TAIL_RE = re.compile(r'kl\.?\s*\d{1,2}:\d{2}.*')
+_TITLE_PREFIX_RE = re.compile(r'^(Møte i |Møte |Meeting )', re.I)
+_TITLE_CALENDAR_NOISE_RE = re.compile(
+    r'(mandagtirsdagonsdagtorsdagfredaglørdagsøndag|MøtekalenderFor|I dagForrigeNeste)', re.I
+)
+_TITLE_LONG_NUMBER_RE = re.compile(r'\d{8,}')
+_TITLE_MORE_MEETINGS_RE = re.compile(r'\+\d+\s*møter', re.I)
+_TITLE_DUP_UTVALG_RE = re.compile(r'(utvalg){2,}', re.I)
+_TITLE_BLACKLIST_RE = re.compile(
+    r'søk etter møte|resultatside med møter|søk etter møter|resultatside|møtekalender|vis flere'
+)
+# Sted-indikatorer på norsk og nynorsk, i prioritert rekkefølge
+_LOCATION_RES = (
+    re.compile(r'(?:Sted|Stad|Møtested|Møtestad):\s*([^,\n\r]+)', re.IGNORECASE),
+    re.compile(r'(?:Lokale|Sal|Rom):\s*([^,\n\r]+)', re.IGNORECASE),
+    re.compile(r'(?:Adresse):\s*([^,\n\r]+)', re.IGNORECASE),
+)
+_LOCATION_WORD_RE = re.compile(
+    r'\b(?:kommunestyresalen|formannskapssalen|rådhuset|møterom|kommunehuset)\b', re.IGNORECASE
+)
+
+# opengov.360online.com: regex-fallback når soup ikke finner board-lenkene
+_OPENGOV_TITLE_PAREN_RE = re.compile(r'\(.*?\)$')
+_OPENGOV_TITLE_DATE_RE = re.compile(r'\s+\d{1,2}[\.\-]\d{1,2}[\.\-]\d{2,4}.*')
+_OPENGOV_TITLE_TIME_RE = re.compile(r'\s*kl\.?\s*\d{1,2}[:\. ]\d{2}', re.IGNORECASE)
+_OPENGOV_BOARD_RE = re.compile(
+    r'<li[^>]*class="[^"]*boardLink[^"]*"[^>]*>\s*'
+    r'<a[^>]*href="(?P<href>[^"]+)"[^>]*>.*?'
+    r'<div[^>]*class="meetingName"[^>]*>\s*<span>(?P<name>.*?)</span>.*?'
+    r'<div[^>]*class="meetingDate"[^>]*>\s*<span>(?P<date>\d{1,2}[\.\-]\d{1,2}[\.\-]\d{4})</span>'
+    r'(?:\s*<span>(?P<time>[0-9:\.]+)</span>)?',
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Taggene parse_custom_site vurderer, og hvilken bøtte (rekkefølge) de hører til
+_CUSTOM_TAG_BUCKETS = {
+    **dict.fromkeys(('div', 'article', 'section', 'li', 'tr'), 0),
+    **dict.fromkeys(('h1', 'h2', 'h3', 'h4', 'h5', 'h6'), 1),
+    **dict.fromkeys(('p', 'span'), 2),
+}
+
+
+# Nøstede elementer (h4 i div i article) gir de samme kandidat-tekstene gang på
+# gang; resultatet avhenger bare av strengen, så det caches.
+@lru_cache(maxsize=4096)
+def _parse_date_text(text: str) -> Optional[datetime]:
+    """Se MoteParser.parse_date_from_text."""
+    # 1) dd.mm.yyyy eller dd/mm/yyyy eller dd-mm-yyyy eller dd.mm.yy
+    m = _DATE_DMY_RE.search(text)
+    if m:
+        day, month, year = m.groups()
+        y = int(year)
+        if y < 100:  # to-sifret år
+            y += 2000
+        try:
+            return datetime(y, int(month), int(day))
+        except ValueError:
+            pass
+
+    # 2) Dag månednavn år (eks. 20. august 2025 eller 20 august 2025)
+    m2 = _DATE_MONTHNAME_RE.search(text)
+    if m2:
+        day = int(m2.group(1))
+        mon_str = m2.group(2).lower().rstrip('.')
+        year = int(m2.group(3))
+        mon = _MONTHS_NB.get(mon_str[:3]) or _MONTHS_NB.get(mon_str)
+        if mon:
+            try:
+                return datetime(year, mon, day)
+            except ValueError:
+                pass
+
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_time_text(text: str) -> Optional[str]:
+    """Se MoteParser.parse_time_from_text."""
+    # Foretrekk tider med kolon eller 'kl' prefiks; unngå å tolke dd.mm som tid
+    m = _TIME_HHMM_RE.search(text)
+    if m:
+        h, mi = m.groups()
+        try:
+            hh = int(h)
+            mm = int(mi)
+            if 0 <= hh < 24 and 0 <= mm < 60:
+                return f"{hh:02d}:{mm:02d}"
+        except ValueError:
+            pass
+    m = _TIME_HH_DOT_MM_RE.search(text)
+    if m:
+        h, mi = m.groups()
+        minute = mi or '00'
+        try:
+            hh = int(h)
+            mm = int(minute)
+            if 0 <= hh < 24 and 0 <= mm < 60:
+                return f"{hh:02d}:{mm:02d}"
+        except ValueError:
+            pass
+    m = _TIME_KLOKKA_RE.search(text)
+    if m:
+        h = m.group(1)
+        try:
+            hh = int(h)
+            if 0 <= hh < 24:
+                return f"{hh:02d}:00"
+        except ValueError:
+            pass
+    return None
+
+
+def _descendant_label_texts(element: Tag) -> List[str]:
+    """aria-label/title fra alle etterkommere, i dokumentrekkefølge.
+
+    Går rett over ``descendants`` og leser attrs-dict-en; raskere enn
+    find_all(True) + get() siden de fleste noder ikke har attributter.
+    """
+    texts: List[str] = []
+    for child in element.descendants:
+        if not isinstance(child, Tag) or not child.attrs:
+            continue
+        attrs = child.attrs
+        aria = attrs.get('aria-label')
+        title = attrs.get('title')
+        if aria:
+            texts.append(aria)
+        if title:
+            texts.append(title)
+    return texts
+
+
+def _has_date_token(text: Optional[str]) -> bool:
+    """Rask forsjekk: kan parse_date_from_text finne en dato i teksten?"""
+    if not text:
+        return False
+    return bool(_DATE_DMY_RE.search(text) or _DATE_MONTHNAME_RE.search(text))
+
 
 def _requires_playwright_for_config(config: Mapping[str, object]) -> bool:
     """Return True when a kommune config needs Playwright to render meeting data."""
@@ -145,12 +356,6 @@ def _requires_playwright_for_config(config: Mapping[str, object]) -> bool:
     )
 
 
-def _is_truthy_env(env_name: str) -> bool:
-    """Return True when env var exists with a truthy value."""
-    value = os.getenv(env_name, "").strip().lower()
-    return value in {"1", "true", "yes", "on"}
-
-
 def _expected_kommuner_by_batch(pipeline: PipelineConfig) -> Dict[str, List[str]]:
     """Return expected kommune names per Slack batch for summaries."""
     kommune_configs = get_kommune_configs(pipeline.kommune_groups)
@@ -205,7 +410,7 @@ def _resolve_slack_webhook(env_name: str) -> Tuple[Optional[str], str, bool]:
         fallback for fallback in WEBHOOK_FALLBACK_ENVIRONMENTS if fallback not in candidates
     )
 
-    allow_fallback = _is_truthy_env(SLACK_WEBHOOK_FALLBACK_FLAG_ENV)
+    allow_fallback = is_truthy_env(SLACK_WEBHOOK_FALLBACK_FLAG_ENV)
 
     for candidate in candidates:
         if candidate != env_name and not allow_fallback:
@@ -221,124 +426,93 @@ class MoteParser:
     
     def __init__(self):
         self.session = requests.Session()
+        # Nok tilkoblinger i poolen til at samtidige hentinger ikke venter på hverandre
+        adapter = HTTPAdapter(pool_connections=REQUEST_CONCURRENCY, pool_maxsize=REQUEST_CONCURRENCY)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
 
+    def _fetch_content(self, url: str, timeout: float) -> bytes:
+        """Hent siden som bytes via sesjonen; HTTP-feil løftes som ``requests.HTTPError``.
+
+        Med MOTEPLAN_HTTP_CACHE satt gir uendrede kommunesider lokale treff eller
+        304 i stedet for full nedlasting. Tegnsettet bestemmes av parseren, slik at
+        resultatet er det samme med og uten cache.
+        """
+        return cached_get_content(url, timeout=timeout, session=self.session, force=is_force_rescrape())
+
     def parse_date_from_text(self, text: str) -> Optional[datetime]:
         """Prøver flere dato-formater i tekst (dd.mm.yyyy, dd.mm.yy, dd month yyyy)."""
         if not text:
             return None
-
-        # 1) dd.mm.yyyy eller dd/mm/yyyy eller dd-mm-yyyy eller dd.mm.yy
-        m = _DATE_DMY_RE.search(text)
-        if m:
-            day, month, year = m.groups()
-            y = int(year)
-            if y < 100:  # to-sifret år
-                y += 2000
-            try:
-                return datetime(y, int(month), int(day))
-            except ValueError:
-                pass
-
-        # 2) Dag månednavn år (eks. 20. august 2025 eller 20 august 2025)
-        m2 = _DATE_MONTHNAME_RE.search(text)
-        if m2:
-            day = int(m2.group(1))
-            mon_str = m2.group(2).lower().rstrip('.')
-            year = int(m2.group(3))
-            mon = _MONTHS_NB.get(mon_str[:3]) or _MONTHS_NB.get(mon_str)
-            if mon:
-                try:
-                    return datetime(year, mon, day)
-                except ValueError:
-                    pass
-
-        return None
+        return _parse_date_text(text)
 
     def parse_time_from_text(self, text: str) -> Optional[str]:
         """Prøver flere tid-formater (kl. hh:mm, hh:mm, hh.mm). Returnerer 'HH:MM' eller None."""
         if not text:
             return None
-        # Foretrekk tider med kolon eller 'kl' prefiks; unngå å tolke dd.mm som tid
-        m = _TIME_HHMM_RE.search(text)
-        if m:
-            h, mi = m.groups()
-            try:
-                hh = int(h)
-                mm = int(mi)
-                if 0 <= hh < 24 and 0 <= mm < 60:
-                    return f"{hh:02d}:{mm:02d}"
-            except ValueError:
-                pass
-        m = _TIME_HH_DOT_MM_RE.search(text)
-        if m:
-            h, mi = m.groups()
-            minute = mi or '00'
-            try:
-                hh = int(h)
-                mm = int(minute)
-                if 0 <= hh < 24 and 0 <= mm < 60:
-                    return f"{hh:02d}:{mm:02d}"
-            except ValueError:
-                pass
-        m = _TIME_KLOKKA_RE.search(text)
-        if m:
-            h = m.group(1)
-            try:
-                hh = int(h)
-                if 0 <= hh < 24:
-                    return f"{hh:02d}:00"
-            except ValueError:
-                pass
-        return None
+        return _parse_time_text(text)
     
     def parse_acos_site(self, url: str, kommune_name: str) -> List[Dict]:
         """Parser for ACOS-baserte innsyn-sider."""
         try:
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            content = self._fetch_content(url, timeout=15)
+            soup = BeautifulSoup(content, HTML_PARSER)
             
             meetings = []
             
-            # Forbedret søk etter møte-elementer
-            # 1. Søk etter h4-tags som ofte inneholder møtetitler
-            h4_elements = soup.find_all('h4')
-            
-            # 2. Søk etter div-er med møte-relaterte klasser
-            meeting_divs = soup.find_all('div', class_=re.compile(r'.*møte.*|.*meeting.*|.*resultat.*', re.I))
-            
-            # 3. Søk etter article-tags
-            articles = soup.find_all('article')
-            
-            # 4. Søk etter elementer som inneholder datoformater
-            date_sections = []
-            
-            # Finn alle paragrafer eller div-er som inneholder datoer
-            for element in soup.find_all(['p', 'div', 'li', 'td']):
-                text = element.get_text(strip=True)
-                if re.search(r'\d{1,2}\.\d{1,2}\.202[4-6]', text):
-                    date_sections.append(element)
+            # Ett gjennomløp av treet fyller alle kandidatlistene i dokumentrekkefølge:
+            # 1. h4-tags som ofte inneholder møtetitler
+            # 2. div-er med møte-relaterte klasser
+            # 3. article-tags
+            # 4. p/div/li/td som inneholder datoformater; tekstnodene som matcher
+            #    merker forfedrene sine, i stedet for get_text() på hvert element
+            h4_elements = []
+            meeting_divs = []
+            articles = []
+            section_candidates = []
+            dated = set()
+            for node in soup.descendants:
+                if isinstance(node, Tag):
+                    name = node.name
+                    if name == 'h4':
+                        h4_elements.append(node)
+                    elif name == 'article':
+                        articles.append(node)
+                    elif name == 'div' and _MEETING_RESULT_CLASS_RE.search(' '.join(node.get('class') or ())):
+                        meeting_divs.append(node)
+                    if name in _DATE_SECTION_TAGS:
+                        section_candidates.append(node)
+                elif isinstance(node, NavigableString) and not isinstance(node, Comment):
+                    if node.parent.name in ('script', 'style') or not _DATE_IN_TEXT_RE.search(node):
+                        continue
+                    for parent in node.parents:
+                        if parent.name in _DATE_SECTION_TAGS:
+                            dated.add(id(parent))
+            date_sections = [el for el in section_candidates if id(el) in dated]
             
             all_elements = h4_elements + meeting_divs + articles + date_sections
             
+            # En møte-div med dato havner både i meeting_divs og date_sections;
+            # samme element gir samme resultat, så det ekstraheres bare én gang.
+            processed = set()
+            # Duplikater (dato + tittel) forkastes med en gang de dukker opp
+            seen = set()
             for element in all_elements:
+                if id(element) in processed:
+                    continue
+                processed.add(id(element))
                 meeting = self._extract_meeting_from_element(element, kommune_name)
-                if meeting:
-                    meetings.append(meeting)
-            
-            # Fjern duplikater basert på dato + tittel
-            unique_meetings = []
-            seen = set()
-            for meeting in meetings:
+                if not meeting:
+                    continue
                 key = (meeting['date'], meeting['title'].lower())
                 if key not in seen:
                     seen.add(key)
-                    unique_meetings.append(meeting)
+                    meetings.append(meeting)
             
-            return unique_meetings
+            return meetings
             
         except requests.exceptions.RequestException:
             logger.exception("Feil ved henting av %s", kommune_name)
@@ -359,9 +533,8 @@ class MoteParser:
             except Exception:
                 # non-fatal: fall through to generic parsing
                 pass
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            content = self._fetch_content(url, timeout=10)
+            soup = BeautifulSoup(content, HTML_PARSER)
             
             meetings = []
             # Onacos pages often use a calendar table: months as header cells across
@@ -411,11 +584,16 @@ class MoteParser:
                         # Find all day links in this cell
                         for a in cell.find_all('a'):
                             day_text = a.get_text(strip=True)
-                            if not re.match(r'^\d{1,2}$', day_text):
+                            if not _DAY_ONLY_RE.match(day_text):
                                 # Sometimes links contain multiple days separated by comma
-                                parts = re.findall(r'\d{1,2}', day_text)
+                                parts = _DAY_NUMBER_RE.findall(day_text)
                             else:
                                 parts = [day_text]
+                            if not parts:
+                                continue
+                            # Lenke-URL og råtekst er like for alle dagene i lenken
+                            link_url = urljoin(url, a.get('href') or '')
+                            raw_text = day_text[:300]
                             for part in parts:
                                 day = int(part)
                                 # Construct date; handle year rollover if we are late in the year.
@@ -433,14 +611,14 @@ class MoteParser:
                                     'time': None,
                                     'location': 'Ikke oppgitt',
                                     'kommune': kommune_name,
-                                    'raw_text': a.get_text(strip=True)[:300],
-                                    'url': urljoin(url, a.get('href') or '')
+                                    'raw_text': raw_text,
+                                    'url': link_url,
                                 }
                                 meetings.append(meeting)
                 return meetings
 
             # Fallback: previous generic scraping
-            meeting_elements = soup.find_all(['tr', 'div'], class_=re.compile(r'.*møte.*|.*row.*', re.I))
+            meeting_elements = soup.select(_MOTE_ROWS_CSS)
             for element in meeting_elements:
                 meeting = self._extract_meeting_from_element(element, kommune_name)
                 if meeting:
@@ -458,18 +636,17 @@ class MoteParser:
     def parse_elements_site(self, url: str, kommune_name: str) -> List[Dict]:
         """Parser for Elements Cloud-baserte sider."""
         try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            content = self._fetch_content(url, timeout=10)
+            soup = BeautifulSoup(content, HTML_PARSER)
             
             meetings = []
             
             # Elements Cloud har ofte JavaScript-generert innhold
             # Vi leter etter møte-tabeller eller strukturert data
-            meeting_rows = soup.find_all(['tr', 'div'], class_=re.compile(r'.*møte.*|.*meeting.*|.*row.*', re.I))
+            meeting_rows = soup.select(_MEETING_ROWS_CSS)
             
             # Alternativ: søk etter alle lenker med møte-relaterte ord
-            meeting_links = soup.find_all('a', href=re.compile(r'.*møte.*|.*meeting.*', re.I))
+            meeting_links = soup.select(_MEETING_LINKS_CSS)
             
             all_elements = meeting_rows + meeting_links
             
@@ -490,12 +667,10 @@ class MoteParser:
     def parse_custom_site(self, url: str, kommune_name: str) -> List[Dict]:
         """Parser for custom sider som Bymiljøpakken."""
         try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            html_text = getattr(response, 'text', None)
-            if html_text is None and response.content:
-                html_text = response.content.decode('utf-8', errors='ignore')
+            content = self._fetch_content(url, timeout=10)
+            soup = BeautifulSoup(content, HTML_PARSER)
+            # Samme tegnsett som BeautifulSoup fant (header-uavhengig, også fra cache)
+            html_text = content.decode(soup.original_encoding or 'utf-8', errors='replace') if content else ''
 
             if 'klepp' in kommune_name.lower():
                 return self._parse_klepp_meetings(soup, url, kommune_name)
@@ -509,6 +684,8 @@ class MoteParser:
                 return self._parse_bymiljopakken(soup, url, kommune_name)
 
             meetings = []
+            # Dedupliser basert på dato og tittel allerede ved innsetting
+            seen = set()
             
             # Special-case: Hå kommune bruker en enkel side-layout som kan
             # listes ut med klare dato-/tidsblokker. Implementer en lettvekts-
@@ -530,14 +707,18 @@ class MoteParser:
                         line = line.strip()
                         if not line:
                             continue
-                        if re.search(r'\d{1,2}[\.\-/]\d{1,2}[\.\-/]\d{2,4}', line):
+                        if _DATE_ANY_SEP_RE.search(line):
                             continue
-                        if re.search(r'kl\.?', line, re.I):
+                        if _KL_RE.search(line):
                             continue
                         title = line
                         break
                     if not title:
                         title = 'Politisk møte'
+                    key = (parsed_date.strftime('%Y-%m-%d'), title)
+                    if key in seen:
+                        continue
+                    seen.add(key)
                     meetings.append({
                         'title': title,
                         'date': parsed_date.strftime('%Y-%m-%d'),
@@ -547,39 +728,51 @@ class MoteParser:
                         'url': url,
                         'raw_text': text[:300],
                     })
-                # Deduplicate and return if we found items
                 if meetings:
-                    unique = []
-                    seen = set()
-                    for m in meetings:
-                        key = (m['date'], m['title'])
-                        if key not in seen:
-                            seen.add(key)
-                            unique.append(m)
-                    return unique
+                    return meetings
 
             # For Bymiljøpakken og lignende - søk bredt
             # Alle elementer som kan inneholde møteinfo
-            all_elements = []
-            all_elements.extend(soup.find_all(['div', 'article', 'section', 'li', 'tr']))
-            all_elements.extend(soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']))
-            all_elements.extend(soup.find_all(['p', 'span']))
-            
+            # Ett gjennomløp av treet; bøttene beholder rekkefølgen fra de tidligere
+            # find_all-kallene (blokker, deretter overskrifter, deretter p/span).
+            buckets: List[List] = [[], [], []]
+            for element in soup.find_all(True):
+                bucket = _CUSTOM_TAG_BUCKETS.get(element.name)
+                if bucket is not None:
+                    buckets[bucket].append(element)
+            all_elements = [element for bucket in buckets for element in bucket]
+
+            # _extract_meeting_from_element gir bare treff når teksten eller en
+            # aria-label/title i elementet (eller et barn) har en dato. Merk forfedrene
+            # til datobærende attributter én gang, og hopp over rene layout-elementer.
+            attr_dated = set()
+            for tagged in soup.select('[aria-label], [title]'):
+                if _has_date_token(tagged.get('aria-label')) or _has_date_token(tagged.get('title')):
+                    attr_dated.add(id(tagged))
+                    attr_dated.update(id(parent) for parent in tagged.parents)
+            # En dato i teksten krever minst ett siffer; tekstnoder med siffer merker
+            # forfedrene, så get_text() bare bygges for elementer som kan ha en dato
+            has_digits = set()
+            for string in soup.find_all(string=_DAY_NUMBER_RE):
+                for parent in string.parents:
+                    if id(parent) in has_digits:
+                        break
+                    has_digits.add(id(parent))
+
             for element in all_elements:
+                if id(element) not in attr_dated and (
+                    id(element) not in has_digits or not _has_date_token(element.get_text(strip=True))
+                ):
+                    continue
                 meeting = self._extract_meeting_from_element(element, kommune_name)
-                if meeting:
-                    meetings.append(meeting)
-            
-            # Dedupliser basert på dato og tittel
-            unique_meetings = []
-            seen = set()
-            for meeting in meetings:
+                if not meeting:
+                    continue
                 key = (meeting['date'], meeting['title'])
                 if key not in seen:
                     seen.add(key)
-                    unique_meetings.append(meeting)
+                    meetings.append(meeting)
             
-            return unique_meetings
+            return meetings
             
         except requests.exceptions.RequestException:
             logger.exception("Feil ved henting av %s", kommune_name)
@@ -600,7 +793,7 @@ class MoteParser:
                 continue
 
             raw_title = meeting_name.get_text(' ', strip=True)
-            title = re.sub(r"\s*\([^)]*\)\s*$", "", raw_title).strip()
+            title = _TRAILING_PAREN_RE.sub("", raw_title).strip()
             if not title:
                 continue
 
@@ -650,7 +843,7 @@ class MoteParser:
         """Bruk BeautifulSoup (med regex-fallback) for opengov.360online.com."""
 
         meetings: List[Dict] = []
-        soup = BeautifulSoup(html_text or "", "html.parser")
+        soup = BeautifulSoup(html_text or "", HTML_PARSER)
 
         def _append_meeting(title: str, date_str: str, time_str: Optional[str], href: str, raw: str) -> None:
             parsed_date = self.parse_date_from_text(date_str) or self.parse_date_from_text(title)
@@ -661,9 +854,9 @@ class MoteParser:
                 normalized_time = self.parse_time_from_text(title)
 
             clean_title = title.strip()
-            clean_title = re.sub(r'\(.*?\)$', '', clean_title).strip()
-            clean_title = re.sub(r'\s+\d{1,2}[\.\-]\d{1,2}[\.\-]\d{2,4}.*', '', clean_title).strip(' -:')
-            clean_title = re.sub(r'\s*kl\.?\s*\d{1,2}[:\. ]\d{2}', '', clean_title, flags=re.IGNORECASE).strip()
+            clean_title = _OPENGOV_TITLE_PAREN_RE.sub('', clean_title).strip()
+            clean_title = _OPENGOV_TITLE_DATE_RE.sub('', clean_title).strip(' -:')
+            clean_title = _OPENGOV_TITLE_TIME_RE.sub('', clean_title).strip()
             if not clean_title:
                 clean_title = title or "Politisk møte"
 
@@ -699,16 +892,7 @@ class MoteParser:
                 _append_meeting(raw_title or "Politisk møte", explicit_date or "", explicit_time, href, li.get_text(" ", strip=True))
 
         if not meetings:
-            pattern = re.compile(
-                r'<li[^>]*class="[^"]*boardLink[^"]*"[^>]*>\s*'
-                r'<a[^>]*href="(?P<href>[^"]+)"[^>]*>.*?'
-                r'<div[^>]*class="meetingName"[^>]*>\s*<span>(?P<name>.*?)</span>.*?'
-                r'<div[^>]*class="meetingDate"[^>]*>\s*<span>(?P<date>\d{1,2}[\.\-]\d{1,2}[\.\-]\d{4})</span>'
-                r'(?:\s*<span>(?P<time>[0-9:\.]+)</span>)?',
-                re.IGNORECASE | re.DOTALL,
-            )
-
-            for match in pattern.finditer(html_text or ""):
+            for match in _OPENGOV_BOARD_RE.finditer(html_text or ""):
                 href = html.unescape(match.group("href") or "").strip()
                 raw_title = html.unescape(match.group("name") or "").strip()
                 explicit_time = (match.group("time") or "").replace(".", ":")
@@ -753,7 +937,7 @@ class MoteParser:
             title_el = next_block.find('h3')
             title = title_el.get_text(' ', strip=True) if title_el else 'Neste møte'
             text_blob = next_block.get_text(' ', strip=True)
-            location_match = re.search(r'(?:Sted|Stad):\s*([^\n]+)', text_blob, re.IGNORECASE)
+            location_match = _STED_RE.search(text_blob)
             location = location_match.group(1).strip() if location_match else None
             append_meeting(title, text_blob, base_url, location)
 
@@ -774,18 +958,28 @@ class MoteParser:
 
         return unique
     
+    def _date_from_candidates(self, candidate_texts: Sequence[str]) -> Tuple[Optional[datetime], Optional[str]]:
+        """Dato (og tid fra samme tekst) fra første kandidat-tekst som har en dato."""
+        for cand in candidate_texts:
+            if not cand:
+                continue
+            md = self.parse_date_from_text(cand)
+            if md:
+                return md, self.parse_time_from_text(cand)
+        return None, None
+
     def _extract_meeting_from_element(self, element, kommune_name: str) -> Optional[Dict]:
         """Ekstraherer møteinfo fra HTML-element."""
         try:
             text = element.get_text(strip=True)
             if text:
                 # Hopp over elementer som kun inneholder dato/tid (f.eks. separate kolonner i Sandnes-visningen)
-                alnum_text = re.sub(r"\s+", "", text)
-                if not re.search(r"[A-Za-zÆØÅæøå]", text):
+                alnum_text = _WHITESPACE_RE.sub("", text)
+                if not _LETTER_RE.search(text):
                     # Støtte for format som 02.10.2025 16:00 eller 02.10.202516:00
-                    if re.search(r"\d{1,2}[\.\-/]\d{1,2}[\.\-/]\d{2,4}", text) and re.search(r"\d{1,2}[:\.]\d{2}", text):
+                    if _DATE_ANY_SEP_RE.search(text) and _CLOCK_RE.search(text):
                         return None
-                    if re.fullmatch(r"\d{6,}", alnum_text):
+                    if _LONG_NUMBER_ONLY_RE.fullmatch(alnum_text):
                         return None
 
             # Bygg liste av kandidat-tekster: synlig tekst + aria-label/title fra element og barn
@@ -793,41 +987,25 @@ class MoteParser:
             try:
                 aria = element.get('aria-label')
                 title_attr = element.get('title')
-            except Exception:
+            except AttributeError:
                 aria = None
                 title_attr = None
             if aria:
                 candidate_texts.insert(0, aria)
             if title_attr:
                 candidate_texts.insert(0, title_attr)
-            # child attributes
-            for child in element.find_all(True):
-                try:
-                    a = child.get('aria-label')
-                    t = child.get('title')
-                except Exception:
-                    a = None
-                    t = None
-                if a:
-                    candidate_texts.append(a)
-                if t:
-                    candidate_texts.append(t)
-
-            # Ignorer for korte synlige tekster hvis vi har andre kandidater
-            if len(text) < 5 and all(len(c.strip()) < 5 for c in candidate_texts):
-                return None
 
-            # Parse dato og tid ved å prøve kandidat-tekstene
-            meeting_date = None
-            meeting_time = None
-            for cand in candidate_texts:
-                if not cand:
-                    continue
-                md = self.parse_date_from_text(cand)
-                if md:
-                    meeting_date = md
-                    meeting_time = self.parse_time_from_text(cand) or meeting_time
-                    break
+            # Parse dato og tid ved å prøve kandidat-tekstene; barnas attributter
+            # hentes bare når elementets egne tekster ikke har en dato (en dato er
+            # lengre enn 5 tegn, så sjekken for korte tekster under slår ikke inn da)
+            meeting_date, meeting_time = self._date_from_candidates(candidate_texts)
+            if not meeting_date:
+                child_texts = _descendant_label_texts(element)
+
+                # Ignorer for korte synlige tekster hvis vi har andre kandidater
+                if len(text) < 5 and all(len(c.strip()) < 5 for c in candidate_texts + child_texts):
+                    return None
+                meeting_date, meeting_time = self._date_from_candidates(child_texts)
 
             if not meeting_date:
                 return None
@@ -837,7 +1015,7 @@ class MoteParser:
             
             # 1. Prøv å finne tittel i element selv
             if element.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                title = element.get_text(strip=True)
+                title = text
             else:
                 # 2. Søk etter tittel i child-elementer
                 title_element = element.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'strong', 'b'])
@@ -848,35 +1026,35 @@ class MoteParser:
                     lines = text.split('\n')
                     for line in lines:
                         line = line.strip()
-                        if len(line) > 3 and not re.search(r'\d{1,2}\.\d{1,2}\.\d{4}', line):
+                        if len(line) > 3 and not _DATE_DOTTED_RE.search(line):
                             title = line
                             break
             
             # Rens opp tittel
             if title:
-                title = re.sub(r'\d{1,2}\.\d{1,2}\.\d{4}.*', '', title).strip()
-                title = re.sub(r'kl\.?\s*\d{1,2}:\d{2}.*', '', title).strip()
-                title = re.sub(r'\s+', ' ', title)  # Normaliser whitespace
+                title = _TITLE_DATE_TAIL_RE.sub('', title).strip()
+                title = _TITLE_TIME_TAIL_RE.sub('', title).strip()
+                title = _WHITESPACE_RE.sub(' ', title)  # Normaliser whitespace
                 
                 # Fjern vanlige suffixer/prefixes
-                title = re.sub(r'^(Møte i |Møte |Meeting )', '', title, flags=re.I)
+                title = _TITLE_PREFIX_RE.sub('', title)
                 
                 # Fjern kalender-relaterte ord og navigasjon
-                title = re.sub(r'(mandagtirsdagonsdagtorsdagfredaglørdagsøndag|MøtekalenderFor|I dagForrigeNeste)', '', title, flags=re.I)
-                title = re.sub(r'\d{8,}', '', title)  # Fjern lange tall-sekvenser
-                title = re.sub(r'\+\d+\s*møter', '', title, flags=re.I)  # Fjern "+2 møter" osv
-                title = re.sub(r'(utvalg){2,}', 'utvalg', title, flags=re.I)  # Fjern dupliserte "utvalg"
+                title = _TITLE_CALENDAR_NOISE_RE.sub('', title)
+                title = _TITLE_LONG_NUMBER_RE.sub('', title)  # Fjern lange tall-sekvenser
+                title = _TITLE_MORE_MEETINGS_RE.sub('', title)  # Fjern "+2 møter" osv
+                title = _TITLE_DUP_UTVALG_RE.sub('utvalg', title)  # Fjern dupliserte "utvalg"
                 
                 # Trim og rens opp igjen
-                title = re.sub(r'\s+', ' ', title).strip()
+                title = _WHITESPACE_RE.sub(' ', title).strip()
                 
                 # Hvis tittelen er for kort eller rar, bruk en generisk tittel
-                if len(title) < 3 or re.match(r'^[0-9\s\+\-]+$', title):
+                if len(title) < 3 or _NUMERIC_TITLE_RE.match(title):
                     title = "Politisk møte"
             
             if not title or len(title) < 3:
                 # Siste forsøk: bruk tekst før første dato i teksten
-                m_first = re.search(r"(\d{1,2}[\.\-/]\d{1,2}[\.\-/]\d{2,4})", text)
+                m_first = _DATE_ANY_SEP_RE.search(text)
                 if m_first:
                     before_date = text.split(m_first.group(0))[0].strip()
                     if before_date and len(before_date) > 3:
@@ -890,30 +1068,20 @@ class MoteParser:
             location = "Ikke oppgitt"
 
             # Filtrer bort generiske/utility-tekster som ikke er ekte møter
-            blacklist_patterns = [
-                r'søk etter møte', r'resultatside med møter', r'søk etter møter', r'resultatside', r'møtekalender', r'vis flere'
-            ]
             lowertitle = title.lower() if title else ''
-            for bp in blacklist_patterns:
-                if re.search(bp, lowertitle):
-                    return None
+            if _TITLE_BLACKLIST_RE.search(lowertitle):
+                return None
             
             # Søk etter sted-indikatorer på norsk og nynorsk
-            location_patterns = [
-                r'(?:Sted|Stad|Møtested|Møtestad):\s*([^,\n\r]+)',
-                r'(?:Lokale|Sal|Rom):\s*([^,\n\r]+)',
-                r'(?:Adresse):\s*([^,\n\r]+)'
-            ]
-            
-            for pattern in location_patterns:
-                location_match = re.search(pattern, text, re.IGNORECASE)
+            for pattern in _LOCATION_RES:
+                location_match = pattern.search(text)
                 if location_match:
                     location = location_match.group(1).strip()
                     break
             
             # Hvis ingen eksplisitt sted, søk etter vanlige møtested-ord
             if location == "Ikke oppgitt":
-                location_words = re.findall(r'\b(?:kommunestyresalen|formannskapssalen|rådhuset|møterom|kommunehuset)\b', text, re.IGNORECASE)
+                location_words = _LOCATION_WORD_RE.findall(text)
                 if location_words:
                     location = location_words[0].title()
             
@@ -935,49 +1103,28 @@ def scrape_all_meetings(
     calendar_sources: Optional[Sequence[str]] = None,
     *,
     days_ahead: int = 10,
+    max_workers: int = REQUEST_CONCURRENCY,
 ) -> List[Dict]:
-    """Scraper møter for angitte kommuner og kalendere."""
+    """Scraper møter for angitte kommuner og kalendere.
+
+    ``max_workers`` begrenser hvor mange sider som hentes samtidig med requests
+    (minst én).
+    """
+    max_workers = max(1, max_workers)
     all_meetings: List[Dict] = []
 
     kommuner = list(kommune_configs) if kommune_configs is not None else get_default_kommune_configs()
     aktive_kalendere: Sequence[str] = tuple(calendar_sources or ("arrangementer_sa",))
     debug_mode = "--debug" in sys.argv or "--test" in sys.argv
 
-    # Hent møter fra Google Calendar først
-    if CALENDAR_AVAILABLE and aktive_kalendere:
-        print("📅 Henter møter fra Google Calendar...")
-        try:
-            if 'get_calendar_meetings_for_sources' in globals() and callable(get_calendar_meetings_for_sources):  # type: ignore[name-defined]
-                calendar_meetings = get_calendar_meetings_for_sources(
-                    aktive_kalendere,
-                    days_ahead=days_ahead,
-                    test_mode=debug_mode,
-                )
-            else:
-                calendar_meetings = get_calendar_meetings(days_ahead=days_ahead, test_mode=debug_mode)  # type: ignore[misc]
-            all_meetings.extend(calendar_meetings)
-            print(f"Fant {len(calendar_meetings)} møter fra Google Calendar")
-            # Diagnostic: list any meetings that originate from the turnus calendar
-            turnus_found = [m for m in calendar_meetings if (m.get('source') or '').startswith('calendar:turnus') or (m.get('kommune') or '').strip().lower() == 'turnus']
-            if turnus_found:
-                print(f"🔍 Oppdaget {len(turnus_found)} turnus-møter fra kalender:")
-                for m in turnus_found:
-                    print(f"  - {m.get('date')} {m.get('time') or 'hele dagen'}: {m.get('title')} ({m.get('kommune')}) [source={m.get('source')}]")
-            else:
-                print("🔍 Ingen turnus-møter funnet i kalenderhentingen")
-            # Additional diagnostic: search for likely keywords that might indicate Turnus entries
-            keywords = ['turnus', 'turnusfri', 'hans christian']
-            matches = []
-            for m in calendar_meetings:
-                txt = " ".join(filter(None, [str(m.get('title','')).lower(), str(m.get('raw_text','')).lower(), str(m.get('kommune','')).lower()]))
-                if any(k in txt for k in keywords):
-                    matches.append(m)
-            if matches:
-                print(f"🔎 Fant {len(matches)} kalenderhendelser som matcher søkeord {keywords}:")
-                for m in matches:
-                    print(f"  * {m.get('date')} {m.get('time') or 'hele dagen'}: {m.get('title')} ({m.get('kommune')}) [source={m.get('source')}] raw='{(m.get('raw_text') or '')[:80]}'")
-        except Exception as e:
-            print(f"⚠️  Google Calendar-feil: {e}")
+    def _fetch_calendar_meetings() -> List[Dict]:
+        if 'get_calendar_meetings_for_sources' in globals() and callable(get_calendar_meetings_for_sources):  # type: ignore[name-defined]
+            return get_calendar_meetings_for_sources(
+                aktive_kalendere,
+                days_ahead=days_ahead,
+                test_mode=debug_mode,
+            )
+        return get_calendar_meetings(days_ahead=days_ahead, test_mode=debug_mode)  # type: ignore[misc]
 
     # Separer sider basert på om de trenger Playwright
     js_heavy_sites: List[Dict] = []
@@ -1020,6 +1167,16 @@ def scrape_all_meetings(
             print(f"⚠️  Feil ved parsing av {config['name']}: {exc}")
         return []
 
+    host_slots = {
+        _config_host(config): threading.BoundedSemaphore(REQUEST_CONCURRENCY_PER_HOST)
+        for config in kommuner
+    }
+
+    def _scrape_politely(config: Dict) -> List[Dict]:
+        # Begrens samtidige hentinger per vert selv om poolen har flere arbeidere
+        with host_slots[_config_host(config)]:
+            return _scrape_with_requests(config)
+
     def _should_retry_with_playwright(config: Dict) -> bool:
         url_value = (config.get('url') or '').lower()
         if 'opengov.360online.com' in url_value or '360online.com/meetings' in url_value:
@@ -1046,11 +1203,59 @@ def scrape_all_meetings(
         else:
             standard_sites.append(kommune_config)
     
-    # Scrape standard sider med requests/BeautifulSoup
+    # Hent møter fra Google Calendar i bakgrunnen mens kommunesidene hentes;
+    # kalenderresultatet legges først i listen som før
+    calendar_executor: Optional[ThreadPoolExecutor] = None
+    calendar_future = None
+    if CALENDAR_AVAILABLE and aktive_kalendere:
+        print("📅 Henter møter fra Google Calendar...")
+        calendar_executor = ThreadPoolExecutor(max_workers=1)
+        calendar_future = calendar_executor.submit(_fetch_calendar_meetings)
+
+    try:
+        # Scrape standard sider med requests/BeautifulSoup
+        # Hentingene er nettverksbundne; kjør dem samtidig over én delt session og
+        # rapporter resultatene i konfigurasjonsrekkefølge.
+        standard_results: List[List[Dict]] = []
+        if standard_sites:
+            _ensure_parser()
+            workers = min(max_workers, len(standard_sites))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                standard_results = list(executor.map(_scrape_politely, standard_sites))
+
+        if calendar_future is not None:
+            try:
+                calendar_meetings = calendar_future.result()
+                all_meetings.extend(calendar_meetings)
+                print(f"Fant {len(calendar_meetings)} møter fra Google Calendar")
+                # Diagnostic: list any meetings that originate from the turnus calendar
+                turnus_found = [m for m in calendar_meetings if (m.get('source') or '').startswith('calendar:turnus') or (m.get('kommune') or '').strip().lower() == 'turnus']
+                if turnus_found:
+                    print(f"🔍 Oppdaget {len(turnus_found)} turnus-møter fra kalender:")
+                    for m in turnus_found:
+                        print(f"  - {m.get('date')} {m.get('time') or 'hele dagen'}: {m.get('title')} ({m.get('kommune')}) [source={m.get('source')}]")
+                else:
+                    print("🔍 Ingen turnus-møter funnet i kalenderhentingen")
+                # Additional diagnostic: search for likely keywords that might indicate Turnus entries
+                keywords = ['turnus', 'turnusfri', 'hans christian']
+                matches = []
+                for m in calendar_meetings:
+                    txt = " ".join(filter(None, [str(m.get('title','')).lower(), str(m.get('raw_text','')).lower(), str(m.get('kommune','')).lower()]))
+                    if any(k in txt for k in keywords):
+                        matches.append(m)
+                if matches:
+                    print(f"🔎 Fant {len(matches)} kalenderhendelser som matcher søkeord {keywords}:")
+                    for m in matches:
+                        print(f"  * {m.get('date')} {m.get('time') or 'hele dagen'}: {m.get('title')} ({m.get('kommune')}) [source={m.get('source')}] raw='{(m.get('raw_text') or '')[:80]}'")
+            except Exception as e:
+                print(f"⚠️  Google Calendar-feil: {e}")
+    finally:
+        if calendar_executor is not None:
+            calendar_executor.shutdown(wait=True)
+
     if standard_sites:
-        for kommune_config in standard_sites:
+        for kommune_config, meetings in zip(standard_sites, standard_results):
             print(f"📄 Scraper {kommune_config['name']} (standard)...")
-            meetings = _scrape_with_requests(kommune_config)
             # Legg på kilde-URL for hvert møte slik at Slack-meldingen kan linke tilbake
             for m in meetings:
                 if 'url' not in m or not m.get('url'):
@@ -1084,9 +1289,13 @@ def scrape_all_meetings(
             print(f"Playwright-feil: {e}")
     elif playwright_targets:
         print("⚠️  Playwright ikke tilgjengelig for JavaScript-tunge sider – faller tilbake til requests-basert parsing.")
-        for kommune_config in playwright_targets:
+        # Samme samtidige henting som for standardsidene
+        _ensure_parser()
+        workers = min(max_workers, len(playwright_targets))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            fallback_results = list(executor.map(_scrape_politely, playwright_targets))
+        for kommune_config, meetings in zip(playwright_targets, fallback_results):
             print(f"📄 Scraper {kommune_config['name']} (fallback)...")
-            meetings = _scrape_with_requests(kommune_config)
             for m in meetings:
                 if 'url' not in m or not m.get('url'):
                     m['url'] = kommune_config.get('url')
@@ -1098,7 +1307,8 @@ def scrape_all_meetings(
         print("\n⚠️  Ingen møter funnet via scraping. Bruker mock-data for demo...")
         try:
             from .mock_data import get_mock_meetings
-            all_meetings = get_mock_meetings()
+            # Mock-møtene er delte, skrivebeskyttede maler; kallere får egne dict-kopier
+            all_meetings = [dict(meeting) for meeting in get_mock_meetings()]
             print(f"Lastet {len(all_meetings)} mock-møter")
         except ImportError:
             print("Mock-data ikke tilgjengelig")
@@ -1110,22 +1320,21 @@ def filter_meetings_by_date_range(
     days_ahead: int = 10,
 ) -> List[Meeting]:
     """Filtrer møter for dagens dato + angitt antall dager frem."""
-    today = datetime.now().date()
+    # Grensene beregnes én gang; hvert møte parses med C-implementert fromisoformat
+    today = date.today()
     end_date = today + timedelta(days=days_ahead)
     
     filtered_meetings: List[Meeting] = []
-    normalized = [ensure_meeting(m) for m in meetings]
-
-    for meeting in normalized:
+    for meeting in map(ensure_meeting, meetings):
         try:
             meeting_date = date.fromisoformat(meeting.date)
-            if today <= meeting_date <= end_date:
-                filtered_meetings.append(meeting)
         except ValueError:
             continue
+        if today <= meeting_date <= end_date:
+            filtered_meetings.append(meeting)
     
     # Sorter etter dato og tid
-    filtered_meetings.sort(key=lambda meeting: meeting.sort_key())
+    filtered_meetings.sort(key=Meeting.sort_key)
     return filtered_meetings
 
 
@@ -1167,7 +1376,7 @@ def _fallback_meetings(days_ahead: int) -> List[Meeting]:
     try:
         from .mock_data import get_mock_meetings
 
-        mock_meetings = get_mock_meetings()
+        mock_meetings = [dict(meeting) for meeting in get_mock_meetings()]
         return filter_meetings_by_date_range(mock_meetings, days_ahead=days_ahead)
     except ImportError:
         print("Mock-data ikke tilgjengelig")
@@ -1288,6 +1497,39 @@ def run_pipeline(
 
     return overall_success
 
+def post_slack_payload(webhook_url: str, payload: Dict, *, timeout: float = 10) -> requests.Response:
+    """Post ``payload`` til en Slack-webhook med maks én melding per sekund.
+
+    429 og 5xx prøves på nytt opptil SLACK_MAX_RETRIES ganger. Ved 429 med
+    Retry-After ventes det så lenge Slack ber om, ellers brukes jittered
+    eksponentiell backoff. Gjenstående feilstatus løftes som ``requests.HTTPError``.
+    """
+    global _last_slack_post
+    # Serialiser én gang; samme bytes sendes ved et eventuelt nytt forsøk
+    if orjson is not None:
+        body = orjson.dumps(payload)
+    else:
+        body = json.dumps(payload, allow_nan=False).encode('utf-8')
+    headers = {'Content-Type': 'application/json'}
+    for attempt in range(SLACK_MAX_RETRIES + 1):
+        wait = _last_slack_post + SLACK_MIN_INTERVAL_SECONDS - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        response = _SLACK_SESSION.post(webhook_url, data=body, headers=headers, timeout=timeout)
+        _last_slack_post = time.monotonic()
+        status = response.status_code
+        if attempt == SLACK_MAX_RETRIES or (status != 429 and status < 500):
+            break
+        retry_after = str(response.headers.get('Retry-After', ''))
+        if status == 429 and retry_after.isdigit():
+            time.sleep(int(retry_after))
+        else:
+            cap = min(SLACK_BACKOFF_CAP_SECONDS, SLACK_BACKOFF_BASE_SECONDS * 2 ** attempt)
+            time.sleep(random.uniform(0, cap))
+    response.raise_for_status()
+    return response
+
+
 def send_to_slack(
     message: str,
     force_send: bool = False,
@@ -1327,8 +1569,7 @@ def send_to_slack(
     }
     
     try:
-        response = requests.post(resolved_webhook, json=payload, timeout=10)
-        response.raise_for_status()
+        post_slack_payload(resolved_webhook, payload)
         print("✅ Melding sendt til Slack!")
         return True
     except requests.exceptions.RequestException as e:
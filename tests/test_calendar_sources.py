@@ -81,3 +81,30 @@ def test_turnus_calendar_defaults_to_turnus_label() -> None:
     meetings = cal.get_calendar_meetings_for_sources(["turnus"], test_mode=True)
     assert meetings
     assert meetings[0]["kommune"] == "(Turnus-kalender)"
+
+
+def test_multiple_sources_are_fetched_concurrently_with_own_services(monkeypatch) -> None:
+    import threading
+
+    barrier = threading.Barrier(2, timeout=2)
+    created = []
+
+    def fake_create_service(credentials_json):
+        created.append(credentials_json)
+        return object()
+
+    def fake_get_calendar_meetings(self, days_ahead=9):
+        # Begge kildene må være i gang samtidig for at barrieren skal slippe gjennom
+        barrier.wait()
+        return [{"title": f"Møte {self.calendar_id}", "date": "2030-01-01", "raw_text": ""}]
+
+    monkeypatch.setenv("GOOGLE_SERVICE_ACCOUNT_JSON", "{}")
+    monkeypatch.setenv("GOOGLE_CALENDAR_REGIONAL_KULTUR_ID", "kultur@example.com")
+    monkeypatch.setattr(cal, "_create_service", fake_create_service)
+    monkeypatch.setattr(cal.GoogleCalendarIntegration, "get_calendar_meetings", fake_get_calendar_meetings)
+
+    meetings = cal.get_calendar_meetings_for_sources(["arrangementer_sa", "regional_kultur"])
+
+    assert [m["title"] for m in meetings] == [f"Møte {cal.CALENDAR_ID}", "Møte kultur@example.com"]
+    assert [m["source"] for m in meetings] == ["calendar:arrangementer_sa", "calendar:regional_kultur"]
+    assert len(created) == 2
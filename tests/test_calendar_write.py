@@ -0,0 +1,366 @@
+"""Tests for skriving av møter til Google Calendar (uten nettverk)."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+
+cal = pytest.importorskip("politikk_moter.calendar_integration")
+httplib2 = pytest.importorskip("httplib2")
+HttpError = cal.HttpError
+
+
+class _FakeRequest:
+    def __init__(self, body: Dict[str, Any], response: Dict[str, Any]):
+        self.body = body
+        self.response = response
+
+    def execute(self) -> Dict[str, Any]:
+        return self.response
+
+
+class _FakeBatch:
+    def __init__(self, service: "_FakeService", callback: Callable[..., None]):
+        self.service = service
+        self.callback = callback
+        self.requests: List[tuple[str, _FakeRequest]] = []
+
+    def add(self, request: _FakeRequest, request_id: Optional[str] = None) -> None:
+        self.requests.append((request_id or str(len(self.requests)), request))
+
+    def execute(self) -> None:
+        self.service.batch_sizes.append(len(self.requests))
+        for request_id, request in self.requests:
+            self.callback(request_id, request.response, None)
+
+
+class _FakeEvents:
+    def __init__(self, service: "_FakeService"):
+        self.service = service
+
+    def insert(self, calendarId: str, body: Dict[str, Any]) -> _FakeRequest:  # noqa: N803
+        self.service.inserted.append(body)
+        return _FakeRequest(body, {"id": f"evt-{len(self.service.inserted)}"})
+
+    def list(self, **kwargs: Any) -> _FakeRequest:
+        self.service.list_calls.append(kwargs)
+        pages = self.service.existing_pages
+        page_idx = int(kwargs.get("pageToken") or 0)
+        response: Dict[str, Any] = {"items": pages[page_idx] if page_idx < len(pages) else []}
+        if page_idx + 1 < len(pages):
+            response["nextPageToken"] = str(page_idx + 1)
+        else:
+            response["nextSyncToken"] = f"sync-{len(self.service.list_calls)}"
+        return _FakeRequest({}, response)
+
+
+class _FakeService:
+    def __init__(self) -> None:
+        self.inserted: List[Dict[str, Any]] = []
+        self.batch_sizes: List[int] = []
+        self.list_calls: List[Dict[str, Any]] = []
+        self.existing_pages: List[List[Dict[str, Any]]] = []
+
+    def events(self) -> _FakeEvents:
+        return _FakeEvents(self)
+
+    def new_batch_http_request(self, callback: Callable[..., None]) -> _FakeBatch:
+        return _FakeBatch(self, callback)
+
+
+def _meeting(idx: int) -> Dict[str, Any]:
+    return {
+        "title": f"Møte {idx}",
+        "date": "2025-10-01",
+        "time": "10:00",
+        "location": "Rådhuset",
+        "kommune": "Sauda kommune",
+        "url": "https://example.com",
+    }
+
+
+def test_add_meetings_to_calendar_uses_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    integration = cal.GoogleCalendarIntegration(cal.CALENDAR_ID)
+    service = _FakeService()
+
+    def fake_authenticate() -> bool:
+        integration.service = service
+        return True
+
+    monkeypatch.setattr(integration, "authenticate", fake_authenticate)
+
+    added = integration.add_meetings_to_calendar([_meeting(i) for i in range(120)])
+
+    assert added == 120
+    assert service.batch_sizes == [50, 50, 20]
+
+
+def test_existing_events_are_listed_once_for_whole_range(monkeypatch: pytest.MonkeyPatch) -> None:
+    integration = cal.GoogleCalendarIntegration(cal.CALENDAR_ID)
+    service = _FakeService()
+    service.existing_pages = [
+        [{"summary": "Møte 0 (Sauda kommune)", "start": {"dateTime": "2025-10-01T10:00:00+02:00"}}],
+        [{"summary": "Møte 1 (Sauda kommune)", "start": {"date": "2025-10-01"}}],
+    ]
+    monkeypatch.setattr(integration, "authenticate", lambda: setattr(integration, "service", service) or True)
+
+    meetings = [_meeting(i) for i in range(3)]
+    meetings[2]["date"] = "2025-10-05"
+    added = integration.add_meetings_to_calendar(meetings)
+
+    assert added == 1
+    assert [body["summary"] for body in service.inserted] == ["Møte 2 (Sauda kommune)"]
+    assert len(service.list_calls) == 2, "Én list-kall per side, ikke per møte"
+    assert service.list_calls[0]["timeMin"] == "2025-10-01T00:00:00Z"
+    assert service.list_calls[0]["timeMax"] == "2025-10-06T00:00:00Z"
+
+
+def test_sync_state_only_requests_changes(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    state_file = tmp_path / "sync.json"
+    monkeypatch.setenv(cal.SYNC_STATE_ENV, str(state_file))
+
+    service = _FakeService()
+    service.existing_pages = [
+        [{"id": "a", "summary": "Møte 0 (Sauda kommune)", "start": {"date": "2025-10-01"}}],
+    ]
+    first = cal.GoogleCalendarIntegration(cal.CALENDAR_ID)
+    monkeypatch.setattr(first, "authenticate", lambda: setattr(first, "service", service) or True)
+    assert first.add_meetings_to_calendar([_meeting(0), _meeting(1)]) == 1
+    assert "syncToken" not in service.list_calls[0] or service.list_calls[0]["syncToken"] is None
+
+    stored = json.loads(state_file.read_text(encoding="utf-8"))
+    assert stored[cal.CALENDAR_ID]["token"] == "sync-1"
+
+    # Andre kjøring: kun endringer returneres, og "a" er slettet.
+    service.existing_pages = [[{"id": "a", "status": "cancelled"}]]
+    second = cal.GoogleCalendarIntegration(cal.CALENDAR_ID)
+    monkeypatch.setattr(second, "authenticate", lambda: setattr(second, "service", service) or True)
+    assert second.add_meetings_to_calendar([_meeting(0)]) == 1
+    assert service.list_calls[-1]["syncToken"] == "sync-1"
+
+
+def test_build_event_data_for_timed_and_all_day_meetings() -> None:
+    integration = cal.GoogleCalendarIntegration(cal.CALENDAR_ID)
+
+    timed = integration._build_event_data(_meeting(0))  # pylint: disable=protected-access
+    assert timed["summary"] == "Møte 0 (Sauda kommune)"
+    assert timed["start"] == {"dateTime": "2025-10-01T10:00:00", "timeZone": "Europe/Oslo"}
+    assert timed["end"] == {"dateTime": "2025-10-01T12:00:00", "timeZone": "Europe/Oslo"}
+    assert timed["location"] == "Rådhuset"
+    assert timed["description"] == (
+        "Møte: Møte 0\nKommune: Sauda kommune\nSted: Rådhuset\n"
+        "Mer info: https://example.com\n\nAutomatisk lagt til av Dagsorden-bot"
+    )
+
+    all_day_meeting = dict(_meeting(1), time=None, location="Ikke oppgitt", url="")
+    all_day = integration._build_event_data(all_day_meeting)  # pylint: disable=protected-access
+    assert all_day["start"] == {"date": "2025-10-01"}
+    assert all_day["end"] == {"date": "2025-10-02"}
+    assert "location" not in all_day
+    assert all_day["description"] == "Møte: Møte 1\nKommune: Sauda kommune\n\nAutomatisk lagt til av Dagsorden-bot"
+
+
+def test_authenticate_reuses_built_service(monkeypatch: pytest.MonkeyPatch) -> None:
+    built: List[Dict[str, Any]] = []
+
+    def fake_build(*args: Any, **kwargs: Any) -> _FakeService:
+        built.append(kwargs)
+        return _FakeService()
+
+    monkeypatch.setattr(cal, "build", fake_build)
+    monkeypatch.setattr(
+        cal.service_account.Credentials,
+        "from_service_account_info",
+        lambda info, scopes: object(),
+    )
+    monkeypatch.setenv("GOOGLE_SERVICE_ACCOUNT_JSON", json.dumps({"type": "service_account"}))
+    cal._build_service.cache_clear()  # pylint: disable=protected-access
+
+    first = cal.GoogleCalendarIntegration(cal.CALENDAR_ID)
+    second = cal.GoogleCalendarIntegration("other@example.com")
+    assert first.authenticate()
+    assert second.authenticate()
+
+    assert len(built) == 1
+    assert first.service is second.service
+
+    # Et autentisert objekt leser ikke credentials på nytt
+    monkeypatch.delenv("GOOGLE_SERVICE_ACCOUNT_JSON")
+    assert first.authenticate()
+    cal._build_service.cache_clear()  # pylint: disable=protected-access
+
+
+class _FlakyRequest:
+    def __init__(self, failures: List[HttpError]):
+        self.failures = list(failures)
+        self.calls = 0
+
+    def execute(self) -> Dict[str, Any]:
+        self.calls += 1
+        if self.failures:
+            raise self.failures.pop(0)
+        return {"id": "ok"}
+
+
+def _http_error(status: int, reason: str = "backendError", **headers: str) -> HttpError:
+    content = json.dumps({"error": {"errors": [{"reason": reason}], "message": reason}}).encode()
+    return HttpError(httplib2.Response({"status": status, **headers}), content)
+
+
+def test_execute_with_backoff_retries_transient_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: List[float] = []
+    monkeypatch.setattr(cal.time, "sleep", sleeps.append)
+    monkeypatch.setattr(cal.random, "random", lambda: 0.5)
+
+    request = _FlakyRequest([
+        _http_error(429, "rateLimitExceeded"),
+        _http_error(403, "userRateLimitExceeded", **{"retry-after": "5"}),
+        _http_error(503),
+    ])
+    assert cal._execute_with_backoff(request) == {"id": "ok"}  # pylint: disable=protected-access
+    assert request.calls == 4
+    assert sleeps == [1.5, 5.0, 4.5]
+
+
+def test_execute_with_backoff_does_not_retry_permanent_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cal.time, "sleep", lambda _delay: None)
+
+    forbidden = _FlakyRequest([_http_error(403, "forbidden")])
+    with pytest.raises(HttpError):
+        cal._execute_with_backoff(forbidden)  # pylint: disable=protected-access
+    assert forbidden.calls == 1
+
+    always_failing = _FlakyRequest([_http_error(500) for _ in range(3)])
+    with pytest.raises(HttpError):
+        cal._execute_with_backoff(always_failing, max_tries=3)  # pylint: disable=protected-access
+    assert always_failing.calls == 3
+
+
+class _RateLimitedBatch(_FakeBatch):
+    def execute(self) -> None:
+        self.service.batch_sizes.append(len(self.requests))
+        for request_id, request in self.requests:
+            outcome = self.service.item_failures.get(request_id)
+            if outcome:
+                self.callback(request_id, None, outcome.pop(0))
+            else:
+                self.callback(request_id, request.response, None)
+
+
+class _RateLimitedService(_FakeService):
+    def __init__(self, item_failures: Dict[str, List[HttpError]]) -> None:
+        super().__init__()
+        self.item_failures = item_failures
+
+    def new_batch_http_request(self, callback: Callable[..., None]) -> _FakeBatch:
+        return _RateLimitedBatch(self, callback)
+
+
+def test_rate_limited_batch_items_are_retried(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: List[float] = []
+    monkeypatch.setattr(cal.time, "sleep", sleeps.append)
+    monkeypatch.setattr(cal.random, "random", lambda: 0.5)
+    service = _RateLimitedService({
+        "1": [_http_error(429, "rateLimitExceeded"), _http_error(403, "rateLimitExceeded")],
+        "2": [_http_error(403, "forbidden")],
+        "3": [_http_error(429, "rateLimitExceeded") for _ in range(3)],
+    })
+    integration = cal.GoogleCalendarIntegration(cal.CALENDAR_ID)
+    integration.service = service
+
+    added = integration._insert_events_batched(  # pylint: disable=protected-access
+        [cal.Meeting.from_mapping(_meeting(i)) for i in range(4)],
+        max_tries=3,
+    )
+
+    # 0 lykkes straks, 1 etter to nye forsøk, 2 er permanent feil, 3 gir opp etter siste forsøk
+    assert added == 2
+    assert service.batch_sizes == [4, 2, 2]
+    assert sleeps == [1.5, 2.5]
+
+
+def test_calendar_write_accepts_meeting_instances(monkeypatch: pytest.MonkeyPatch) -> None:
+    integration = cal.GoogleCalendarIntegration(cal.CALENDAR_ID)
+    service = _FakeService()
+    monkeypatch.setattr(integration, "authenticate", lambda: setattr(integration, "service", service) or True)
+
+    meeting = cal.Meeting.from_mapping(_meeting(0))
+    assert integration._build_event_data(meeting) == integration._build_event_data(_meeting(0))  # pylint: disable=protected-access
+
+    assert integration.add_meetings_to_calendar([meeting, _meeting(1)]) == 2
+    assert [body["summary"] for body in service.inserted] == [
+        "Møte 0 (Sauda kommune)",
+        "Møte 1 (Sauda kommune)",
+    ]
+
+
+def test_authenticate_rejects_invalid_credentials_json(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GOOGLE_SERVICE_ACCOUNT_JSON", "{ikke gyldig json")
+    cal._build_service.cache_clear()  # pylint: disable=protected-access
+
+    integration = cal.GoogleCalendarIntegration(cal.CALENDAR_ID)
+
+    assert integration.authenticate() is False
+    assert integration.service is None
+
+
+def test_event_exists_falls_back_to_per_date_lookup() -> None:
+    integration = cal.GoogleCalendarIntegration(cal.CALENDAR_ID)
+    service = _FakeService()
+    service.existing_pages = [[
+        {"summary": "Annet møte (Sauda kommune)"},
+        {"summary": "Møte 0 (Sauda kommune)"},
+    ]]
+    integration.service = service
+
+    assert integration._event_exists(_meeting(0))  # pylint: disable=protected-access
+    assert not integration._event_exists(_meeting(1))  # pylint: disable=protected-access
+    assert service.list_calls[0]["timeMin"] == "2025-10-01T00:00:00Z"
+    assert service.list_calls[0]["timeMax"] == "2025-10-02T00:00:00Z"
+
+
+def test_event_cache_skips_known_meetings_on_next_run(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    monkeypatch.setenv(cal.EVENT_CACHE_ENV, str(tmp_path / "events.db"))
+
+    service = _FakeService()
+    first = cal.GoogleCalendarIntegration(cal.CALENDAR_ID)
+    monkeypatch.setattr(first, "authenticate", lambda: setattr(first, "service", service) or True)
+    assert first.add_meetings_to_calendar([_meeting(0), _meeting(1)]) == 2
+    list_calls_after_first = len(service.list_calls)
+
+    second = cal.GoogleCalendarIntegration(cal.CALENDAR_ID)
+    monkeypatch.setattr(second, "authenticate", lambda: setattr(second, "service", service) or True)
+    assert second.add_meetings_to_calendar([_meeting(0), _meeting(1)]) == 0
+
+    assert len(service.inserted) == 2
+    assert len(service.list_calls) == list_calls_after_first, "Ingen list-kall når alt er i cache"
+
+
+def test_event_cache_evicts_old_entries(tmp_path) -> None:
+    path = str(tmp_path / "events.db")
+    meeting = cal.Meeting.from_mapping(_meeting(0))
+    key = cal._event_cache_key(meeting)  # pylint: disable=protected-access
+
+    cache = cal._EventCache(path)  # pylint: disable=protected-access
+    cache.add(key, "evt-1")
+    cache.close()
+
+    assert key in cal._EventCache(path)  # pylint: disable=protected-access
+    assert key not in cal._EventCache(path, max_age_days=-1)  # pylint: disable=protected-access
+
+
+def test_add_meetings_reports_skips_once(monkeypatch: pytest.MonkeyPatch, capsys) -> None:
+    integration = cal.GoogleCalendarIntegration(cal.CALENDAR_ID)
+    service = _FakeService()
+    service.existing_pages = [[
+        {"summary": f"Møte {idx} (Sauda kommune)", "start": {"date": "2025-10-01"}} for idx in range(5)
+    ]]
+    monkeypatch.setattr(integration, "authenticate", lambda: setattr(integration, "service", service) or True)
+
+    assert integration.add_meetings_to_calendar([_meeting(i) for i in range(6)]) == 1
+
+    output = capsys.readouterr().out
+    assert "Event eksisterer allerede" not in output
+    assert "5 møter fantes allerede" in output
@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 """High-level tests for the politikk_moter scraper package."""
 
+import json
 import sys
 import textwrap
+import threading
+import time
 import types
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -88,6 +91,19 @@ def test_format_slack_message_includes_titles():
     assert "• Sauda kommune: 2 møter" in message
 
 
+def test_mock_meetings_static_part_is_shared_and_read_only():
+    first = get_mock_meetings()
+    second = get_mock_meetings()
+
+    assert first[0] is second[0], "Statiske mock-møter skal bygges én gang"
+    with pytest.raises(TypeError):
+        first[0]["title"] = "Endret"  # type: ignore[index]
+
+    future_dates = [meeting["date"] for meeting in first[-3:]]
+    tomorrow = (datetime.now().date() + timedelta(days=1)).isoformat()
+    assert future_dates[0] == tomorrow
+
+
 def test_format_slack_message_summarizes_multiple_kommuner():
     sample_meetings = [
         {
@@ -239,19 +255,7 @@ def test_turnus_calendar_meetings_render_inline():
 
     message = scraper.format_slack_message(sample_meetings)
 
-    turnus_date = datetime.strptime("2025-10-03", "%Y-%m-%d")
-    date_str = turnus_date.strftime('%A %d. %B %Y')
-    for eng, nor in (
-        ("Monday", "Mandag"),
-        ("Tuesday", "Tirsdag"),
-        ("Wednesday", "Onsdag"),
-        ("Thursday", "Torsdag"),
-        ("Friday", "Fredag"),
-        ("Saturday", "Lørdag"),
-        ("Sunday", "Søndag"),
-    ):
-        date_str = date_str.replace(eng, nor)
-    expected_date_heading = f"*{date_str}*"
+    expected_date_heading = "*Fredag 3. oktober 2025*"
 
     assert "*Turnus*" not in message, "Turnus-hendelser skal ikke ha egen seksjon lenger"
     date_section_index = message.index(expected_date_heading)
@@ -261,6 +265,17 @@ def test_turnus_calendar_meetings_render_inline():
     assert date_section_index < turnus_index < summary_index
 
 
+def test_mock_fallback_returns_serialisable_mutable_copies(monkeypatch):
+    monkeypatch.setattr(scraper, "CALENDAR_AVAILABLE", False, raising=False)
+
+    meetings = scraper.scrape_all_meetings(kommune_configs=[], calendar_sources=[])
+
+    assert meetings and all(type(m) is dict for m in meetings)
+    json.dumps(meetings)
+    meetings[0]["url"] = "https://example.com"
+    assert "url" not in get_mock_meetings()[0]
+
+
 def test_scrape_all_meetings_falls_back_to_mock(monkeypatch, dummy_meetings):
     """Når scraping ikke gir resultater skal mock-data brukes som fallback."""
 
@@ -302,12 +317,96 @@ def test_scrape_all_meetings_falls_back_to_mock(monkeypatch, dummy_meetings):
         pytest.fail("Slack-webhook skulle ikke bli kalt i test-modus")
 
     monkeypatch.setattr(scraper.requests, "post", fail_post)
+    monkeypatch.setattr(scraper._SLACK_SESSION, "post", fail_post)  # pylint: disable=protected-access
 
     result = scraper.send_to_slack("Testmelding")
 
     assert result is True
 
 
+def test_post_slack_payload_paces_and_retries_once_on_429(monkeypatch):
+    """Slack-posting holder minst ett sekund mellom meldinger og respekterer Retry-After."""
+
+    clock = {"now": 100.0}
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock["now"] += seconds
+
+    class FakeResponse:
+        def __init__(self, status_code, headers=None):
+            self.status_code = status_code
+            self.headers = headers or {}
+
+        def raise_for_status(self):
+            if self.status_code >= 400:
+                raise scraper.requests.HTTPError(str(self.status_code))
+
+    responses = [FakeResponse(429, {"Retry-After": "3"}), FakeResponse(200), FakeResponse(200)]
+    posted = []
+
+    def fake_post(url, data=None, headers=None, timeout=None):
+        assert headers == {"Content-Type": "application/json"}
+        posted.append(json.loads(data))
+        return responses.pop(0)
+
+    monkeypatch.setattr(scraper.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(scraper.time, "sleep", fake_sleep)
+    monkeypatch.setattr(scraper, "_last_slack_post", 0.0)
+    monkeypatch.setattr(scraper._SLACK_SESSION, "post", fake_post)  # pylint: disable=protected-access
+
+    scraper.post_slack_payload("https://example.com/hook", {"text": "a"})
+    scraper.post_slack_payload("https://example.com/hook", {"text": "b"})
+
+    assert posted == [{"text": "a"}, {"text": "a"}, {"text": "b"}]
+    # 3 s fra Retry-After, deretter 1 s pacing før neste melding
+    assert sleeps == [3, 1.0]
+
+
+def test_post_slack_payload_backs_off_with_jitter_on_server_errors(monkeypatch):
+    """5xx og 429 uten Retry-After gir full-jitter backoff, og gir opp etter maks antall forsøk."""
+
+    clock = {"now": 100.0}
+    sleeps = []
+    caps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock["now"] += seconds
+
+    def fake_uniform(low, high):
+        caps.append((low, high))
+        return high  # verste fall, slik at pacing-ventingen ikke slår inn
+
+    class FakeResponse:
+        def __init__(self, status_code):
+            self.status_code = status_code
+            self.headers = {}
+
+        def raise_for_status(self):
+            if self.status_code >= 400:
+                raise scraper.requests.HTTPError(str(self.status_code))
+
+    statuses = [503, 429, 502, 500]
+
+    def fake_post(url, data=None, headers=None, timeout=None):
+        return FakeResponse(statuses.pop(0))
+
+    monkeypatch.setattr(scraper.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(scraper.time, "sleep", fake_sleep)
+    monkeypatch.setattr(scraper.random, "uniform", fake_uniform)
+    monkeypatch.setattr(scraper, "_last_slack_post", 0.0)
+    monkeypatch.setattr(scraper._SLACK_SESSION, "post", fake_post)  # pylint: disable=protected-access
+
+    with pytest.raises(scraper.requests.HTTPError):
+        scraper.post_slack_payload("https://example.com/hook", {"text": "a"})
+
+    assert statuses == []
+    assert caps == [(0, 1.0), (0, 2.0), (0, 4.0)]
+    assert sleeps == [1.0, 2.0, 4.0]
+
+
 def test_run_pipeline_skips_when_webhook_missing(monkeypatch, dummy_meetings):
     """Pipelines uten webhook skal hoppe over sending i debug/test uten å feile."""
 
@@ -514,3 +613,184 @@ def test_stavanger_custom_cards_parsed(monkeypatch):
     assert meeting["title"] == "Områdeutvalg Nord: Hana, Riska og Sviland"
     assert meeting["date"] == "2025-10-16"
     assert meeting["time"] == "19:00"
+
+
+def test_standard_sites_are_fetched_concurrently_in_config_order(monkeypatch):
+    state = {"active": 0, "max_active": 0}
+    lock = threading.Lock()
+
+    def fake_parse_custom_site(self, url, kommune_name):
+        with lock:
+            state["active"] += 1
+            state["max_active"] = max(state["max_active"], state["active"])
+        time.sleep(0.02)
+        with lock:
+            state["active"] -= 1
+        return [{"title": kommune_name, "date": "2030-01-01", "time": None, "kommune": kommune_name}]
+
+    monkeypatch.setattr(scraper, "CALENDAR_AVAILABLE", False)
+    monkeypatch.setattr(scraper.MoteParser, "parse_custom_site", fake_parse_custom_site)
+    configs = [{"name": f"K{i}", "url": f"https://k{i}.example/", "type": "custom"} for i in range(6)]
+
+    meetings = scraper.scrape_all_meetings(configs)
+
+    assert [m["title"] for m in meetings] == [f"K{i}" for i in range(6)]
+    assert all(m["url"] == f"https://k{i}.example/" for i, m in enumerate(meetings))
+    assert state["max_active"] > 1
+
+
+def test_sites_on_same_host_are_not_fetched_concurrently(monkeypatch):
+    state = {"active": {}, "max_active": {}}
+    lock = threading.Lock()
+
+    def fake_parse_custom_site(self, url, kommune_name):
+        host = url.split("/")[2]
+        with lock:
+            state["active"][host] = state["active"].get(host, 0) + 1
+            state["max_active"][host] = max(state["max_active"].get(host, 0), state["active"][host])
+        time.sleep(0.02)
+        with lock:
+            state["active"][host] -= 1
+        return [{"title": kommune_name, "date": "2030-01-01", "time": None, "kommune": kommune_name}]
+
+    monkeypatch.setattr(scraper, "CALENDAR_AVAILABLE", False)
+    monkeypatch.setattr(scraper.MoteParser, "parse_custom_site", fake_parse_custom_site)
+    configs = [
+        {"name": f"K{i}", "url": f"https://{'shared' if i % 2 else 'other'}.example/k{i}", "type": "custom"}
+        for i in range(6)
+    ]
+
+    meetings = scraper.scrape_all_meetings(configs)
+
+    assert [m["title"] for m in meetings] == [f"K{i}" for i in range(6)]
+    assert state["max_active"] == {"shared.example": 1, "other.example": 1}
+
+
+def test_playwright_fallback_sites_are_fetched_concurrently(monkeypatch):
+    state = {"active": 0, "max_active": 0}
+    lock = threading.Lock()
+
+    def fake_parse_elements_site(self, url, kommune_name):
+        with lock:
+            state["active"] += 1
+            state["max_active"] = max(state["max_active"], state["active"])
+        time.sleep(0.02)
+        with lock:
+            state["active"] -= 1
+        return [{"title": kommune_name, "date": "2030-01-01", "time": None, "kommune": kommune_name}]
+
+    monkeypatch.setattr(scraper, "CALENDAR_AVAILABLE", False)
+    monkeypatch.setattr(scraper, "PLAYWRIGHT_AVAILABLE", False, raising=False)
+    monkeypatch.setattr(scraper.MoteParser, "parse_elements_site", fake_parse_elements_site)
+    configs = [{"name": f"E{i}", "url": f"https://e{i}.example/", "type": "elements"} for i in range(4)]
+
+    meetings = scraper.scrape_all_meetings(configs, max_workers=2)
+
+    assert [m["title"] for m in meetings] == [f"E{i}" for i in range(4)]
+    assert state["max_active"] == 2
+
+
+def test_scrape_all_meetings_treats_zero_max_workers_as_one(monkeypatch):
+    monkeypatch.setattr(scraper, "CALENDAR_AVAILABLE", False)
+    monkeypatch.setattr(scraper, "PLAYWRIGHT_AVAILABLE", False, raising=False)
+    monkeypatch.setattr(
+        scraper.MoteParser,
+        "parse_elements_site",
+        lambda self, url, kommune_name: [{"title": kommune_name, "date": "2030-01-01", "time": None}],
+    )
+    monkeypatch.setattr(
+        scraper.MoteParser,
+        "parse_custom_site",
+        lambda self, url, kommune_name: [{"title": kommune_name, "date": "2030-01-02", "time": None}],
+    )
+    configs = [
+        {"name": "K0", "url": "https://k0.example/", "type": "custom"},
+        {"name": "E0", "url": "https://e0.example/", "type": "elements"},
+    ]
+
+    meetings = scraper.scrape_all_meetings(configs, max_workers=0)
+
+    assert [m["title"] for m in meetings] == ["K0", "E0"]
+
+
+def test_calendar_fetch_overlaps_site_scraping(monkeypatch):
+    site_started = threading.Event()
+    seen = {}
+
+    def fake_calendar(sources, days_ahead=10, test_mode=False):
+        # Kalenderhentingen venter på at en kommuneside er i gang; kjørte de
+        # sekvensielt ville ventingen gå ut på tid
+        seen["overlapped"] = site_started.wait(timeout=2)
+        return [{"title": "Kalender", "date": "2030-01-01", "time": None, "kommune": "Kalender"}]
+
+    def fake_parse_custom_site(self, url, kommune_name):
+        site_started.set()
+        return [{"title": kommune_name, "date": "2030-01-02", "time": None, "kommune": kommune_name}]
+
+    monkeypatch.setattr(scraper, "CALENDAR_AVAILABLE", True)
+    monkeypatch.setattr(scraper, "get_calendar_meetings_for_sources", fake_calendar, raising=False)
+    monkeypatch.setattr(scraper.MoteParser, "parse_custom_site", fake_parse_custom_site)
+    configs = [{"name": "K0", "url": "https://k0.example/", "type": "custom"}]
+
+    meetings = scraper.scrape_all_meetings(configs, calendar_sources=["arrangementer_sa"])
+
+    assert seen["overlapped"] is True
+    assert [m["title"] for m in meetings] == ["Kalender", "K0"]
+
+
+def test_mote_parser_uses_http_cache_when_enabled(monkeypatch, tmp_path):
+    calls = []
+
+    class FakeResponse:
+        status_code = 200
+        content = "<html><body><p>Kommunestyret 03.11.2030 kl. 18:00</p></body></html>".encode("utf-8")
+        headers = {"Cache-Control": "max-age=600"}
+
+        def raise_for_status(self):
+            pass
+
+    def fake_get(url, timeout=None, headers=None):
+        calls.append(url)
+        return FakeResponse()
+
+    monkeypatch.setenv("MOTEPLAN_HTTP_CACHE", str(tmp_path / "http.sqlite"))
+    parser = scraper.MoteParser()
+    monkeypatch.setattr(parser.session, "get", fake_get)
+
+    first = parser.parse_custom_site("https://kommune.example/moter", "Testkommune")
+    second = parser.parse_custom_site("https://kommune.example/moter", "Testkommune")
+
+    assert calls == ["https://kommune.example/moter"]
+    assert first == second
+
+
+def test_kommune_by_name_indexes_default_configs():
+    assert scraper.KOMMUNE_BY_NAME["eigersund kommune"]["url"].startswith("https://innsyn.onacos.no/eigersund/")
+    assert len(scraper.KOMMUNE_BY_NAME) == len(scraper.KOMMUNE_URLS)
+
+
+def test_calendar_executor_is_shut_down_and_no_site_pool_without_sites(monkeypatch):
+    created = []
+
+    class RecordingExecutor(scraper.ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.shutdown_calls = []
+            created.append(self)
+
+        def shutdown(self, wait=True, **kwargs):
+            self.shutdown_calls.append(wait)
+            super().shutdown(wait=wait, **kwargs)
+
+    def fake_calendar(sources, days_ahead=10, test_mode=False):
+        return [{"title": "Kalender", "date": "2030-01-01", "time": None, "kommune": "Kalender"}]
+
+    monkeypatch.setattr(scraper, "ThreadPoolExecutor", RecordingExecutor)
+    monkeypatch.setattr(scraper, "CALENDAR_AVAILABLE", True)
+    monkeypatch.setattr(scraper, "get_calendar_meetings_for_sources", fake_calendar, raising=False)
+
+    meetings = scraper.scrape_all_meetings([], calendar_sources=["arrangementer_sa"])
+
+    assert [m["title"] for m in meetings] == ["Kalender"]
+    assert len(created) == 1
+    assert created[0].shutdown_calls == [True]
@@ -0,0 +1,110 @@
+"""Tests for den valgfrie HTTP-cachen for møteplan-sider (uten nettverk)."""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import Dict, List, Optional
+
+import pytest
+import requests
+
+from politikk_moter import http_cache
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, content: bytes = b"", headers: Optional[Dict[str, str]] = None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code}")
+
+
+class _FakeSession:
+    def __init__(self, responses: List[_FakeResponse]):
+        self.responses = list(responses)
+        self.calls: List[Dict[str, str]] = []
+
+    def get(self, url: str, timeout: float = 0, headers: Optional[Dict[str, str]] = None) -> _FakeResponse:
+        self.calls.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+URL = "https://innsyn.onacos.no/eigersund/mote/wfinnsyn.ashx?response=moteplan&"
+
+
+def test_without_cache_env_every_call_hits_network(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(http_cache.HTTP_CACHE_ENV, raising=False)
+    session = _FakeSession([_FakeResponse(200, b"a"), _FakeResponse(200, b"b")])
+
+    assert http_cache.cached_get_content(URL, session=session) == b"a"
+    assert http_cache.cached_get_content(URL, session=session) == b"b"
+
+
+def test_fresh_entry_skips_network_and_stale_entry_revalidates(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    monkeypatch.setenv(http_cache.HTTP_CACHE_ENV, str(tmp_path / "http.sqlite"))
+    session = _FakeSession([
+        _FakeResponse(200, b"<table>plan</table>", {"ETag": '"v1"', "Last-Modified": "Mon, 13 Oct 2025 08:00:00 GMT"}),
+        _FakeResponse(304),
+    ])
+
+    first = http_cache.cached_get_content(URL, session=session)
+    second = http_cache.cached_get_content(URL, session=session)
+    assert first == second == b"<table>plan</table>"
+    assert len(session.calls) == 1
+
+    revalidated = http_cache.cached_get_content(URL, session=session, force=True)
+    assert revalidated == b"<table>plan</table>"
+    assert session.calls[1] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 13 Oct 2025 08:00:00 GMT",
+    }
+
+
+def test_http_errors_are_not_cached(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    monkeypatch.setenv(http_cache.HTTP_CACHE_ENV, str(tmp_path / "http.sqlite"))
+    session = _FakeSession([_FakeResponse(503), _FakeResponse(200, b"ok")])
+
+    with pytest.raises(requests.HTTPError):
+        http_cache.cached_get_content(URL, session=session)
+    assert http_cache.cached_get_content(URL, session=session) == b"ok"
+
+
+def test_cache_control_and_expires_set_freshness(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    monkeypatch.setenv(http_cache.HTTP_CACHE_ENV, str(tmp_path / "sub" / "http.sqlite"))
+    no_cache_url = URL + "no-cache"
+    no_store_url = URL + "no-store"
+    session = _FakeSession([
+        _FakeResponse(200, b"plan", {"Cache-Control": "private, max-age=0", "ETag": '"v1"'}),
+        _FakeResponse(304, headers={"Cache-Control": "max-age=600"}),
+        _FakeResponse(200, b"a", {"Cache-Control": "no-store"}),
+        _FakeResponse(200, b"b", {"Expires": "0"}),
+    ])
+
+    assert http_cache.cached_get_content(no_cache_url, session=session) == b"plan"
+    # max-age=0 tvinger revalidering; 304 med max-age=600 gjør oppføringen fersk igjen
+    assert http_cache.cached_get_content(no_cache_url, session=session) == b"plan"
+    assert http_cache.cached_get_content(no_cache_url, session=session) == b"plan"
+    assert session.calls[1] == {"If-None-Match": '"v1"'}
+
+    # no-store lagres ikke, så neste kall går til nettet igjen
+    assert http_cache.cached_get_content(no_store_url, session=session) == b"a"
+    assert http_cache.cached_get_content(no_store_url, session=session) == b"b"
+    assert len(session.calls) == 4
+
+
+def test_cache_write_errors_still_return_the_downloaded_body(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    monkeypatch.setenv(http_cache.HTTP_CACHE_ENV, str(tmp_path / "http.sqlite"))
+
+    def locked(*_args, **_kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(http_cache._ResponseCache, "put", locked)  # pylint: disable=protected-access
+    session = _FakeSession([_FakeResponse(200, b"plan"), _FakeResponse(200, b"plan")])
+
+    assert http_cache.cached_get_content(URL, session=session) == b"plan"
+    # Ingenting ble lagret, så neste kall går til nettet igjen
+    assert http_cache.cached_get_content(URL, session=session) == b"plan"
+    assert len(session.calls) == 2
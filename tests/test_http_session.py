@@ -0,0 +1,34 @@
+"""Tests for den delte HTTP-sessionen som brukes av hjelpeskriptene."""
+
+from __future__ import annotations
+
+import requests
+
+from politikk_moter import http_session
+
+
+def test_get_session_is_shared_and_retries_gateway_errors() -> None:
+    session = http_session.get_session()
+    assert http_session.get_session() is session
+
+    retry = session.get_adapter("https://innsyn.onacos.no/").max_retries
+    assert retry.total == 3
+    assert set(retry.status_forcelist) == {502, 503, 504}
+    # Siste svar returneres i stedet for RetryError, slik at status_code kan sjekkes
+    assert retry.raise_on_status is False
+    assert session.headers["User-Agent"] == http_session.DEFAULT_USER_AGENT
+
+
+def test_make_session_without_retries() -> None:
+    session = http_session.make_session(pool_size=4, retries=0)
+    assert session.get_adapter("http://example.com/").max_retries.total == 0
+    assert session is not http_session.get_session()
+
+
+def test_header_charset_ignores_requests_latin1_default() -> None:
+    response = requests.Response()
+    response.headers["Content-Type"] = "text/html"
+    assert http_session.header_charset(response) is None
+
+    response.headers["Content-Type"] = 'text/html; charset="UTF-8"'
+    assert http_session.header_charset(response) == "UTF-8"
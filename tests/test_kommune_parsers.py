@@ -180,6 +180,22 @@ def test_onacos_parser_rolls_year_over(monkeypatch: pytest.MonkeyPatch) -> None:
     assert "2026-02-03" in dates
 
 
+def test_onacos_parser_multi_day_link_shares_url(monkeypatch: pytest.MonkeyPatch) -> None:
+    parser = MoteParser()
+    html = (
+        "<table><tr><th>Utvalg</th><th>Okt</th></tr>"
+        "<tr><td>Formannskapet</td><td><a href='/motekalender/fsk'>3, 17</a></td></tr></table>"
+    )
+    monkeypatch.setattr(parser.session, "get", lambda *_args, **_kwargs: DummyResponse(html))
+
+    meetings = parser.parse_onacos_site("https://innsynpluss.onacos.no/kommune/", "Test kommune")
+
+    assert [m["date"][5:] for m in meetings] == ["10-03", "10-17"]
+    assert {(m["url"], m["raw_text"]) for m in meetings} == {
+        ("https://innsynpluss.onacos.no/motekalender/fsk", "3, 17")
+    }
+
+
 def test_eigersund_parser_reads_table_and_details(monkeypatch: pytest.MonkeyPatch) -> None:
     table_html = load_fixture("eigersund_table.html")
     detail_html = load_fixture("eigersund_detail.html")
@@ -216,6 +232,88 @@ def test_eigersund_parser_reads_table_and_details(monkeypatch: pytest.MonkeyPatc
     assert meetings[0]["date"].startswith(str(target_year))
 
 
+def test_eigersund_parser_skips_detail_pages_outside_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    table_html = load_fixture("eigersund_table.html")
+    requested_urls: List[str] = []
+
+    class FakeSession:
+        def get(self, url: str, *_args, **_kwargs) -> DummyResponse:
+            requested_urls.append(url)
+            return DummyResponse("")
+
+    monkeypatch.setattr(eigersund_parser.requests, "get", lambda *_a, **_k: DummyResponse(table_html))
+    monkeypatch.setattr(eigersund_parser.requests, "Session", FakeSession)
+    monkeypatch.setattr(eigersund_parser, "_DETAILS_CACHE", {})
+
+    meetings = eigersund_parser.parse_eigersund_meetings(
+        "https://innsyn.onacos.no/eigersund/mote/",
+        EIGERSUND_NAME,
+        year=datetime.now().year - 1,
+        days_ahead=10,
+    )
+    assert meetings == []
+    assert requested_urls == [], "Møter utenfor vinduet skal ikke hente detaljsider"
+
+
+class _StreamingResponse:
+    def __init__(self, body: bytes, content_type: str, chunk: int = 16):
+        self.body = body
+        self.headers = {"content-type": content_type}
+        self.chunk = chunk
+        self.chunks_read = 0
+
+    def raise_for_status(self) -> None:
+        return None
+
+    @property
+    def content(self) -> bytes:
+        return self.body
+
+    def iter_content(self, _size: int):
+        for start in range(0, len(self.body), self.chunk):
+            self.chunks_read += 1
+            yield self.body[start:start + self.chunk]
+
+    def close(self) -> None:
+        return None
+
+
+def test_fetch_moteplan_table_streams_until_table_is_parsed(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("MOTEPLAN_HTTP_CACHE", raising=False)
+    html = (
+        "<html><body><table><tr><td>Navigasjon</td></tr></table>"
+        "<table><caption>Møteplan 2025</caption><tr><td>Formannskapet</td><td>5</td></tr></table>"
+        + "<p>fyll</p>" * 200
+        + "</body></html>"
+    )
+    response = _StreamingResponse(html.encode("utf-8"), "text/html; charset=utf-8")
+
+    class FakeSession:
+        def get(self, *_args, **kwargs) -> _StreamingResponse:
+            assert kwargs.get("stream") is True
+            return response
+
+    table, _tree = eigersund_parser.fetch_moteplan_table("https://x/", session=FakeSession())
+
+    assert table.findtext("caption") == "Møteplan 2025"
+    assert response.chunks_read * response.chunk < len(response.body), "Resten av siden skal ikke lastes ned"
+
+
+def test_fetch_moteplan_table_without_charset_falls_back_to_first_table(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("MOTEPLAN_HTTP_CACHE", raising=False)
+    html = "<html><body><table><tr><td>Rådet</td></tr></table><table><tr><td>B</td></tr></table></body></html>"
+    response = _StreamingResponse(html.encode("utf-8"), "text/html")
+
+    class FakeSession:
+        def get(self, *_args, **_kwargs) -> _StreamingResponse:
+            return response
+
+    table, _tree = eigersund_parser.fetch_moteplan_table("https://x/", session=FakeSession())
+
+    assert table.text_content() == "Rådet"
+    assert response.chunks_read == 0
+
+
 def test_elements_parser_extracts_bc_cards() -> None:
     parser = PlaywrightMoteParser()
     html = load_fixture("elements_sample.html")
@@ -226,3 +324,140 @@ def test_elements_parser_extracts_bc_cards() -> None:
     assert meetings[0]["title"] == "Fylkesting"
     assert meetings[0]["kommune"] == ELEMENTS_NAME
     assert meetings[0]["date"].startswith("2025-")
+
+
+def test_acos_parser_extracts_overlapping_elements_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    parser = MoteParser()
+    html = "<div class='moteresultat'><b>Formannskapet</b> 21.10.2025 kl. 10:00</div>"
+    monkeypatch.setattr(parser.session, "get", lambda *_args, **_kwargs: DummyResponse(html))
+    visited = []
+    original = parser._extract_meeting_from_element
+
+    def recording_extract(element, kommune_name):
+        visited.append(element)
+        return original(element, kommune_name)
+
+    monkeypatch.setattr(parser, "_extract_meeting_from_element", recording_extract)
+
+    meetings = parser.parse_acos_site("https://example.com", "Test kommune")
+
+    assert [(m["title"], m["date"], m["time"]) for m in meetings] == [("Formannskapet", "2025-10-21", "10:00")]
+    assert len(visited) == len({id(element) for element in visited}) == 1
+
+
+def test_acos_parser_single_pass_ignores_comment_and_script_dates(monkeypatch: pytest.MonkeyPatch) -> None:
+    parser = MoteParser()
+    html = (
+        "<div class='MØTE-kort'><b>Formannskapet</b> 21.10.2025</div>"
+        "<div class='annet'><p>Kommunestyret 22.10.2025</p><!-- 23.10.2025 -->"
+        "<script>var d = '24.10.2025';</script></div>"
+    )
+    monkeypatch.setattr(parser.session, "get", lambda *_args, **_kwargs: DummyResponse(html))
+
+    meetings = parser.parse_acos_site("https://example.com", "Test kommune")
+
+    assert sorted(m["date"] for m in meetings) == ["2025-10-21", "2025-10-22"]
+
+
+def test_extract_meeting_prefers_own_text_and_falls_back_to_child_attributes() -> None:
+    parser = MoteParser()
+    own = BeautifulSoup(
+        "<div><b>Formannskapet</b> 21.10.2025 kl. 10:00<span title='22.10.2025 kl. 12:00'>i</span></div>",
+        "html.parser",
+    ).div
+    child = BeautifulSoup(
+        "<div><b>Kommunestyret</b><span aria-label='23.10.2025 kl. 18:00'>Detaljer</span></div>",
+        "html.parser",
+    ).div
+
+    assert (parser._extract_meeting_from_element(own, "K") or {}).get("date") == "2025-10-21"
+    meeting = parser._extract_meeting_from_element(child, "K") or {}
+    assert (meeting.get("title"), meeting.get("date"), meeting.get("time")) == ("Kommunestyret", "2025-10-23", "18:00")
+
+
+def test_custom_parser_skips_elements_without_date(monkeypatch: pytest.MonkeyPatch) -> None:
+    parser = MoteParser()
+    html = (
+        "<div class='layout'><p>Meny</p><p>Kontakt</p></div>"
+        "<div><span title='Møte 21.10.2025 kl. 10:00'>Formannskapet</span></div>"
+    )
+    monkeypatch.setattr(parser.session, "get", lambda *_args, **_kwargs: DummyResponse(html))
+    visited = []
+    original = parser._extract_meeting_from_element
+
+    def recording_extract(element, kommune_name):
+        visited.append(element.name)
+        return original(element, kommune_name)
+
+    monkeypatch.setattr(parser, "_extract_meeting_from_element", recording_extract)
+
+    meetings = parser.parse_custom_site("https://example.com", "Test kommune")
+
+    assert [(m["title"], m["date"], m["time"]) for m in meetings] == [("Formannskapet", "2025-10-21", "10:00")]
+    assert "p" not in visited
+
+
+@pytest.mark.parametrize("fixture, method", [
+    ("custom_sample.html", "parse_custom_site"),
+    ("acos_sample.html", "parse_acos_site"),
+])
+def test_requests_parsers_match_builtin_html_parser(monkeypatch: pytest.MonkeyPatch, fixture: str, method: str) -> None:
+    parser = MoteParser()
+    html = load_fixture(fixture)
+    monkeypatch.setattr(parser.session, "get", lambda *_args, **_kwargs: DummyResponse(html))
+
+    with_default = getattr(parser, method)("https://example.com", "Test kommune")
+    monkeypatch.setattr(scraper, "HTML_PARSER", "html.parser")
+    with_builtin = getattr(parser, method)("https://example.com", "Test kommune")
+
+    assert with_default == with_builtin
+
+
+def test_elements_parser_class_and_href_filters_ignore_case(monkeypatch: pytest.MonkeyPatch) -> None:
+    parser = MoteParser()
+    html = (
+        "<table><tr class='MØTE-rad'><td><b>Formannskapet</b></td><td>21.10.2025 kl. 10:00</td></tr></table>"
+        "<a href='/Meeting/7'><b>Kommunestyret</b> 23.10.2025 kl. 18:00</a>"
+        "<div class='annet'><b>Ikke med</b> 24.10.2025</div>"
+    )
+    monkeypatch.setattr(parser.session, "get", lambda *_args, **_kwargs: DummyResponse(html))
+
+    meetings = parser.parse_elements_site("https://example.com", "Test kommune")
+
+    assert [(m["title"], m["date"]) for m in meetings] == [
+        ("Formannskapet", "2025-10-21"),
+        ("Kommunestyret", "2025-10-23"),
+    ]
+
+
+def test_element_text_matches_beautifulsoup_get_text() -> None:
+    import lxml.html
+
+    html = "<td><a> Formann<b>skapet</b></a> <!-- skjult --><span>(FSK)</span><script>var x=1</script>\n</td>"
+    element = lxml.html.fragment_fromstring(html)
+    cell = BeautifulSoup(html, "html.parser").td
+
+    assert eigersund_parser.element_text(element) == cell.get_text(strip=True)
+    assert eigersund_parser.element_text(element, " ") == cell.get_text(" ", strip=True)
+
+
+def test_opengov_parser_gives_same_result_with_http_cache(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    html = load_fixture("sandnes_sample.html")
+    url = "https://opengov.360online.com/Meetings/SANDNESKOMMUNE"
+
+    class HeaderlessResponse(DummyResponse):
+        status_code = 200
+        headers = {"Content-Type": "text/html"}
+
+    def parse() -> List[dict]:
+        parser = MoteParser()
+        monkeypatch.setattr(parser.session, "get", lambda *_a, **_k: HeaderlessResponse(html))
+        return parser.parse_custom_site(url, "Sandnes kommune")
+
+    monkeypatch.delenv("MOTEPLAN_HTTP_CACHE", raising=False)
+    uncached = parse()
+    monkeypatch.setenv("MOTEPLAN_HTTP_CACHE", str(tmp_path / "http.sqlite"))
+    first_cached = parse()
+    second_cached = parse()
+
+    assert uncached and uncached == first_cached == second_cached
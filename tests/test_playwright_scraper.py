@@ -0,0 +1,313 @@
+# pylint: disable=import-error
+
+import asyncio
+
+import pytest
+
+playwright_scraper = pytest.importorskip("politikk_moter.playwright_scraper")
+PlaywrightMoteParser = playwright_scraper.PlaywrightMoteParser
+
+
+class _FakeDetailPage:
+    def __init__(self, context: "_FakeDetailContext"):
+        self.context = context
+        self.url = ""
+
+    async def goto(self, url, **_kwargs):
+        self.url = url
+        self.context.active += 1
+        self.context.max_active = max(self.context.max_active, self.context.active)
+        await asyncio.sleep(0.01)
+
+    async def query_selector(self, _selector):
+        return object()
+
+    async def wait_for_timeout(self, _ms):  # pragma: no cover - time-tag finnes alltid
+        self.context.waits += 1
+
+    async def content(self):
+        meeting_id = self.url.rsplit("=", 1)[-1]
+        return f"<html><body><time datetime='2025-10-01T1{meeting_id}:30'></time></body></html>"
+
+    async def close(self):
+        self.context.active -= 1
+
+
+class _FakeDetailContext:
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.waits = 0
+
+    async def new_page(self):
+        return _FakeDetailPage(self)
+
+
+def test_elements_detail_pages_are_fetched_concurrently_with_limit():
+    parser = PlaywrightMoteParser()
+    parser.context = _FakeDetailContext()
+    meetings = [{"title": f"Møte {idx}", "time": "TBD", "href": f"/DmbMeeting?id={idx}"} for idx in range(8)]
+
+    async def run():
+        semaphore = asyncio.Semaphore(playwright_scraper.DETAIL_CONCURRENCY)
+        await asyncio.gather(*(
+            parser._fill_time_from_detail(m, "https://example.com/Dmb", semaphore)  # pylint: disable=protected-access
+            for m in meetings
+        ))
+
+    asyncio.run(run())
+
+    assert [m["time"] for m in meetings] == [f"1{idx}:30" for idx in range(8)]
+    assert 1 < parser.context.max_active <= playwright_scraper.DETAIL_CONCURRENCY
+    assert parser.context.waits == 0
+
+
+class _FakeRoute:
+    def __init__(self, resource_type: str):
+        self.request = type("Request", (), {"resource_type": resource_type})()
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = "abort"
+
+    async def continue_(self):
+        self.outcome = "continue"
+
+
+@pytest.mark.parametrize("resource_type, outcome", [
+    ("image", "abort"),
+    ("font", "abort"),
+    ("media", "abort"),
+    ("document", "continue"),
+    ("script", "continue"),
+    ("xhr", "continue"),
+])
+def test_route_blocks_heavy_resources(resource_type, outcome):
+    route = _FakeRoute(resource_type)
+    asyncio.run(PlaywrightMoteParser._route_request(route))  # pylint: disable=protected-access
+    assert route.outcome == outcome
+
+
+class _FakeMainPage:
+    def __init__(self):
+        self.visited = []
+        self.wait_until = []
+        self.selector_waits = []
+        self.fixed_waits = 0
+        self.closed = False
+
+    async def goto(self, url, wait_until=None, **_kwargs):
+        self.visited.append(url)
+        self.wait_until.append(wait_until)
+
+    async def wait_for_selector(self, selector, **kwargs):
+        self.selector_waits.append((selector, kwargs.get("state")))
+
+    async def wait_for_timeout(self, _ms):
+        self.fixed_waits += 1
+
+    async def close(self):
+        self.closed = True
+
+    async def content(self):
+        return "<ul><li><b>Formannskapet</b> 21.10.2025 kl. 10:00</li></ul>"
+
+    def is_closed(self):
+        return self.closed
+
+
+class _FakeMainContext:
+    def __init__(self):
+        self.pages = []
+        self.cookie_clears = 0
+
+    async def new_page(self):
+        page = _FakeMainPage()
+        self.pages.append(page)
+        return page
+
+    async def clear_cookies(self):
+        self.cookie_clears += 1
+
+
+def test_main_page_is_reused_between_sites():
+    parser = PlaywrightMoteParser()
+    parser.context = _FakeMainContext()
+
+    async def run():
+        first = await parser.scrape_javascript_site("https://a.example/moter", "A kommune")
+        second = await parser.scrape_javascript_site("https://b.example/moter", "B kommune")
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first and second
+    assert len(parser.context.pages) == 1
+    assert parser.context.pages[0].visited == ["https://a.example/moter", "https://b.example/moter"]
+    assert parser.context.cookie_clears == 1
+
+
+def test_sites_wait_for_content_selector_instead_of_fixed_sleep():
+    parser = PlaywrightMoteParser()
+    parser.context = _FakeMainContext()
+
+    async def run():
+        await parser.scrape_javascript_site("https://a.example/moter", "A kommune")
+        await parser.scrape_onacos_site("https://b.example/moter", "B kommune")
+
+    asyncio.run(run())
+
+    page = parser.context.pages[0]
+    assert page.wait_until == ["domcontentloaded", "domcontentloaded"]
+    assert page.selector_waits == [(playwright_scraper.CONTENT_SELECTOR, "attached")] * 2
+    assert page.fixed_waits == 0
+
+
+class _FakeKommuneParser:
+    active = 0
+    max_active = 0
+    spawned = []
+
+    def __init__(self):
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc):
+        return None
+
+    async def spawn_worker(self):
+        worker = _FakeKommuneParser()
+        _FakeKommuneParser.spawned.append(worker)
+        return worker
+
+    async def close_context(self):
+        self.closed = True
+
+    async def scrape_javascript_site(self, url, kommune_name):
+        cls = _FakeKommuneParser
+        cls.active += 1
+        cls.max_active = max(cls.max_active, cls.active)
+        await asyncio.sleep(0.01)
+        cls.active -= 1
+        return [{"title": kommune_name, "date": "2025-10-01", "url": url}]
+
+
+def test_kommunes_are_scraped_concurrently_with_limit(monkeypatch):
+    monkeypatch.setattr(playwright_scraper, "PlaywrightMoteParser", _FakeKommuneParser)
+    monkeypatch.setattr(playwright_scraper, "KOMMUNE_CONCURRENCY", 3)
+    monkeypatch.setattr(_FakeKommuneParser, "spawned", [])
+    monkeypatch.setattr(_FakeKommuneParser, "max_active", 0)
+    configs = [{"name": f"K{i}", "url": f"https://k{i}.example"} for i in range(8)]
+
+    meetings = asyncio.run(playwright_scraper.scrape_with_playwright(configs))
+
+    assert [m["title"] for m in meetings] == [f"K{i}" for i in range(8)]
+    assert _FakeKommuneParser.max_active == 3
+    assert len(_FakeKommuneParser.spawned) == 2
+    assert all(worker.closed for worker in _FakeKommuneParser.spawned)
+
+
+def test_page_without_dates_skips_soup(monkeypatch):
+    class _EmptyPage(_FakeMainPage):
+        async def content(self):
+            return "<html><body><p>Ingen møter er publisert</p></body></html>"
+
+    class _EmptyContext(_FakeMainContext):
+        async def new_page(self):
+            return _EmptyPage()
+
+    soups = []
+    monkeypatch.setattr(playwright_scraper, "BeautifulSoup", lambda *args, **_kwargs: soups.append(args))
+    parser = PlaywrightMoteParser()
+    parser.context = _EmptyContext()
+
+    assert asyncio.run(parser.scrape_javascript_site("https://a.example/moter", "A kommune")) == []
+    assert not soups
+
+
+def test_scrape_with_playwright_reuses_given_parser(monkeypatch):
+    def _no_new_parser():
+        raise AssertionError("ny nettleser skal ikke startes")
+
+    monkeypatch.setattr(playwright_scraper, "PlaywrightMoteParser", _no_new_parser)
+    monkeypatch.setattr(playwright_scraper, "KOMMUNE_CONCURRENCY", 1)
+    parser = _FakeKommuneParser()
+
+    meetings = asyncio.run(playwright_scraper.scrape_with_playwright(
+        [{"name": "K0", "url": "https://k0.example"}],
+        parser=parser,
+    ))
+
+    assert [m["title"] for m in meetings] == ["K0"]
+    assert not parser.closed
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.context_kwargs = None
+
+    async def new_context(self, **kwargs):
+        self.context_kwargs = kwargs
+        return _FakeRouteContext()
+
+    async def close(self):
+        return None
+
+
+class _FakeRouteContext(_FakeMainContext):
+    async def route(self, _pattern, _handler):
+        return None
+
+    async def close(self):
+        return None
+
+
+class _FakePlaywright:
+    def __init__(self):
+        self.browser = _FakeBrowser()
+        self.launch_kwargs = None
+        self.chromium = self
+
+    async def start(self):
+        return self
+
+    async def launch(self, **kwargs):
+        self.launch_kwargs = kwargs
+        return self.browser
+
+    async def stop(self):
+        return None
+
+
+def test_browser_launch_uses_lean_chromium_flags(monkeypatch):
+    monkeypatch.delenv("PLAYWRIGHT_NO_SANDBOX", raising=False)
+    fake = _FakePlaywright()
+    monkeypatch.setattr(playwright_scraper, "async_playwright", lambda: fake)
+
+    async def run():
+        async with PlaywrightMoteParser():
+            pass
+
+    asyncio.run(run())
+
+    assert fake.launch_kwargs["headless"] is True
+    assert fake.launch_kwargs["chromium_sandbox"] is True
+    assert "--disable-gpu" in fake.launch_kwargs["args"]
+    assert "--single-process" not in fake.launch_kwargs["args"]
+    assert fake.browser.context_kwargs["locale"] == "nb-NO"
+
+
+def test_browser_sandbox_is_disabled_only_via_env(monkeypatch):
+    monkeypatch.setenv("PLAYWRIGHT_NO_SANDBOX", "1")
+    fake = _FakePlaywright()
+    monkeypatch.setattr(playwright_scraper, "async_playwright", lambda: fake)
+
+    async def run():
+        async with PlaywrightMoteParser():
+            pass
+
+    asyncio.run(run())
+
+    assert fake.launch_kwargs["chromium_sandbox"] is False
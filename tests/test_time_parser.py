@@ -1,5 +1,7 @@
 # pylint: disable=import-error
 
+from datetime import datetime
+
 import pytest
 from bs4 import BeautifulSoup
 
@@ -117,4 +119,222 @@ def test_elements_meeting_href_turns_into_detail_url():
 
     assert meetings[0]["url"].startswith("https://prod01.elementscloud.no/")
     assert meetings[0]["url"].endswith("id=42")
-    assert meetings[1]["url"] == base
\ No newline at end of file
+    assert meetings[1]["url"] == base
+
+def test_bc_content_list_parser_matches_with_module_html_parser():
+    parser = _TestablePlaywrightParser()
+    base_url = "https://www.time.kommune.no/politikk/mote-og-saksdokument/moter-og-saksdokument/"
+
+    reference = parser.extract_bc_meetings(BeautifulSoup(TIME_SAMPLE_HTML, "html.parser"), "Time kommune", base_url)
+    fast = parser.extract_bc_meetings(
+        BeautifulSoup(TIME_SAMPLE_HTML, playwright_scraper.HTML_PARSER),
+        "Time kommune",
+        base_url,
+    )
+
+    assert fast == reference
+
+
+def test_generic_element_extraction_reads_date_time_and_location():
+    parser = PlaywrightMoteParser()
+    soup = BeautifulSoup(
+        "<ul>"
+        "<li><strong>Formannskapet</strong> 21.10.2025 kl. 09.30 i Kommunestyresalen</li>"
+        "<li><strong>Søk etter møter</strong> 22.10.2025</li>"
+        "</ul>",
+        playwright_scraper.HTML_PARSER,
+    )
+
+    meetings = parser._extract_meetings_from_soup(soup, "Test kommune")  # pylint: disable=protected-access
+
+    assert [m["title"] for m in meetings] == ["Formannskapet"]
+    assert meetings[0]["date"] == "2025-10-21"
+    assert meetings[0]["time"] == "09:30"
+    assert meetings[0]["location"] == "Kommunestyresalen"
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Møte 21. oktober 2025", "2025-10-21"),
+    ("30.09.25", "2025-09-30"),
+    ("31.02.2025 eller 1.3.2025", None),
+    ("ingen dato", None),
+])
+def test_parse_date_string_prefers_numeric_dates(text, expected):
+    parsed = PlaywrightMoteParser()._parse_date_string(text)  # pylint: disable=protected-access
+    assert (parsed.strftime("%Y-%m-%d") if parsed else None) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("kl. 09.30 og 12:00", "12:00"),
+    ("Kl 9", "09:00"),
+    ("KL. 8.15", "08:15"),
+    ("uten klokkeslett", None),
+])
+def test_extract_time_prefers_colon_format(text, expected):
+    assert PlaywrightMoteParser()._extract_time_from_text(text) == expected  # pylint: disable=protected-access
+
+
+def test_elements_date_parser_falls_through_invalid_formats():
+    found = playwright_scraper._find_date(  # pylint: disable=protected-access
+        playwright_scraper._DATE_ANY_RE,  # pylint: disable=protected-access
+        "31.02.2025 / 1. mars 2025",
+        playwright_scraper._DATE_ANY_PRIORITY,  # pylint: disable=protected-access
+    )
+    assert found is not None and found.strftime("%Y-%m-%d") == "2025-03-01"
+
+
+def test_generic_fallback_prefers_table_rows_over_later_elements():
+    parser = PlaywrightMoteParser()
+    soup = BeautifulSoup(
+        "<h3>Kommunestyret 05.11.2025</h3>"
+        "<div class='moteboks'><b>Kommunestyret</b> 05.11.2025 kl. 18:00</div>"
+        "<div class='annet'><b>Ikke et møte</b> 06.11.2025</div>"
+        "<table><tr><td><b>Kommunestyret</b></td><td>05.11.2025 kl. 17:00</td></tr></table>",
+        playwright_scraper.HTML_PARSER,
+    )
+
+    meetings = parser._extract_meetings_from_soup(soup, "Test kommune")  # pylint: disable=protected-access
+
+    assert [(m["title"], m["time"]) for m in meetings] == [("Kommunestyret", "17:00")]
+
+
+@pytest.mark.parametrize("html, expected", [
+    ("<html><body><time datetime='2025-10-01T18:15+02:00'>1. okt</time> 09:00</body></html>", "18:15"),
+    ("<html><head><meta property='event:start' content='2025-10-01T17:45'></head><body></body></html>", "17:45"),
+    ("<html><body><script>var t = '23:59';</script><p>Møtet starter kl. 10.30</p></body></html>", "10:30"),
+    ("<html><body><p>Ingen tid oppgitt</p></body></html>", None),
+])
+def test_time_from_detail_html(html, expected):
+    assert PlaywrightMoteParser()._time_from_detail_html(html) == expected  # pylint: disable=protected-access
+
+
+def test_month_header_table_is_parsed_with_shared_month_table():
+    parser = PlaywrightMoteParser()
+    soup = BeautifulSoup(
+        "<table>"
+        "<tr><th>Utvalg</th><th>Jan.</th><th>Februar</th><th>Sept</th></tr>"
+        "<tr><td>Formannskapet</td><td><a>14</a></td><td>3, 24</td><td></td></tr>"
+        "</table>",
+        playwright_scraper.HTML_PARSER,
+    )
+
+    meetings = parser._extract_meetings_from_soup(soup, "Test kommune")  # pylint: disable=protected-access
+
+    assert [m["date"][5:] for m in meetings] == ["01-14", "02-03", "02-24"]
+
+
+def test_generic_fallback_dedupes_on_normalized_title():
+    parser = PlaywrightMoteParser()
+    soup = BeautifulSoup(
+        "<table>"
+        "<tr><td><b>Kommunestyret</b></td><td>05.11.2025 kl. 17:00</td></tr>"
+        "<tr><td><b>kommunestyret </b></td><td>05.11.2025 kl. 17:00</td></tr>"
+        "<tr><td><b>Formannskapet</b></td><td>05.11.2025 kl. 16:00</td></tr>"
+        "</table>",
+        playwright_scraper.HTML_PARSER,
+    )
+
+    meetings = parser._extract_meetings_from_soup(soup, "Test kommune")  # pylint: disable=protected-access
+
+    assert [m["title"] for m in meetings] == ["Kommunestyret", "Formannskapet"]
+
+
+def test_element_extraction_reads_descendant_attributes():
+    parser = PlaywrightMoteParser()
+    soup = BeautifulSoup(
+        "<div><b>Formannskapet</b><span>ingen dato her</span>"
+        "<span aria-label='Møte 12.03.2026 kl. 09:30'></span></div>",
+        playwright_scraper.HTML_PARSER,
+    )
+
+    meeting = parser._extract_meeting_from_element(soup.div, "Test kommune")  # pylint: disable=protected-access
+
+    assert (meeting.title, meeting.date, meeting.time) == ("Formannskapet", "2026-03-12", "09:30")
+
+
+def test_element_extraction_prefers_attribute_strings_over_body_text():
+    parser = PlaywrightMoteParser()
+    soup = BeautifulSoup(
+        "<div><b>Formannskapet</b> Publisert 01.02.2026 kl. 08:00"
+        "<span title='Møtedato 12.03.2026 kl. 09:30'></span></div>",
+        playwright_scraper.HTML_PARSER,
+    )
+
+    meeting = parser._extract_meeting_from_element(soup.div, "Test kommune")  # pylint: disable=protected-access
+
+    assert (meeting.date, meeting.time) == ("2026-03-12", "09:30")
+
+
+@pytest.mark.parametrize("text", ["1760000000", "1760000000000"])
+def test_epoch_dates_are_read_in_oslo_time(text):
+    found = playwright_scraper._find_date(  # pylint: disable=protected-access
+        playwright_scraper._DATE_ANY_RE,  # pylint: disable=protected-access
+        text,
+        playwright_scraper._DATE_ANY_PRIORITY,  # pylint: disable=protected-access
+    )
+
+    assert found == datetime(2025, 10, 9, 10, 53, 20)
+
+
+@pytest.mark.parametrize("html, has_hint", [
+    ("<p>Ingen møter er publisert</p>", False),
+    ("<li>Formannskapet 21.10.2025</li>", True),
+    ("<div data-start='1760000000000'></div>", True),
+    ("<th>Sept</th>", True),
+    ("<p>Møte 5. november 2025</p>", True),
+])
+def test_raw_html_date_hint(html, has_hint):
+    assert bool(playwright_scraper._DATE_HINT_RE.search(html)) is has_hint  # pylint: disable=protected-access
+
+
+@pytest.mark.parametrize("html", [
+    "<ul><li><strong>Formannskapet</strong> 21.10.2025 kl. 09.30 i Kommunestyresalen</li>"
+    "<li><strong>Søk etter møter</strong> 22.10.2025</li></ul>",
+    "<h3>Kommunestyret 05.11.2025</h3>"
+    "<div class='moteboks'><b>Kommunestyret</b> 05.11.2025 kl. 18:00</div>"
+    "<div class='annet'><b>Ikke et møte</b> 06.11.2025</div>"
+    "<table><tr><td><b>Kommunestyret</b></td><td>05.11.2025 kl. 17:00</td></tr></table>",
+    "<div class='meeting-row' title='Møtedato 12.03.2026'><span aria-label='kl. 09:30'>"
+    "Plan- og bygningsutvalget</span><script>var d = '01.01.2020';</script></div>",
+])
+def test_generic_fallback_lxml_walk_matches_bs4(html, monkeypatch):
+    if playwright_scraper.lxml_html is None:
+        pytest.skip("lxml ikke installert")
+    parser = PlaywrightMoteParser()
+    soup = BeautifulSoup(html, playwright_scraper.HTML_PARSER)
+
+    via_lxml = parser._extract_meetings_from_soup(soup, "Test kommune", html)  # pylint: disable=protected-access
+    monkeypatch.setenv(playwright_scraper.BS4_FALLBACK_ENV, "1")
+    via_bs4 = parser._extract_meetings_from_soup(soup, "Test kommune", html)  # pylint: disable=protected-access
+
+    assert via_lxml
+    assert via_lxml == via_bs4
+
+
+@pytest.mark.parametrize("heading, expected", [
+    ("Kommunestyret 05.11.2025 kl. 18:00", "Kommunestyret"),
+    ("Plan- og   bygningsutvalget kl.18:00, 05.11.2025", "Plan- og bygningsutvalget"),
+    ("Eldrerådet\n 05.11.2025\nRådhuset", "Eldrerådet Rådhuset"),
+])
+def test_title_is_cut_at_first_date_or_time(heading, expected):
+    parser = PlaywrightMoteParser()
+    soup = BeautifulSoup(f"<div><h3>{heading}</h3> 05.11.2025</div>", playwright_scraper.HTML_PARSER)
+
+    meeting = parser._extract_meeting_from_element(soup.div, "Test kommune")  # pylint: disable=protected-access
+
+    assert meeting.title == expected
+
+
+@pytest.mark.parametrize("href, expected", [
+    ("/publikum/1/DmbMeeting?id=7", "https://prod01.elementscloud.no/publikum/1/DmbMeeting?id=7"),
+    ("DmbMeeting?id=7", "https://prod01.elementscloud.no/publikum/1/DmbMeeting?id=7"),
+    ("https://annen.example/mote/7", "https://annen.example/mote/7"),
+])
+def test_elements_urls_only_join_relative_hrefs(href, expected):
+    meetings = [{"title": "Møte", "href": href}]
+
+    PlaywrightMoteParser()._attach_elements_urls(  # pylint: disable=protected-access
+        meetings, "https://prod01.elementscloud.no/publikum/1/Dmb"
+    )
+
+    assert meetings[0]["url"] == expected